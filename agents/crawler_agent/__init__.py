@@ -1,7 +1,22 @@
-"""크롤러 에이전트 패키지."""
+"""크롤러 에이전트 패키지.
+
+서버 모듈을 임포트할 때 에이전트 구성(ADK, LiteLLM 임포트 포함)이 함께 로드되지 않도록
+공개 이름은 첫 접근 시점에 가져온다.
+"""
 
 from __future__ import annotations
 
-from .crawler_agent import CRAWLER_AGENT, crawl_news
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .crawler_agent import CRAWLER_AGENT, crawl_news
 
 __all__ = ["CRAWLER_AGENT", "crawl_news"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        from . import crawler_agent
+
+        return getattr(crawler_agent, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,21 +8,29 @@ from urllib.parse import urlparse
 
 import httpx
 from google.adk.agents.llm_agent import LlmAgent
-from google.adk.models.lite_llm import LiteLlm
 from google.adk.tools.function_tool import FunctionTool
-from pydantic import ValidationError
+from opentelemetry.trace import Status, StatusCode
 
-from common import NewsDoc
+from common import validate_news_docs
+from common.deadline import cap_timeout, expired
+from common.http_clients import HTTP_CLIENTS
+from common.llm_cache import create_lite_llm
 from common.logger import get_logger
 from common.prompts import CRAWLER_PROMPT
 from common.settings import settings
-from common.telemetry import instrument_langfuse
+from common.telemetry import get_tracer, instrument_langfuse
+from common.usage import current_budget_directive, note_degradation
 
 logger = get_logger(__name__)
 
 NEWS_API_ENDPOINT = "https://newsapi.org/v2/everything"
 DEFAULT_PAGE_SIZE = 20
 MAX_PAGE_SIZE = 100
+NEWS_API_TIMEOUT_SEC = 10.0
+
+# NewsAPI 호출은 공유 커넥션 풀을 재사용하고, 서버 시작 시 미리 연결해 둔다.
+NEWS_API_CLIENT = HTTP_CLIENTS.sync_client("newsapi", timeout=NEWS_API_TIMEOUT_SEC)
+HTTP_CLIENTS.register_warmup("newsapi", NEWS_API_ENDPOINT)
 
 instrument_langfuse()
 
@@ -31,13 +39,15 @@ def crawl_news(
     query: str,
     lookback_hours: int = 24,
     page_size: int = DEFAULT_PAGE_SIZE,
+    published_after: str = "",
 ) -> list[dict[str, Any]]:
     """NewsAPI에서 금융 뉴스를 수집한다.
 
     Args:
         query (str): 검색어 문자열.
         lookback_hours (int): 조회 기간(시간 단위).
-        page_size (int): 페이지당 기사 수.
+        page_size (int): 페이지당 기사 수. 실행 예산이 소진되면 예산 지시의 최대 기사 수로 줄인다.
+        published_after (str): ISO8601 시각. 지정하면 조회 기간 중 이 시각 이후 발행된 기사만 반환한다(증분 수집).
 
     Returns:
         list[dict[str, Any]]: `NewsDoc` 스키마와 호환되는 기사 리스트.
@@ -50,27 +60,44 @@ def crawl_news(
     if not api_key:
         logger.info("NewsAPI key missing; returning empty result")
         return []
+    if expired():
+        logger.info("Request deadline exceeded; returning empty result")
+        return []
 
     logger.info("Crawling news for query=%s, lookback_hours=%s, page_size=%s", query, lookback_hours, page_size)
 
     normalized_page_size = max(1, min(page_size, MAX_PAGE_SIZE))
-    published_after = (datetime.now(UTC) - timedelta(hours=max(1, lookback_hours))).strftime("%Y-%m-%d")
+    directive = current_budget_directive()
+    if directive.max_articles and directive.max_articles < normalized_page_size:
+        note_degradation("crawl", directive, page_size=f"{normalized_page_size}->{directive.max_articles}")
+        normalized_page_size = directive.max_articles
+    window_start = datetime.now(UTC) - timedelta(hours=max(1, lookback_hours))
+    published_from = window_start.strftime("%Y-%m-%d")
+    cutoff = _parse_published_at(published_after) if published_after else None
+    if cutoff is not None:
+        # 증분 기준 시각은 조회 기간을 좁히기만 한다. 러너가 오래 멈춰 기준 시각이 기간보다 이르면 기간 시작을 쓴다.
+        cutoff = max(cutoff, window_start)
+        published_from = cutoff.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%S")
 
     params = {
         "q": query,
-        "from": published_after,
+        "from": published_from,
         "language": "en",
         "sortBy": "relevancy",
         "pageSize": normalized_page_size,
     }
     headers = {"X-Api-Key": api_key}
 
-    try:
-        response = httpx.get(NEWS_API_ENDPOINT, params=params, headers=headers, timeout=10.0)
-        response.raise_for_status()
-    except httpx.HTTPError as exc:
-        logger.info("NewsAPI request failed: %s", exc)
-        return []
+    with get_tracer().start_as_current_span("newsapi.request", attributes={"newsapi.query": query}) as span:
+        try:
+            response = NEWS_API_CLIENT.get(
+                NEWS_API_ENDPOINT, params=params, headers=headers, timeout=cap_timeout(NEWS_API_TIMEOUT_SEC)
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            logger.info("NewsAPI request failed: %s", exc)
+            span.set_status(Status(StatusCode.ERROR, str(exc)))
+            return []
 
     payload = response.json()
     articles = payload.get("articles") or []
@@ -79,24 +106,26 @@ def crawl_news(
         logger.info("No articles found in NewsAPI response")
         return []
 
-    documents: list[dict[str, Any]] = []
-    for article in articles:
-        document = _article_to_document(article)
-        if document is not None:
-            documents.append(document)
+    candidates = [document for article in articles if (document := _article_to_document(article)) is not None]
+    if cutoff is not None:
+        # NewsAPI의 from 필터는 정밀하지 않으므로 이전 실행에서 처리한 기사를 한 번 더 걸러낸다.
+        candidates = [document for document in candidates if document["published_at"] > cutoff]
+    documents, skipped = validate_news_docs(candidates)
+    if skipped:
+        logger.info("Skip articles due to validation error count=%s", skipped)
 
     logger.info("Collected articles count=%s", len(documents))
     return documents
 
 
 def _article_to_document(article: dict[str, Any]) -> dict[str, Any] | None:
-    """NewsAPI 기사 응답을 `NewsDoc` 구조로 변환한다.
+    """NewsAPI 기사 응답을 `NewsDoc` 필드 구조로 변환한다. 스키마 검증은 `crawl_news`에서 일괄 수행한다.
 
     Args:
         article (dict[str, Any]): NewsAPI 기사 응답.
 
     Returns:
-        dict[str, Any] | None: 변환된 기사. 필수 필드가 없으면 None.
+        dict[str, Any] | None: 변환된 기사 후보. 필수 필드가 없으면 None.
     """
     url = article.get("url")
     title = article.get("title")
@@ -112,19 +141,13 @@ def _article_to_document(article: dict[str, Any]) -> dict[str, Any] | None:
         logger.info("Skip article due to invalid published_at url=%s", url)
         return None
 
-    try:
-        document = NewsDoc(
-            url=url,
-            title=title,
-            publisher=publisher,
-            published_at=published_at,
-            readable_text=None,
-        )
-    except ValidationError as exc:
-        logger.info("Skip article due to validation error=%s", exc)
-        return None
-
-    return document.model_dump(mode="json")
+    return {
+        "url": url,
+        "title": title,
+        "publisher": publisher,
+        "published_at": published_at,
+        "readable_text": None,
+    }
 
 
 def _parse_published_at(raw_value: str) -> datetime | None:
@@ -169,7 +192,7 @@ def _extract_publisher(article: dict[str, Any]) -> str | None:
 
 
 CRAWLER_TOOL = FunctionTool(func=crawl_news)
-CRAWLER_MODEL = LiteLlm(model=settings.openai_model, tool_choice="auto")
+CRAWLER_MODEL = create_lite_llm(settings.openai_model, tool_choice="auto")
 
 CRAWLER_AGENT = LlmAgent(
     name="finance_news_crawler_agent",
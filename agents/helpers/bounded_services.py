@@ -0,0 +1,332 @@
+"""메모리 한도가 있는 ADK Runner 서비스 모듈.
+
+ADK 기본 InMemory 세션/아티팩트/메모리 서비스는 요청마다 전체 대화와 대용량 JSON 페이로드를
+무한히 보관한다. 이 모듈의 서비스는 동일한 인터페이스를 유지하면서 LRU/TTL 제거,
+세션별 바이트 상한, 사용량 통계를 제공한다.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any
+
+from google.adk.artifacts import InMemoryArtifactService
+from google.adk.events.event import Event
+from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
+from google.adk.sessions import InMemorySessionService, Session
+from google.genai import types
+from pydantic import PrivateAttr
+
+from agents.helpers.memory_stats import register_memory_stats
+from common.logger import get_logger
+from common.settings import AppSettings
+
+logger = get_logger(__name__)
+
+_SessionKey = tuple[str, str, str]
+
+
+def _estimate_event_bytes(event: Event) -> int:
+    """이벤트의 직렬화 크기를 추정한다.
+
+    Args:
+        event (Event): 크기를 추정할 이벤트.
+
+    Returns:
+        int: 콘텐츠 파트의 텍스트/함수 인자/함수 응답/바이너리 크기 합.
+    """
+    content = event.content
+    if content is None or not content.parts:
+        return 0
+    size = 0
+    for part in content.parts:
+        if part.text:
+            size += len(part.text)
+        if part.function_call is not None:
+            size += len(part.function_call.model_dump_json(exclude_none=True))
+        if part.function_response is not None:
+            size += len(part.function_response.model_dump_json(exclude_none=True))
+        if part.inline_data is not None and part.inline_data.data:
+            size += len(part.inline_data.data)
+    return size
+
+
+def _estimate_part_bytes(part: types.Part) -> int:
+    """아티팩트 파트의 크기를 추정한다.
+
+    Args:
+        part (types.Part): 크기를 추정할 파트.
+
+    Returns:
+        int: 텍스트 또는 바이너리 데이터 크기.
+    """
+    size = len(part.text or "")
+    if part.inline_data is not None and part.inline_data.data:
+        size += len(part.inline_data.data)
+    return size
+
+
+class BoundedInMemorySessionService(InMemorySessionService):
+    """세션 수/수명/세션별 바이트 상한이 있는 메모리 세션 서비스."""
+
+    def __init__(self, *, max_sessions: int, ttl_sec: float, max_session_bytes: int) -> None:
+        """BoundedInMemorySessionService 인스턴스를 초기화한다.
+
+        Args:
+            max_sessions (int): 최대 세션 수. 넘으면 가장 오래 사용하지 않은 세션부터 제거한다.
+            ttl_sec (float): 마지막 사용 이후 세션을 유지할 시간(초).
+            max_session_bytes (int): 세션별 이벤트 크기 상한. 넘으면 오래된 이벤트부터 제거한다.
+        """
+        super().__init__()
+        self._max_sessions = max(1, max_sessions)
+        self._ttl_sec = ttl_sec
+        self._max_session_bytes = max(1, max_session_bytes)
+        # 세션 키 → (마지막 사용 시각, 이벤트 크기 합)
+        self._usage: OrderedDict[_SessionKey, tuple[float, int]] = OrderedDict()
+        self._total_bytes = 0
+        self.evicted_sessions = 0
+        self.trimmed_events = 0
+        register_memory_stats("sessions", self)
+
+    def stats(self) -> dict[str, int]:
+        """세션 사용량 통계를 반환한다.
+
+        Returns:
+            dict[str, int]: 세션 수, 추정 바이트, 제거된 세션/이벤트 수.
+        """
+        return {
+            "sessions": len(self._usage),
+            "bytes": self._total_bytes,
+            "evicted_sessions": self.evicted_sessions,
+            "trimmed_events": self.trimmed_events,
+        }
+
+    def _create_session_impl(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: dict[str, Any] | None = None,
+        session_id: str | None = None,
+    ) -> Session:
+        """세션을 생성하고 한도를 넘는 세션을 제거한다."""
+        session = super()._create_session_impl(app_name=app_name, user_id=user_id, state=state, session_id=session_id)
+        self._touch((app_name, user_id, session.id), added_bytes=0)
+        self._evict()
+        return session
+
+    def _get_session_impl(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: Any = None,
+    ) -> Session | None:
+        """만료된 세션을 정리한 뒤 세션을 조회한다."""
+        self._evict()
+        session = super()._get_session_impl(app_name=app_name, user_id=user_id, session_id=session_id, config=config)
+        if session is not None:
+            self._touch((app_name, user_id, session_id), added_bytes=0)
+        return session
+
+    def _delete_session_impl(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        """세션을 삭제하고 사용량 기록을 제거한다."""
+        self._drop((app_name, user_id, session_id))
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        """이벤트를 추가하고 세션 바이트 상한을 적용한다."""
+        event = await super().append_event(session=session, event=event)
+        if event.partial:
+            return event
+
+        key = (session.app_name, session.user_id, session.id)
+        if key not in self._usage:
+            return event
+        self._touch(key, added_bytes=_estimate_event_bytes(event))
+        self._trim_session(key)
+        return event
+
+    def _touch(self, key: _SessionKey, *, added_bytes: int) -> None:
+        """세션 사용 시각과 크기를 갱신한다."""
+        _, size = self._usage.pop(key, (0.0, 0))
+        self._usage[key] = (time.monotonic(), size + added_bytes)
+        self._total_bytes += added_bytes
+
+    def _drop(self, key: _SessionKey) -> None:
+        """저장소와 사용량 기록에서 세션을 제거한다."""
+        app_name, user_id, session_id = key
+        _, size = self._usage.pop(key, (0.0, 0))
+        self._total_bytes -= size
+        user_sessions = self.sessions.get(app_name, {}).get(user_id)
+        if user_sessions is None:
+            return
+        user_sessions.pop(session_id, None)
+        if not user_sessions:
+            self.sessions[app_name].pop(user_id, None)
+
+    def _evict(self) -> None:
+        """만료되었거나 세션 수 한도를 넘는 세션을 오래된 순으로 제거한다."""
+        expire_before = time.monotonic() - self._ttl_sec
+        while self._usage:
+            key, (last_used, _) = next(iter(self._usage.items()))
+            if last_used >= expire_before and len(self._usage) <= self._max_sessions:
+                break
+            self._drop(key)
+            self.evicted_sessions += 1
+            logger.info("Evicted session app=%s user=%s session=%s", *key)
+
+    def _trim_session(self, key: _SessionKey) -> None:
+        """세션 크기가 상한을 넘으면 최신 이벤트를 남기고 오래된 이벤트부터 제거한다."""
+        last_used, size = self._usage[key]
+        if size <= self._max_session_bytes:
+            return
+
+        app_name, user_id, session_id = key
+        storage_session = self.sessions[app_name][user_id][session_id]
+        events = storage_session.events
+        removed_bytes = 0
+        drop_count = 0
+        while drop_count < len(events) - 1 and size - removed_bytes > self._max_session_bytes:
+            removed_bytes += _estimate_event_bytes(events[drop_count])
+            drop_count += 1
+        # 호출 없이 남는 함수 응답 이벤트가 첫 이벤트가 되지 않도록 함께 제거한다.
+        while drop_count < len(events) - 1 and events[drop_count].get_function_responses():
+            removed_bytes += _estimate_event_bytes(events[drop_count])
+            drop_count += 1
+
+        if drop_count:
+            del events[:drop_count]
+            self.trimmed_events += drop_count
+            self._usage[key] = (last_used, size - removed_bytes)
+            self._total_bytes -= removed_bytes
+            logger.info("Trimmed session events session=%s count=%s bytes=%s", session_id, drop_count, removed_bytes)
+
+
+class BoundedInMemoryArtifactService(InMemoryArtifactService):
+    """총 바이트/수명 상한이 있는 메모리 아티팩트 서비스."""
+
+    max_bytes: int
+    ttl_sec: float
+    _usage: OrderedDict[str, tuple[float, int]] = PrivateAttr(default_factory=OrderedDict)
+    _total_bytes: int = PrivateAttr(default=0)
+    _evicted: int = PrivateAttr(default=0)
+
+    def model_post_init(self, context: Any, /) -> None:
+        """통계 수집 대상에 등록한다."""
+        register_memory_stats("artifacts", self)
+
+    def stats(self) -> dict[str, int]:
+        """아티팩트 사용량 통계를 반환한다.
+
+        Returns:
+            dict[str, int]: 아티팩트 경로 수, 추정 바이트, 제거된 경로 수.
+        """
+        return {"artifacts": len(self._usage), "bytes": self._total_bytes, "evicted_artifacts": self._evicted}
+
+    async def save_artifact(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        filename: str,
+        artifact: types.Part,
+    ) -> int:
+        """아티팩트를 저장하고 한도를 넘는 아티팩트를 제거한다."""
+        version = await super().save_artifact(
+            app_name=app_name, user_id=user_id, session_id=session_id, filename=filename, artifact=artifact
+        )
+        path = self._artifact_path(app_name, user_id, session_id, filename)
+        added_bytes = _estimate_part_bytes(artifact)
+        _, size = self._usage.pop(path, (0.0, 0))
+        self._usage[path] = (time.monotonic(), size + added_bytes)
+        self._total_bytes += added_bytes
+        self._evict(keep=path)
+        return version
+
+    async def delete_artifact(self, *, app_name: str, user_id: str, session_id: str, filename: str) -> None:
+        """아티팩트를 삭제하고 사용량 기록을 제거한다."""
+        await super().delete_artifact(app_name=app_name, user_id=user_id, session_id=session_id, filename=filename)
+        self._drop(self._artifact_path(app_name, user_id, session_id, filename))
+
+    def _drop(self, path: str) -> None:
+        """저장소와 사용량 기록에서 아티팩트 경로를 제거한다."""
+        _, size = self._usage.pop(path, (0.0, 0))
+        self._total_bytes -= size
+        self.artifacts.pop(path, None)
+
+    def _evict(self, *, keep: str) -> None:
+        """만료되었거나 바이트 한도를 넘는 아티팩트를 오래된 순으로 제거한다. 방금 저장한 경로는 남긴다."""
+        expire_before = time.monotonic() - self.ttl_sec
+        while self._usage:
+            path, (saved_at, _) = next(iter(self._usage.items()))
+            if path == keep or (saved_at >= expire_before and self._total_bytes <= self.max_bytes):
+                break
+            self._drop(path)
+            self._evicted += 1
+            logger.info("Evicted artifact path=%s", path)
+
+
+class BoundedInMemoryMemoryService(InMemoryMemoryService):
+    """보관 세션 수 상한이 있는 메모리 서비스."""
+
+    def __init__(self, *, max_sessions: int) -> None:
+        """BoundedInMemoryMemoryService 인스턴스를 초기화한다.
+
+        Args:
+            max_sessions (int): 기억할 최대 세션 수. 넘으면 가장 먼저 추가된 세션부터 제거한다.
+        """
+        super().__init__()
+        self._max_sessions = max(1, max_sessions)
+        self._order: OrderedDict[tuple[str, str], None] = OrderedDict()
+        self.evicted_sessions = 0
+        register_memory_stats("memory", self)
+
+    def stats(self) -> dict[str, int]:
+        """메모리 서비스 사용량 통계를 반환한다.
+
+        Returns:
+            dict[str, int]: 보관 세션 수, 제거된 세션 수.
+        """
+        return {"sessions": len(self._order), "evicted_sessions": self.evicted_sessions}
+
+    async def add_session_to_memory(self, session: Session) -> None:
+        """세션을 메모리에 추가하고 상한을 넘는 세션을 제거한다."""
+        await super().add_session_to_memory(session)
+        user_key = f"{session.app_name}/{session.user_id}"
+        with self._lock:
+            self._order.pop((user_key, session.id), None)
+            self._order[(user_key, session.id)] = None
+            while len(self._order) > self._max_sessions:
+                (old_user_key, old_session_id), _ = self._order.popitem(last=False)
+                user_sessions = self._session_events.get(old_user_key, {})
+                user_sessions.pop(old_session_id, None)
+                if not user_sessions:
+                    self._session_events.pop(old_user_key, None)
+                self.evicted_sessions += 1
+
+
+def create_runner_services(
+    app_settings: AppSettings,
+) -> tuple[BoundedInMemorySessionService, BoundedInMemoryArtifactService, BoundedInMemoryMemoryService]:
+    """설정에 따라 메모리 한도가 있는 Runner 서비스를 생성한다.
+
+    Args:
+        app_settings (AppSettings): 애플리케이션 설정.
+
+    Returns:
+        tuple: (세션 서비스, 아티팩트 서비스, 메모리 서비스).
+    """
+    session_service = BoundedInMemorySessionService(
+        max_sessions=app_settings.session_max_sessions,
+        ttl_sec=app_settings.session_ttl_sec,
+        max_session_bytes=app_settings.session_max_bytes,
+    )
+    artifact_service = BoundedInMemoryArtifactService(
+        max_bytes=app_settings.artifact_max_bytes,
+        ttl_sec=app_settings.artifact_ttl_sec,
+    )
+    memory_service = BoundedInMemoryMemoryService(max_sessions=app_settings.memory_max_sessions)
+    return session_service, artifact_service, memory_service
@@ -1,102 +1,54 @@
-import asyncio
+from __future__ import annotations
+
+import importlib
 import time
-from collections.abc import Sequence
-from typing import Any, cast
+from collections.abc import AsyncGenerator, Sequence
+from typing import TYPE_CHECKING, Any, cast
 
-import httpx
 from a2a.server.apps import A2AFastAPIApplication
+from a2a.server.context import ServerCallContext
+from a2a.server.events import Event
 from a2a.server.request_handlers import DefaultRequestHandler
-from a2a.server.tasks import InMemoryTaskStore
+from a2a.server.tasks import TaskStore
 from a2a.types import (
     AgentCapabilities,
     AgentCard,
     AgentSkill,
+    Message,
+    MessageSendParams,
+    Task,
 )
 from fastapi import APIRouter, Query
-from google.adk import Agent
-from google.adk.a2a.executor.a2a_agent_executor import A2aAgentExecutor
-from google.adk.artifacts import InMemoryArtifactService
-from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
-from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
 
+from agents.helpers.health_poller import SubAgent, get_dependency_poller
+from agents.helpers.lazy_agent import LazyAgentExecutor, agents_loaded, preload_agents
+from agents.helpers.load_balancer import AGENT_BALANCER
+from agents.helpers.memory_stats import collect_memory_stats, register_memory_stats
+from agents.helpers.profiler import PROFILER, is_profile_requested
+from agents.helpers.resilience import circuit_snapshot
+from agents.helpers.scheduler import scheduler_snapshot
+from agents.helpers.structured_data import (
+    STRUCTURED_DATA_MIME_TYPE,
+    create_structured_a2a_part_converter,
+    structured_data_extension,
+)
+from agents.helpers.task_store import create_task_store
+from agents.helpers.tracing import annotate_current_span
+from common.http_clients import HTTP_CLIENTS
 from common.logger import get_logger
+from common.result_cache import PIPELINE_CACHE
+from common.settings import settings
+from common.telemetry import configure_tracing
+
+if TYPE_CHECKING:
+    from google.adk import Agent
+    from google.adk.a2a.executor.a2a_agent_executor import A2aAgentExecutor
 
 logger = get_logger(__name__)
 
 START_TIME = time.time()
 
 
-class SubAgent:
-    """서브 에이전트 식별 정보."""
-
-    def __init__(self, name: str, public_host: str, public_port: int) -> None:
-        """SubAgent 인스턴스를 초기화한다."""
-        self.name = name
-        self.public_host = public_host
-        self.public_port = public_port
-        self.base_url = f"http://{public_host}:{public_port}"
-
-
-async def _ping_one(client: httpx.AsyncClient, dependency: SubAgent, include_dependencies: bool) -> dict[str, Any]:
-    """A2A health.ping → 실패 시 /health 폴백. 요청당 1개 에이전트 검사."""
-
-    # A2A JSON-RPC health.ping 요청
-    try:
-        t0 = time.time()
-        r = await client.post(
-            f"{dependency.base_url}/a2a",
-            json={
-                "jsonrpc": "2.0",
-                "id": "ping",
-                "method": "health.ping",
-                "params": {"include_dependencies": include_dependencies},
-            },
-        )
-        latency_ms = int((time.time() - t0) * 1000)
-        if r.status_code == 200:
-            body = r.json()
-            result = body.get("result") or {}
-            status = result.get("status", "ok")
-            version = result.get("version")
-            return {"status": status, "latency_ms": latency_ms, "version": version, "url": dependency.base_url}
-    except Exception:
-        pass
-
-    # 2) HTTP /health 폴백
-    try:
-        t0 = time.time()
-        params = {"include_dependencies": "1"} if include_dependencies else {}
-        r = await client.get(f"{dependency.base_url}/health", params=params)
-        latency_ms = int((time.time() - t0) * 1000)
-        if r.status_code == 200:
-            body = r.json()
-            status = body.get("status", "ok")
-            version = body.get("version")
-            return {"status": status, "latency_ms": latency_ms, "version": version, "url": dependency.base_url}
-    except Exception:
-        pass
-
-    return {"status": "down", "latency_ms": None, "url": dependency.base_url}
-
-
-async def _fetch_dependencies_snapshot(
-    deps: Sequence[SubAgent],
-    *,
-    include_dependencies: bool,
-    timeout_sec: float = 1.0,
-) -> dict[str, Any]:
-    """요청 시점에 동시 비동기로 서브에이전트를 ping하고 스냅샷 생성."""
-    if not deps:
-        return {}
-    async with httpx.AsyncClient(timeout=timeout_sec) as client:
-        results = await asyncio.gather(
-            *[_ping_one(client, d, include_dependencies) for d in deps],
-            return_exceptions=False,
-        )
-    return {dep.name: res for dep, res in zip(deps, results, strict=False)}
-
-
 def _build_health_payload(
     app_name: str,
     version: str,
@@ -110,24 +62,34 @@ def _build_health_payload(
         "service": app_name,
         "version": version,
         "uptime_sec": uptime_sec,
+        "agent_loaded": agents_loaded(),
+        "memory": collect_memory_stats(),
         "dependencies": {},
     }
     if include_dependencies and deps_snapshot:
         payload["dependencies"] = deps_snapshot
         if any((v.get("status") != "ok") for v in deps_snapshot.values()):
             payload["status"] = "degraded"
+        replicas = AGENT_BALANCER.snapshot()
+        if replicas:
+            payload["replicas"] = replicas
+        circuits = circuit_snapshot()
+        if circuits:
+            payload["circuits"] = circuits
+        payload["scheduler"] = scheduler_snapshot()
+        payload["pipeline_cache"] = PIPELINE_CACHE.snapshot()
 
     return payload
 
 
 class HealthAwareRequestHandler(DefaultRequestHandler):
-    """health.ping 즉시 처리 + (오케스트레이터에서만) 서브에이전트 온디맨드 집계."""
+    """health.ping 즉시 처리 + (오케스트레이터에서만) 폴러에 캐시된 서브에이전트 상태 반환."""
 
     def __init__(
         self,
         *,
-        agent_executor: A2aAgentExecutor,
-        task_store: InMemoryTaskStore,
+        agent_executor: LazyAgentExecutor,
+        task_store: TaskStore,
         app_name: str,
         version: str,
         sub_agents: Sequence[SubAgent] | None = None,
@@ -137,8 +99,15 @@ class HealthAwareRequestHandler(DefaultRequestHandler):
         super().__init__(agent_executor=agent_executor, task_store=task_store)
         self._app_name = app_name
         self._version = version
-        self._sub_agents = tuple(sub_agents) if sub_agents else tuple()
-        self._deps_timeout_sec = deps_timeout_sec
+        self._poller = (
+            get_dependency_poller(
+                sub_agents,
+                interval_sec=settings.health_poll_interval_sec,
+                timeout_sec=deps_timeout_sec,
+            )
+            if sub_agents
+            else None
+        )
 
     async def handle(self, request: dict[str, Any]) -> dict[str, Any]:
         """health.ping 요청을 처리한다."""
@@ -147,12 +116,9 @@ class HealthAwareRequestHandler(DefaultRequestHandler):
             include_dependencies = bool(params.get("include_dependencies", False))
 
             deps_snapshot = None
-            if include_dependencies and self._sub_agents:
-                deps_snapshot = await _fetch_dependencies_snapshot(
-                    self._sub_agents,
-                    include_dependencies=True,
-                    timeout_sec=self._deps_timeout_sec,
-                )
+            if include_dependencies and self._poller is not None:
+                await self._poller.ensure_started()
+                deps_snapshot = self._poller.snapshot()
 
             result = _build_health_payload(
                 self._app_name,
@@ -163,9 +129,91 @@ class HealthAwareRequestHandler(DefaultRequestHandler):
             return {"jsonrpc": "2.0", "id": request.get("id"), "result": result}
         return cast(dict[str, Any], await super().handle(request))
 
+    async def on_message_send(
+        self,
+        params: MessageSendParams,
+        context: ServerCallContext | None = None,
+    ) -> Message | Task:
+        """message/send 요청을 처리하고 현재 스팬에 A2A 식별자를 기록한다.
+
+        메시지 또는 요청 메타데이터에 `profile` 플래그가 있으면 메시지 ID를 프로파일 ID로 하여 프로파일링한다.
+        """
+        _annotate_message_span("message/send", params)
+        if not _is_profile_requested(params):
+            return await super().on_message_send(params, context)
+        async with PROFILER.session(params.message.message_id):
+            return await super().on_message_send(params, context)
+
+    async def on_message_send_stream(
+        self,
+        params: MessageSendParams,
+        context: ServerCallContext | None = None,
+    ) -> AsyncGenerator[Event]:
+        """message/stream 요청을 처리하고 현재 스팬에 A2A 식별자를 기록한다.
+
+        메시지 또는 요청 메타데이터에 `profile` 플래그가 있으면 메시지 ID를 프로파일 ID로 하여 프로파일링한다.
+        """
+        _annotate_message_span("message/stream", params)
+        if not _is_profile_requested(params):
+            async for event in super().on_message_send_stream(params, context):
+                yield event
+            return
+        async with PROFILER.session(params.message.message_id):
+            async for event in super().on_message_send_stream(params, context):
+                yield event
+
+
+def _is_profile_requested(params: MessageSendParams) -> bool:
+    """요청 또는 메시지 메타데이터에 프로파일 플래그가 있는지 확인한다."""
+    return is_profile_requested(params.metadata) or is_profile_requested(params.message.metadata)
+
+
+def _annotate_message_span(method: str, params: MessageSendParams) -> None:
+    """A2A 메서드와 메시지/컨텍스트/태스크 ID를 현재 스팬에 기록한다."""
+    message = params.message
+    annotate_current_span(
+        {
+            "a2a.method": method,
+            "a2a.message_id": message.message_id,
+            "a2a.context_id": message.context_id,
+            "a2a.task_id": message.task_id,
+        }
+    )
+
+
+def _load_agent(agent: Agent | str) -> Agent:
+    """에이전트 인스턴스 또는 "모듈:속성" 경로에서 에이전트를 가져온다."""
+    if not isinstance(agent, str):
+        return agent
+    module_name, _, attribute = agent.partition(":")
+    return cast("Agent", getattr(importlib.import_module(module_name), attribute))
+
+
+def _build_agent_executor(agent: Agent | str, app_name: str) -> A2aAgentExecutor:
+    """에이전트를 로드하고 메모리 한도가 있는 Runner 서비스로 ADK A2A 실행기를 구성한다.
+
+    ADK 임포트와 에이전트 모듈 로드가 모두 여기서 일어나므로 서버 시작 경로와 분리된다.
+    """
+    from google.adk.a2a.executor.a2a_agent_executor import A2aAgentExecutor, A2aAgentExecutorConfig
+    from google.adk.apps import App
+    from google.adk.runners import Runner
+
+    from agents.helpers.bounded_services import create_runner_services
+    from agents.helpers.metrics_plugin import MetricsPlugin
+
+    session_service, artifact_service, memory_service = create_runner_services(settings)
+    runner = Runner(
+        app=App(name=app_name, root_agent=_load_agent(agent), plugins=[MetricsPlugin()]),
+        artifact_service=artifact_service,
+        session_service=session_service,
+        memory_service=memory_service,
+    )
+    config = A2aAgentExecutorConfig(a2a_part_converter=create_structured_a2a_part_converter())
+    return A2aAgentExecutor(runner=runner, config=config)
+
 
 def create_agent_a2a_server(
-    agent: Agent,
+    agent: Agent | str,
     name: str,
     description: str,
     version: str,
@@ -177,8 +225,12 @@ def create_agent_a2a_server(
 ) -> A2AFastAPIApplication:
     """ADK 에이전트에 대한 A2A 서버를 생성한다.
 
+    에이전트와 ADK Runner는 지연 로드된다. 서버는 즉시 `/health`에 응답하고, 에이전트는
+    `agent_preload` 설정에 따라 시작 직후 백그라운드에서 또는 첫 요청 시점에 로드된다.
+
     Args:
-        agent: ADK 에이전트 인스턴스
+        agent: ADK 에이전트 인스턴스 또는 "모듈:속성" 형식의 에이전트 경로.
+            예) "agents.crawler_agent.crawler_agent:CRAWLER_AGENT"
         name: 에이전트 표시 이름
         description: 에이전트 설명
         version: 에이전트 버전
@@ -188,7 +240,11 @@ def create_agent_a2a_server(
         sub_agents: 서브 에이전트 리스트
         deps_timeout_sec: 서브 에이전트 의존성 확인 시간 초과
     """
-    capabilities = AgentCapabilities(streaming=True)
+    configure_tracing(name)
+    # 구조화 데이터 확장을 광고하면 확장을 지원하는 호출자는 JSON 본문을 DataPart로, 큰 요청은 압축하여 보낸다.
+    extensions = [structured_data_extension()] if settings.a2a_structured_data else None
+    capabilities = AgentCapabilities(streaming=True, extensions=extensions)
+    input_modes = ["text", "text/plain", STRUCTURED_DATA_MIME_TYPE] if extensions else ["text", "text/plain"]
 
     agent_card_url = f"http://{public_host}:{public_port}/"
     logger.info(f"Agent card for {name} is created at URL: {agent_card_url}")
@@ -198,24 +254,20 @@ def create_agent_a2a_server(
         description=description,
         url=agent_card_url,
         version=version,
-        defaultInputModes=["text", "text/plain"],
+        defaultInputModes=input_modes,
         defaultOutputModes=["text", "text/plain"],
         capabilities=capabilities,
         skills=skills,
     )
 
-    runner = Runner(
-        app_name=agent_card.name,
-        agent=agent,
-        artifact_service=InMemoryArtifactService(),
-        session_service=InMemorySessionService(),
-        memory_service=InMemoryMemoryService(),
-    )
-    executor = A2aAgentExecutor(runner=runner)
+    executor = LazyAgentExecutor(name, lambda: _build_agent_executor(agent, agent_card.name))
+
+    task_store = create_task_store(settings, agent_card.name)
+    register_memory_stats("tasks", task_store)
 
     request_handler = HealthAwareRequestHandler(
         agent_executor=executor,
-        task_store=InMemoryTaskStore(),
+        task_store=task_store,
         app_name=agent_card.name,
         version=agent_card.version,
         sub_agents=sub_agents,
@@ -233,8 +285,22 @@ def attach_http_health(
     sub_agents: Sequence[SubAgent] | None = None,
     deps_timeout_sec: float = 1.0,
 ) -> None:
-    """HTTP /health 엔드포인트를 추가한다."""
+    """HTTP /health 엔드포인트를 추가한다.
+
+    서브 에이전트가 있으면 공유 폴러를 앱 시작/종료에 맞춰 구동하고, 엔드포인트는 캐시된 스냅샷만 반환한다.
+    `agent_preload`가 켜져 있으면 앱 시작 직후 에이전트를 백그라운드에서 미리 로드하고 공유 HTTP 클라이언트를
+    미리 연결하며, 앱 종료 시 공유 HTTP 클라이언트를 닫는다.
+    """
     router = APIRouter()
+    poller = (
+        get_dependency_poller(
+            sub_agents,
+            interval_sec=settings.health_poll_interval_sec,
+            timeout_sec=deps_timeout_sec,
+        )
+        if sub_agents
+        else None
+    )
 
     @router.get("/health")
     async def health(
@@ -243,12 +309,9 @@ def attach_http_health(
         ),
     ) -> dict[str, Any]:
         deps_snapshot = None
-        if include_dependencies and sub_agents:
-            deps_snapshot = await _fetch_dependencies_snapshot(
-                sub_agents,
-                include_dependencies=True,
-                timeout_sec=deps_timeout_sec,
-            )
+        if include_dependencies and poller is not None:
+            await poller.ensure_started()
+            deps_snapshot = poller.snapshot()
         return _build_health_payload(
             app_name,
             version,
@@ -257,3 +320,13 @@ def attach_http_health(
         )
 
     app.include_router(router)
+    if settings.agent_preload:
+        app.add_event_handler("startup", preload_agents)
+    else:
+        app.add_event_handler("startup", HTTP_CLIENTS.warm_up)
+    app.add_event_handler("shutdown", HTTP_CLIENTS.aclose)
+    if poller is not None:
+        # 헬스 폴링 결과로 down 복제본을 로드 밸런싱 대상에서 제외한다.
+        poller.add_listener(AGENT_BALANCER.observe_health)
+        app.add_event_handler("startup", poller.start)
+        app.add_event_handler("shutdown", poller.stop)
@@ -0,0 +1,70 @@
+"""에이전트 서버 요청 데드라인 적용 모듈.
+
+요청의 `X-Deadline-Ms` 헤더(없으면 `run_deadline_sec` 기본값)로 요청 처리에 데드라인을 설정한다.
+처리 중의 HTTP/LLM 호출과 툴은 남은 시간 안에서만 동작하고, 데드라인이 지나면 요청을 504로 끝낸다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from a2a.server.apps import A2AFastAPIApplication
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from common.deadline import DEADLINE_HEADER, deadline_scope, parse_deadline_header
+from common.logger import get_logger
+from common.settings import settings
+
+logger = get_logger(__name__)
+
+
+class DeadlineMiddleware:
+    """요청별 데드라인을 설정하고 초과 시 처리를 중단하는 ASGI 미들웨어."""
+
+    def __init__(self, app: ASGIApp, default_timeout_sec: float) -> None:
+        """DeadlineMiddleware 인스턴스를 초기화한다.
+
+        Args:
+            app (ASGIApp): 감쌀 ASGI 앱.
+            default_timeout_sec (float): 헤더가 없을 때의 데드라인(초). 0 이하이면 데드라인을 두지 않는다.
+        """
+        self.app = app
+        self.default_timeout_sec = default_timeout_sec
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """요청을 데드라인 컨텍스트 안에서 처리한다."""
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        timeout_sec = parse_deadline_header(Headers(scope=scope).get(DEADLINE_HEADER))
+        if timeout_sec is None:
+            timeout_sec = self.default_timeout_sec if self.default_timeout_sec > 0 else None
+        if timeout_sec is None:
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        with deadline_scope(timeout_sec):
+            try:
+                async with asyncio.timeout(timeout_sec):
+                    await self.app(scope, receive, send_wrapper)
+            except TimeoutError:
+                logger.info("Request deadline exceeded path=%s timeout_sec=%.2f", scope["path"], timeout_sec)
+                if not response_started:
+                    response = JSONResponse({"error": "deadline exceeded"}, status_code=504)
+                    await response(scope, receive, send)
+
+
+def attach_http_deadline(app: A2AFastAPIApplication) -> None:
+    """요청 데드라인 미들웨어를 추가한다."""
+    app.add_middleware(DeadlineMiddleware, default_timeout_sec=settings.run_deadline_sec)
@@ -0,0 +1,314 @@
+"""서브 에이전트 의존성 헬스 백그라운드 폴러 모듈.
+
+요청마다 새 HTTP 클라이언트를 만들어 서브 에이전트를 동기 ping하는 대신, 프로세스당 하나의
+풀링된 클라이언트로 주기적으로 상태를 갱신하고 캐시된 스냅샷을 O(1)로 제공한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import httpx
+
+from common.logger import get_logger
+
+logger = get_logger(__name__)
+
+PROBE_JSONRPC = "jsonrpc"
+PROBE_HTTP = "http"
+DEFAULT_HISTORY_SIZE = 30
+# 마지막 확인 후 폴링 주기의 이 배수만큼 지나면 스냅샷을 stale로 표시한다.
+STALE_INTERVAL_FACTOR = 3.0
+
+
+class SubAgent:
+    """서브 에이전트 식별 정보."""
+
+    def __init__(self, name: str, public_host: str, public_port: int) -> None:
+        """SubAgent 인스턴스를 초기화한다."""
+        self.name = name
+        self.public_host = public_host
+        self.public_port = public_port
+        self.base_url = f"http://{public_host}:{public_port}"
+
+
+async def _ping_jsonrpc(
+    client: httpx.AsyncClient, dependency: SubAgent, include_dependencies: bool
+) -> dict[str, Any] | None:
+    """A2A JSON-RPC health.ping으로 서브 에이전트를 검사한다."""
+    t0 = time.perf_counter()
+    r = await client.post(
+        f"{dependency.base_url}/a2a",
+        json={
+            "jsonrpc": "2.0",
+            "id": "ping",
+            "method": "health.ping",
+            "params": {"include_dependencies": include_dependencies},
+        },
+    )
+    latency_ms = int((time.perf_counter() - t0) * 1000)
+    if r.status_code != 200:
+        return None
+    result = r.json().get("result") or {}
+    return {"status": result.get("status", "ok"), "latency_ms": latency_ms, "version": result.get("version")}
+
+
+async def _ping_http(
+    client: httpx.AsyncClient, dependency: SubAgent, include_dependencies: bool
+) -> dict[str, Any] | None:
+    """HTTP /health로 서브 에이전트를 검사한다."""
+    t0 = time.perf_counter()
+    params = {"include_dependencies": "1"} if include_dependencies else {}
+    r = await client.get(f"{dependency.base_url}/health", params=params)
+    latency_ms = int((time.perf_counter() - t0) * 1000)
+    if r.status_code != 200:
+        return None
+    body = r.json()
+    return {"status": body.get("status", "ok"), "latency_ms": latency_ms, "version": body.get("version")}
+
+
+_PROBES = {PROBE_JSONRPC: _ping_jsonrpc, PROBE_HTTP: _ping_http}
+
+
+async def _ping_one(
+    client: httpx.AsyncClient,
+    dependency: SubAgent,
+    include_dependencies: bool,
+    preferred_probe: str = PROBE_JSONRPC,
+) -> dict[str, Any]:
+    """선호 방식(JSON-RPC 또는 HTTP)으로 먼저 ping하고 실패 시 다른 방식으로 폴백한다.
+
+    Args:
+        client (httpx.AsyncClient): 공유 HTTP 클라이언트.
+        dependency (SubAgent): 검사 대상 서브 에이전트.
+        include_dependencies (bool): 하위 의존성 상태 포함 여부.
+        preferred_probe (str): 먼저 시도할 방식. 직전에 성공한 방식을 넘기면 왕복 1회로 끝난다.
+
+    Returns:
+        dict[str, Any]: status, latency_ms, version, url, probe 키를 갖는 결과.
+    """
+    probes = [preferred_probe, *(probe for probe in _PROBES if probe != preferred_probe)]
+    for probe in probes:
+        try:
+            result = await _PROBES[probe](client, dependency, include_dependencies)
+        except Exception:
+            result = None
+        if result is not None:
+            return {**result, "url": dependency.base_url, "probe": probe}
+
+    return {"status": "down", "latency_ms": None, "url": dependency.base_url, "probe": None}
+
+
+class _DependencyState:
+    """의존성별 최근 결과와 지연 시간 이력."""
+
+    __slots__ = ("result", "checked_at", "latency_history", "consecutive_failures", "preferred_probe")
+
+    def __init__(self, history_size: int) -> None:
+        """_DependencyState 인스턴스를 초기화한다."""
+        self.result: dict[str, Any] | None = None
+        self.checked_at: float | None = None
+        self.latency_history: deque[int] = deque(maxlen=history_size)
+        self.consecutive_failures = 0
+        self.preferred_probe = PROBE_JSONRPC
+
+    def record(self, result: dict[str, Any], checked_at: float) -> None:
+        """ping 결과를 기록한다."""
+        self.result = result
+        self.checked_at = checked_at
+        if result.get("probe"):
+            self.preferred_probe = result["probe"]
+        if result.get("status") == "down":
+            self.consecutive_failures += 1
+        else:
+            self.consecutive_failures = 0
+        if result.get("latency_ms") is not None:
+            self.latency_history.append(result["latency_ms"])
+
+
+class DependencyHealthPoller:
+    """서브 에이전트 상태를 주기적으로 갱신하고 캐시된 스냅샷을 제공하는 폴러."""
+
+    def __init__(
+        self,
+        deps: Sequence[SubAgent],
+        *,
+        interval_sec: float,
+        timeout_sec: float,
+        history_size: int = DEFAULT_HISTORY_SIZE,
+        include_dependencies: bool = True,
+    ) -> None:
+        """DependencyHealthPoller 인스턴스를 초기화한다.
+
+        Args:
+            deps (Sequence[SubAgent]): 검사 대상 서브 에이전트 리스트.
+            interval_sec (float): 폴링 주기(초).
+            timeout_sec (float): ping 요청 시간 초과(초).
+            history_size (int): 의존성별로 보관할 지연 시간 이력 개수.
+            include_dependencies (bool): 하위 의존성 상태까지 요청할지 여부.
+        """
+        self._deps = tuple(deps)
+        self._interval_sec = max(0.1, interval_sec)
+        self._timeout_sec = timeout_sec
+        self._include_dependencies = include_dependencies
+        self._states = {dep.name: _DependencyState(history_size) for dep in self._deps}
+        self._listeners: list[Callable[[str, dict[str, Any]], None]] = []
+        self._client: httpx.AsyncClient | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._start_lock = asyncio.Lock()
+
+    @property
+    def running(self) -> bool:
+        """백그라운드 폴링 실행 여부."""
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """공유 클라이언트를 만들고 첫 갱신 후 백그라운드 폴링을 시작한다."""
+        async with self._start_lock:
+            if self.running or not self._deps:
+                return
+            if self._client is None:
+                self._client = httpx.AsyncClient(
+                    timeout=self._timeout_sec,
+                    limits=httpx.Limits(
+                        max_connections=len(self._deps) * 2,
+                        max_keepalive_connections=len(self._deps),
+                    ),
+                )
+            await self.refresh()
+            self._task = asyncio.create_task(self._run(), name="dependency-health-poller")
+            logger.info("Dependency health poller started deps=%s interval=%s", len(self._deps), self._interval_sec)
+
+    async def stop(self) -> None:
+        """백그라운드 폴링을 중지하고 클라이언트를 닫는다."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def add_listener(self, listener: Callable[[str, dict[str, Any]], None]) -> None:
+        """ping 결과를 받을 함수를 등록한다. 갱신마다 서브 에이전트별로 (base_url, 결과)를 전달한다."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    async def ensure_started(self) -> None:
+        """폴링이 시작되지 않았으면 시작한다. 시작 훅이 없는 환경을 위한 지연 시작 경로."""
+        if not self.running:
+            await self.start()
+
+    async def refresh(self) -> None:
+        """모든 서브 에이전트를 동시에 ping하여 상태를 갱신한다."""
+        if self._client is None or not self._deps:
+            return
+        results = await asyncio.gather(
+            *[
+                _ping_one(
+                    self._client,
+                    dep,
+                    self._include_dependencies,
+                    self._states[dep.name].preferred_probe,
+                )
+                for dep in self._deps
+            ]
+        )
+        checked_at = time.time()
+        for dep, result in zip(self._deps, results, strict=True):
+            self._states[dep.name].record(result, checked_at)
+            for listener in self._listeners:
+                listener(dep.base_url, result)
+
+    def snapshot(self) -> dict[str, Any]:
+        """캐시된 의존성 상태 스냅샷을 반환한다.
+
+        Returns:
+            dict[str, Any]: 서브 에이전트 이름별 상태, 지연 시간 이력 요약, 최신성 정보.
+        """
+        now = time.time()
+        stale_after = self._interval_sec * STALE_INTERVAL_FACTOR
+        snapshot: dict[str, Any] = {}
+        for dep in self._deps:
+            state = self._states[dep.name]
+            if state.result is None or state.checked_at is None:
+                snapshot[dep.name] = {"status": "unknown", "latency_ms": None, "url": dep.base_url}
+                continue
+
+            age_sec = now - state.checked_at
+            entry = {key: value for key, value in state.result.items() if key != "probe"}
+            entry["checked_at"] = state.checked_at
+            entry["stale_sec"] = round(age_sec, 3)
+            entry["consecutive_failures"] = state.consecutive_failures
+            entry["latency_history_ms"] = _summarize_latencies(state.latency_history)
+            if age_sec > stale_after:
+                entry["status"] = "stale"
+            snapshot[dep.name] = entry
+        return snapshot
+
+    async def _run(self) -> None:
+        """폴링 주기마다 상태를 갱신한다."""
+        while True:
+            await asyncio.sleep(self._interval_sec)
+            try:
+                await self.refresh()
+            except Exception as exc:
+                logger.info("Dependency health refresh failed: %s", exc)
+
+
+def _summarize_latencies(history: deque[int]) -> dict[str, Any]:
+    """지연 시간 이력을 요약한다.
+
+    Args:
+        history (deque[int]): 최근 지연 시간(ms) 이력.
+
+    Returns:
+        dict[str, Any]: 샘플 수, 평균, 중앙값, 최대값, 최근 값 리스트.
+    """
+    if not history:
+        return {"count": 0}
+    samples = list(history)
+    return {
+        "count": len(samples),
+        "avg": round(statistics.fmean(samples), 1),
+        "p50": statistics.median(samples),
+        "max": max(samples),
+        "recent": samples[-5:],
+    }
+
+
+_POLLERS: dict[tuple[str, ...], DependencyHealthPoller] = {}
+
+
+def get_dependency_poller(
+    deps: Sequence[SubAgent],
+    *,
+    interval_sec: float,
+    timeout_sec: float,
+) -> DependencyHealthPoller:
+    """서브 에이전트 구성별로 프로세스에서 공유하는 폴러를 반환한다.
+
+    A2A 핸들러와 HTTP /health 엔드포인트가 같은 폴러와 클라이언트를 사용하도록 한다.
+
+    Args:
+        deps (Sequence[SubAgent]): 검사 대상 서브 에이전트 리스트.
+        interval_sec (float): 폴링 주기(초).
+        timeout_sec (float): ping 요청 시간 초과(초).
+
+    Returns:
+        DependencyHealthPoller: 공유 폴러 인스턴스.
+    """
+    key = tuple(f"{dep.name}={dep.base_url}" for dep in deps)
+    poller = _POLLERS.get(key)
+    if poller is None:
+        poller = DependencyHealthPoller(deps, interval_sec=interval_sec, timeout_sec=timeout_sec)
+        _POLLERS[key] = poller
+    return poller
@@ -0,0 +1,93 @@
+"""지연 로드 A2A 에이전트 실행기 모듈.
+
+ADK, LiteLLM, trafilatura처럼 임포트에만 수 초가 걸리는 모듈과 에이전트/Runner 구성을 서버 시작 경로에서
+분리한다. 서버는 곧바로 `/health`에 응답하고, 에이전트는 시작 직후 백그라운드 스레드에서 미리 로드되거나
+(`agent_preload=True`) 첫 요청 시점에 로드된다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+
+from a2a.server.agent_execution import AgentExecutor, RequestContext
+from a2a.server.events import EventQueue
+
+from common.http_clients import HTTP_CLIENTS
+from common.logger import get_logger
+
+logger = get_logger(__name__)
+
+_EXECUTORS: list[LazyAgentExecutor] = []
+_WARMUP_TASKS: set[asyncio.Task[None]] = set()
+
+
+class LazyAgentExecutor(AgentExecutor):
+    """첫 사용 시점에 실제 실행기를 만들어 위임하는 A2A 실행기."""
+
+    def __init__(self, name: str, factory: Callable[[], AgentExecutor]) -> None:
+        """LazyAgentExecutor 인스턴스를 초기화한다.
+
+        Args:
+            name (str): 로그에 표시할 에이전트 이름.
+            factory (Callable[[], AgentExecutor]): 실제 실행기를 만드는 함수. 무거운 임포트를 포함할 수 있으며
+                이벤트 루프를 막지 않도록 워커 스레드에서 한 번만 호출된다.
+        """
+        self._name = name
+        self._factory = factory
+        self._executor: AgentExecutor | None = None
+        self._lock = asyncio.Lock()
+        _EXECUTORS.append(self)
+
+    @property
+    def loaded(self) -> bool:
+        """실제 실행기 로드 완료 여부."""
+        return self._executor is not None
+
+    async def load(self) -> AgentExecutor:
+        """실제 실행기를 로드하여 반환한다. 동시에 호출되어도 한 번만 로드한다."""
+        if self._executor is not None:
+            return self._executor
+        async with self._lock:
+            if self._executor is None:
+                started = time.perf_counter()
+                self._executor = await asyncio.to_thread(self._factory)
+                logger.info("Agent loaded name=%s elapsed_sec=%.2f", self._name, time.perf_counter() - started)
+        return self._executor
+
+    async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
+        """실제 실행기를 로드한 뒤 요청 실행을 위임한다."""
+        executor = await self.load()
+        await executor.execute(context, event_queue)
+
+    async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
+        """실제 실행기를 로드한 뒤 취소를 위임한다."""
+        executor = await self.load()
+        await executor.cancel(context, event_queue)
+
+
+def agents_loaded() -> bool:
+    """이 프로세스의 모든 지연 로드 에이전트가 로드되었는지 여부."""
+    return all(executor.loaded for executor in _EXECUTORS)
+
+
+async def preload_agents() -> None:
+    """등록된 에이전트를 백그라운드에서 로드하기 시작한다. 서버 시작 훅에서 호출한다.
+
+    로드가 끝나면 에이전트 모듈이 등록한 공유 HTTP 클라이언트(LLM 제공자, 외부 API, 서브 에이전트)를 미리 연결한다.
+    """
+    task = asyncio.create_task(_preload_and_warm_up())
+    _WARMUP_TASKS.add(task)
+    task.add_done_callback(_WARMUP_TASKS.discard)
+
+
+async def _preload_and_warm_up() -> None:
+    """모든 에이전트를 로드한 뒤 공유 HTTP 클라이언트를 미리 연결한다. 실패한 에이전트는 첫 요청에서 다시 시도한다."""
+    results = await asyncio.gather(
+        *(executor.load() for executor in _EXECUTORS if not executor.loaded), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            logger.info("Agent preload failed: %s", result)
+    await HTTP_CLIENTS.warm_up()
@@ -0,0 +1,273 @@
+"""서브 에이전트 복제본 클라이언트 측 로드 밸런싱 모듈.
+
+서브 에이전트마다 여러 엔드포인트(`*_AGENT_ENDPOINTS`)를 받아, 서브 에이전트 호출용 공유 HTTP 클라이언트의
+전송 계층에서 요청을 처리 중 요청 수가 가장 적은(least-outstanding-requests) 복제본으로 보낸다.
+헬스 폴러의 ping 결과로 down 복제본을 제외하고, 연결에 실패한 복제본은 일정 시간 배제한 뒤 다른 복제본으로 재시도한다.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+import httpx
+
+from common.http_clients import DEFAULT_LIMITS, HTTP2_AVAILABLE
+from common.logger import get_logger
+from common.settings import settings
+
+logger = get_logger(__name__)
+
+
+def sub_agent_endpoints(name: str) -> list[str]:
+    """설정에서 서브 에이전트 복제본 base URL 목록을 읽는다.
+
+    `{NAME}_AGENT_ENDPOINTS`(쉼표로 구분한 host:port 목록)가 없으면 공개 호스트/포트 하나를 사용한다.
+
+    Args:
+        name (str): 서브 에이전트 이름. 예) "parser".
+
+    Returns:
+        list[str]: "http://host:port" 형식의 base URL 목록. 첫 항목이 에이전트 카드를 조회할 기본 주소이다.
+    """
+    raw = getattr(settings, f"{name}_agent_endpoints", "") or ""
+    endpoints = [endpoint.strip().rstrip("/") for endpoint in raw.split(",") if endpoint.strip()]
+    if not endpoints:
+        host = getattr(settings, f"{name}_agent_public_host")
+        port = getattr(settings, f"{name}_agent_public_port")
+        endpoints = [f"{host}:{port}"]
+    return [endpoint if "://" in endpoint else f"http://{endpoint}" for endpoint in endpoints]
+
+
+class _Replica:
+    """복제본 하나의 주소와 부하/상태."""
+
+    __slots__ = ("url", "outstanding", "healthy", "ejected_until")
+
+    def __init__(self, base_url: str) -> None:
+        """_Replica 인스턴스를 초기화한다."""
+        self.url = httpx.URL(base_url)
+        self.outstanding = 0
+        self.healthy = True
+        self.ejected_until = 0.0
+
+    @property
+    def origin(self) -> str:
+        """scheme://host:port 문자열."""
+        return _origin(self.url)
+
+    def available(self, now: float) -> bool:
+        """요청을 보낼 수 있는 상태인지 여부."""
+        return self.healthy and self.ejected_until <= now
+
+
+class ReplicaPool:
+    """서브 에이전트 하나의 복제본 집합."""
+
+    def __init__(self, name: str, base_urls: list[str]) -> None:
+        """ReplicaPool 인스턴스를 초기화한다.
+
+        Args:
+            name (str): 서브 에이전트 이름.
+            base_urls (list[str]): 복제본 base URL 목록.
+        """
+        self.name = name
+        self.replicas = [_Replica(base_url) for base_url in base_urls]
+        self._rotation = itertools.count()
+
+    def pick(self, exclude: set[str] | None = None) -> _Replica | None:
+        """처리 중 요청이 가장 적은 사용 가능 복제본을 고른다. 동률이면 순환 순서로 고른다.
+
+        사용 가능한 복제본이 없으면 배제 여부와 관계없이 전체에서 고른다. (모든 복제본을 배제해 요청을 막지 않는다)
+
+        Args:
+            exclude (set[str] | None): 이번 요청에서 이미 실패한 복제본 origin.
+
+        Returns:
+            _Replica | None: 선택한 복제본. 시도할 복제본이 없으면 None.
+        """
+        candidates = [replica for replica in self.replicas if replica.origin not in (exclude or ())]
+        if not candidates:
+            return None
+        now = time.monotonic()
+        available = [replica for replica in candidates if replica.available(now)] or candidates
+        offset = next(self._rotation) % len(available)
+        rotated = available[offset:] + available[:offset]
+        return min(rotated, key=lambda replica: replica.outstanding)
+
+
+class AgentLoadBalancer:
+    """서브 에이전트별 복제본 풀과 헬스 상태를 관리하는 로드 밸런서."""
+
+    def __init__(self) -> None:
+        """AgentLoadBalancer 인스턴스를 초기화한다."""
+        self._pools: dict[str, ReplicaPool] = {}
+        self._by_origin: dict[str, ReplicaPool] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, base_urls: list[str]) -> None:
+        """서브 에이전트 복제본 풀을 등록한다. 같은 이름으로 다시 등록하면 무시한다.
+
+        Args:
+            name (str): 서브 에이전트 이름.
+            base_urls (list[str]): 복제본 base URL 목록.
+        """
+        with self._lock:
+            if name in self._pools:
+                return
+            pool = ReplicaPool(name, base_urls)
+            self._pools[name] = pool
+            for replica in pool.replicas:
+                self._by_origin[replica.origin] = pool
+        logger.info("Replica pool registered name=%s replicas=%s", name, len(base_urls))
+
+    def pool_for(self, url: httpx.URL) -> ReplicaPool | None:
+        """요청 URL이 속한 복제본 풀을 반환한다. 어느 복제본 주소로 요청해도 같은 풀로 묶인다."""
+        return self._by_origin.get(_origin(url))
+
+    def observe_health(self, base_url: str, result: dict[str, Any]) -> None:
+        """헬스 폴러의 ping 결과를 반영한다. down이면 제외하고, 응답하면 배제를 해제한다.
+
+        Args:
+            base_url (str): ping한 복제본 base URL.
+            result (dict[str, Any]): `_ping_one` 결과.
+        """
+        replica = self._replica(base_url)
+        if replica is None:
+            return
+        healthy = result.get("status") != "down"
+        if healthy != replica.healthy:
+            logger.info("Replica health changed url=%s healthy=%s", base_url, healthy)
+        replica.healthy = healthy
+        if healthy:
+            replica.ejected_until = 0.0
+
+    def eject(self, replica: _Replica, reason: str) -> None:
+        """연결에 실패한 복제본을 `agent_eject_sec` 동안 배제한다."""
+        replica.ejected_until = time.monotonic() + settings.agent_eject_sec
+        logger.info("Replica ejected url=%s reason=%s eject_sec=%s", replica.origin, reason, settings.agent_eject_sec)
+
+    def snapshot(self) -> dict[str, Any]:
+        """풀별 복제본 상태를 반환한다."""
+        now = time.monotonic()
+        return {
+            name: [
+                {
+                    "url": replica.origin,
+                    "outstanding": replica.outstanding,
+                    "healthy": replica.healthy,
+                    "ejected_sec": round(max(0.0, replica.ejected_until - now), 1),
+                }
+                for replica in pool.replicas
+            ]
+            for name, pool in self._pools.items()
+        }
+
+    def _replica(self, base_url: str) -> _Replica | None:
+        """base URL에 해당하는 복제본을 찾는다."""
+        url = httpx.URL(base_url)
+        pool = self.pool_for(url)
+        if pool is None:
+            return None
+        return next((replica for replica in pool.replicas if replica.origin == _origin(url)), None)
+
+
+class LoadBalancingTransport(httpx.AsyncBaseTransport):
+    """등록된 복제본 풀로 가는 요청을 복제본 중 하나로 보내는 httpx 전송 계층."""
+
+    def __init__(self, balancer: AgentLoadBalancer, transport: httpx.AsyncBaseTransport) -> None:
+        """LoadBalancingTransport 인스턴스를 초기화한다.
+
+        Args:
+            balancer (AgentLoadBalancer): 복제본 풀을 가진 로드 밸런서.
+            transport (httpx.AsyncBaseTransport): 실제 요청을 보낼 전송 계층.
+        """
+        self._balancer = balancer
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """복제본을 골라 요청을 보낸다. 연결 수립에 실패하면 복제본을 배제하고 다른 복제본으로 재시도한다."""
+        pool = self._balancer.pool_for(request.url)
+        if pool is None:
+            return await self._transport.handle_async_request(request)
+
+        tried: set[str] = set()
+        while True:
+            replica = pool.pick(exclude=tried)
+            if replica is None:
+                raise httpx.ConnectError(f"All replicas of {pool.name} failed", request=request)
+            tried.add(replica.origin)
+            replica.outstanding += 1
+            try:
+                response = await self._transport.handle_async_request(_route(request, replica.url))
+            except (httpx.ConnectError, httpx.ConnectTimeout) as exc:
+                replica.outstanding -= 1
+                if len(pool.replicas) > 1:
+                    self._balancer.eject(replica, type(exc).__name__)
+                if len(tried) >= len(pool.replicas):
+                    raise
+                continue
+            except BaseException:
+                replica.outstanding -= 1
+                raise
+            response.stream = _TrackedStream(response.stream, replica)
+            return response
+
+    async def aclose(self) -> None:
+        """실제 전송 계층을 닫는다."""
+        await self._transport.aclose()
+
+
+class _TrackedStream(httpx.AsyncByteStream):
+    """응답 본문을 다 읽거나 닫을 때 복제본의 처리 중 요청 수를 줄이는 스트림."""
+
+    def __init__(self, stream: httpx.AsyncByteStream | httpx.SyncByteStream | Any, replica: _Replica) -> None:
+        """_TrackedStream 인스턴스를 초기화한다."""
+        self._stream = stream
+        self._replica: _Replica | None = replica
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """원본 스트림을 그대로 전달한다."""
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        """원본 스트림을 닫고 처리 중 요청 수를 한 번만 줄인다."""
+        if self._replica is not None:
+            self._replica.outstanding -= 1
+            self._replica = None
+        await self._stream.aclose()
+
+
+def _route(request: httpx.Request, base_url: httpx.URL) -> httpx.Request:
+    """요청을 복제본 주소로 보내도록 복사한다. 호출자에게 보이는 원래 요청은 바꾸지 않는다."""
+    url = request.url.copy_with(scheme=base_url.scheme, host=base_url.host, port=base_url.port)
+    headers = request.headers.copy()
+    headers["Host"] = url.netloc.decode("ascii")
+    return httpx.Request(request.method, url, headers=headers, stream=request.stream, extensions=request.extensions)
+
+
+def _origin(url: httpx.URL) -> str:
+    """URL의 scheme://host:port 부분을 반환한다. 기본 포트는 생략하지 않는다."""
+    port = url.port or (443 if url.scheme == "https" else 80)
+    return f"{url.scheme}://{url.host}:{port}"
+
+
+def register_sub_agent(name: str) -> list[str]:
+    """설정의 서브 에이전트 복제본을 공유 로드 밸런서에 등록하고 base URL 목록을 반환한다."""
+    endpoints = sub_agent_endpoints(name)
+    AGENT_BALANCER.register(name, endpoints)
+    return endpoints
+
+
+def create_load_balancing_transport() -> LoadBalancingTransport:
+    """공유 로드 밸런서와 풀링된 기본 전송 계층으로 로드 밸런싱 전송 계층을 만든다."""
+    return LoadBalancingTransport(
+        AGENT_BALANCER, httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE, limits=DEFAULT_LIMITS)
+    )
+
+
+AGENT_BALANCER = AgentLoadBalancer()
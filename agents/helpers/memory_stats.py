@@ -0,0 +1,33 @@
+"""메모리 저장소 사용량 통계 레지스트리 모듈.
+
+ADK Runner 서비스와 태스크 저장소가 `stats()`를 등록하고, `/health`와 `/metrics`가 이를 수집한다.
+헬스 체크 경로가 ADK를 임포트하지 않도록 서비스 구현과 분리되어 있다.
+"""
+
+from __future__ import annotations
+
+import weakref
+from typing import Any
+
+# 사용량 통계 수집 대상 (통계 이름 → 인스턴스)
+_REGISTRY: weakref.WeakValueDictionary[str, Any] = weakref.WeakValueDictionary()
+
+
+def register_memory_stats(name: str, target: Any) -> None:
+    """`stats()` 메서드를 가진 객체를 사용량 통계 수집 대상에 등록한다.
+
+    Args:
+        name (str): 통계 이름.
+        target (Any): `stats()` 메서드를 가진 객체. 없으면 등록하지 않는다.
+    """
+    if callable(getattr(target, "stats", None)):
+        _REGISTRY[name] = target
+
+
+def collect_memory_stats() -> dict[str, dict[str, int]]:
+    """등록된 Runner 서비스의 사용량 통계를 수집한다.
+
+    Returns:
+        dict[str, dict[str, int]]: 서비스 이름별 사용량 통계.
+    """
+    return {name: service.stats() for name, service in list(_REGISTRY.items())}
@@ -0,0 +1,97 @@
+"""에이전트 서버 메트릭 계측 모듈.
+
+HTTP 요청 지연 시간/동시 처리 수를 기록하는 ASGI 미들웨어와 `/metrics` 엔드포인트를 제공한다.
+툴 실행 시간은 `agents.helpers.metrics_plugin`의 ADK 플러그인이 기록한다.
+"""
+
+from __future__ import annotations
+
+import time
+
+from a2a.server.apps import A2AFastAPIApplication
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from agents.helpers.memory_stats import collect_memory_stats
+from common.metrics import CONTENT_TYPE, REGISTRY, CollectedFamily
+
+HTTP_REQUEST_DURATION_SECONDS = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency in seconds until the response body (including streams) completes.",
+    ("method", "path", "status"),
+)
+HTTP_REQUESTS_IN_FLIGHT = REGISTRY.gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served.",
+)
+
+# 라우트에 없는 경로는 라벨 카디널리티를 제한하기 위해 하나로 묶는다.
+_OTHER_PATH_LABEL = "other"
+
+
+class MetricsMiddleware:
+    """HTTP 요청 지연 시간과 동시 처리 수를 기록하는 ASGI 미들웨어."""
+
+    def __init__(self, app: ASGIApp, known_paths: frozenset[str]) -> None:
+        """MetricsMiddleware 인스턴스를 초기화한다.
+
+        Args:
+            app (ASGIApp): 감쌀 ASGI 앱.
+            known_paths (frozenset[str]): 경로 라벨로 그대로 사용할 라우트 경로 집합.
+        """
+        self.app = app
+        self.known_paths = known_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """요청을 처리하고 지연 시간을 기록한다."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope.get("path", "")
+        path_label = path if path in self.known_paths else _OTHER_PATH_LABEL
+        status = "500"
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            HTTP_REQUEST_DURATION_SECONDS.observe(time.perf_counter() - started, scope["method"], path_label, status)
+
+
+def _collect_memory_metrics() -> list[CollectedFamily]:
+    """Runner 서비스와 태스크 저장소 사용량을 메트릭으로 변환한다."""
+    samples = [
+        ({"store": store, "field": field}, value)
+        for store, stats in collect_memory_stats().items()
+        for field, value in stats.items()
+    ]
+    return [("agent_store_usage", "gauge", "Bounded store usage (entries, bytes, evictions).", samples)]
+
+
+REGISTRY.register_collector("memory", _collect_memory_metrics)
+
+
+def attach_http_metrics(app: A2AFastAPIApplication) -> None:
+    """HTTP /metrics 엔드포인트와 요청 계측 미들웨어를 추가한다.
+
+    라우트 등록이 끝난 뒤 호출해야 해당 경로가 라벨로 구분된다.
+    """
+    router = APIRouter()
+
+    @router.get("/metrics", include_in_schema=False)
+    async def metrics() -> PlainTextResponse:
+        return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+    app.include_router(router)
+    known_paths = frozenset(path for route in app.routes if (path := getattr(route, "path", None)))
+    app.add_middleware(MetricsMiddleware, known_paths=known_paths)
@@ -0,0 +1,59 @@
+"""ADK 툴 실행 시간 계측 플러그인 모듈.
+
+Runner를 구성할 때만 임포트되므로, 서버 시작 경로(헬스 체크, `/metrics`)는 ADK를 임포트하지 않는다.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from google.adk.plugins.base_plugin import BasePlugin
+from google.adk.tools.base_tool import BaseTool
+from google.adk.tools.tool_context import ToolContext
+
+from common.metrics import TOOL_DURATION_SECONDS
+
+
+class MetricsPlugin(BasePlugin):
+    """툴 실행 시간을 기록하는 ADK 플러그인.
+
+    오케스트레이터에서는 원격 에이전트 툴 호출이 곧 파이프라인 단계이므로 단계별 지연 시간도 함께 기록된다.
+    """
+
+    def __init__(self) -> None:
+        """MetricsPlugin 인스턴스를 초기화한다."""
+        super().__init__(name="metrics")
+        self._started: dict[str, float] = {}
+
+    async def before_tool_callback(
+        self, *, tool: BaseTool, tool_args: dict[str, Any], tool_context: ToolContext
+    ) -> dict | None:
+        """툴 실행 시작 시각을 기록한다."""
+        self._started[_call_key(tool, tool_context)] = time.perf_counter()
+        return None
+
+    async def after_tool_callback(
+        self, *, tool: BaseTool, tool_args: dict[str, Any], tool_context: ToolContext, result: dict
+    ) -> dict | None:
+        """툴 실행 시간을 기록한다."""
+        self._observe(tool, tool_context, "ok")
+        return None
+
+    async def on_tool_error_callback(
+        self, *, tool: BaseTool, tool_args: dict[str, Any], tool_context: ToolContext, error: Exception
+    ) -> dict | None:
+        """실패한 툴 실행 시간을 기록한다."""
+        self._observe(tool, tool_context, "error")
+        return None
+
+    def _observe(self, tool: BaseTool, tool_context: ToolContext, status: str) -> None:
+        """시작 시각을 꺼내 실행 시간을 히스토그램에 기록한다."""
+        started = self._started.pop(_call_key(tool, tool_context), None)
+        if started is not None:
+            TOOL_DURATION_SECONDS.observe(time.perf_counter() - started, tool_context.agent_name, tool.name, status)
+
+
+def _call_key(tool: BaseTool, tool_context: ToolContext) -> str:
+    """툴 호출 식별 키를 반환한다."""
+    return f"{tool_context.invocation_id}:{tool_context.function_call_id or tool.name}"
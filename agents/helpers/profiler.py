@@ -0,0 +1,324 @@
+"""요청 단위 온디맨드 샘플링 프로파일러 모듈.
+
+`X-Profile-Request` 헤더 또는 A2A 메시지 메타데이터의 `profile` 플래그가 있는 요청에 대해서만
+백그라운드 스레드가 스택을 주기적으로 샘플링한다. 결과는 flamegraph.pl/speedscope에서 읽을 수 있는
+folded stack 형식 파일로 저장하고 `/profiles` 엔드포인트로 내려받는다. 플래그가 없는 요청에는
+헤더/메타데이터 확인 외의 비용이 없다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from types import FrameType
+from typing import Any
+from uuid import uuid4
+
+from a2a.server.apps import A2AFastAPIApplication
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from common.logger import get_logger
+from common.settings import AppSettings, settings
+
+logger = get_logger(__name__)
+
+PROFILE_HEADER = b"x-profile-request"
+PROFILE_ID_HEADER = b"x-profile-id"
+PROFILE_METADATA_KEY = "profile"
+PROFILE_FILE_SUFFIX = ".folded"
+MAX_STACK_DEPTH = 128
+
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+_PROFILE_ID_PATTERN = re.compile(r"^[A-Za-z0-9_.-]{1,128}$")
+
+# 현재 요청(및 그 요청이 만든 하위 태스크)의 프로파일 ID
+_ACTIVE_PROFILE: contextvars.ContextVar[str | None] = contextvars.ContextVar("active_profile", default=None)
+
+
+class _ProfileSession:
+    """진행 중인 프로파일 세션의 샘플 집계."""
+
+    __slots__ = ("profile_id", "started_at", "samples", "thread_samples")
+
+    def __init__(self, profile_id: str) -> None:
+        """_ProfileSession 인스턴스를 초기화한다."""
+        self.profile_id = profile_id
+        self.started_at = time.monotonic()
+        self.samples: Counter[str] = Counter()
+        self.thread_samples = 0
+
+
+def _fold_stack(frame: FrameType | None) -> str:
+    """프레임 체인을 루트부터 `;`로 이은 folded stack 문자열로 변환한다."""
+    names: list[str] = []
+    while frame is not None and len(names) < MAX_STACK_DEPTH:
+        code = frame.f_code
+        names.append(f"{code.co_qualname} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+        frame = frame.f_back
+    names.reverse()
+    return ";".join(names)
+
+
+class RequestProfiler:
+    """요청 단위 샘플링 프로파일러.
+
+    프로파일 세션이 하나 이상 있을 때만 샘플링 스레드가 동작한다. 이벤트 루프 스레드의 샘플은 현재 실행 중인
+    asyncio 태스크의 컨텍스트로 요청을 구분하고, 워커 스레드(`asyncio.to_thread`) 샘플은 프로파일 중인 요청이
+    하나일 때만 `[thread:<이름>]` 루트로 구분하여 포함한다.
+    """
+
+    def __init__(self, *, output_dir: str, interval_sec: float, max_duration_sec: float, max_files: int) -> None:
+        """RequestProfiler 인스턴스를 초기화한다.
+
+        Args:
+            output_dir (str): 프로파일 파일 저장 디렉터리.
+            interval_sec (float): 샘플링 주기(초).
+            max_duration_sec (float): 세션당 최대 샘플링 시간(초). 초과하면 샘플링을 멈춘다.
+            max_files (int): 보관할 최대 프로파일 파일 수. 초과하면 오래된 파일부터 삭제한다.
+        """
+        self._output_dir = Path(output_dir)
+        self._interval_sec = max(0.001, interval_sec)
+        self._max_duration_sec = max_duration_sec
+        self._max_files = max(1, max_files)
+        self._sessions: dict[str, _ProfileSession] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+
+    @asynccontextmanager
+    async def session(self, profile_id: str | None = None) -> AsyncIterator[str | None]:
+        """블록 실행 동안 현재 요청을 프로파일링한다.
+
+        이미 프로파일 중인 요청 안에서 호출되면 새 세션을 만들지 않는다.
+
+        Args:
+            profile_id (str | None): 프로파일 ID. 없거나 형식이 맞지 않으면 새로 생성한다.
+
+        Yields:
+            str | None: 프로파일 ID. 중첩 호출이면 None.
+        """
+        if _ACTIVE_PROFILE.get() is not None:
+            yield None
+            return
+
+        if not profile_id or not _PROFILE_ID_PATTERN.match(profile_id):
+            profile_id = uuid4().hex
+        token = _ACTIVE_PROFILE.set(profile_id)
+        self._start(profile_id)
+        try:
+            yield profile_id
+        finally:
+            try:
+                _ACTIVE_PROFILE.reset(token)
+            except ValueError:
+                # 스트리밍 제너레이터가 다른 컨텍스트에서 정리된 경우
+                pass
+            await asyncio.to_thread(self._finish, profile_id)
+
+    def path_for(self, profile_id: str) -> Path | None:
+        """저장된 프로파일 파일 경로를 반환한다.
+
+        Args:
+            profile_id (str): 프로파일 ID.
+
+        Returns:
+            Path | None: 파일 경로. 없거나 ID 형식이 맞지 않으면 None.
+        """
+        if not _PROFILE_ID_PATTERN.match(profile_id):
+            return None
+        path = self._output_dir / f"{profile_id}{PROFILE_FILE_SUFFIX}"
+        return path if path.is_file() else None
+
+    def list_profiles(self) -> list[dict[str, Any]]:
+        """저장된 프로파일 목록을 최신순으로 반환한다."""
+        if not self._output_dir.is_dir():
+            return []
+        files = sorted(self._output_dir.glob(f"*{PROFILE_FILE_SUFFIX}"), key=lambda p: p.stat().st_mtime, reverse=True)
+        return [
+            {"profile_id": path.stem, "bytes": path.stat().st_size, "created_at": path.stat().st_mtime}
+            for path in files
+        ]
+
+    def _start(self, profile_id: str) -> None:
+        """세션을 등록하고 필요하면 샘플링 스레드를 시작한다."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._sessions[profile_id] = _ProfileSession(profile_id)
+            self._loop = loop
+            self._loop_thread_id = threading.get_ident()
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._sample_loop, name="request-profiler", daemon=True)
+                self._thread.start()
+        logger.info("Request profiling started profile_id=%s", profile_id)
+
+    def _finish(self, profile_id: str) -> None:
+        """세션을 종료하고 folded stack 파일로 저장한다."""
+        with self._lock:
+            session = self._sessions.pop(profile_id, None)
+        if session is None:
+            return
+
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        path = self._output_dir / f"{profile_id}{PROFILE_FILE_SUFFIX}"
+        lines = [f"{stack} {count}" for stack, count in session.samples.most_common()]
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        logger.info(
+            "Request profiling finished profile_id=%s samples=%s thread_samples=%s duration=%.2fs path=%s",
+            profile_id,
+            sum(session.samples.values()),
+            session.thread_samples,
+            time.monotonic() - session.started_at,
+            path,
+        )
+        self._prune()
+
+    def _prune(self) -> None:
+        """보관 개수를 넘는 오래된 프로파일 파일을 삭제한다."""
+        files = sorted(self._output_dir.glob(f"*{PROFILE_FILE_SUFFIX}"), key=lambda p: p.stat().st_mtime)
+        for path in files[: max(0, len(files) - self._max_files)]:
+            path.unlink(missing_ok=True)
+
+    def _sample_loop(self) -> None:
+        """세션이 남아 있는 동안 주기적으로 스택을 샘플링한다."""
+        own_thread_id = threading.get_ident()
+        while True:
+            with self._lock:
+                if not self._sessions:
+                    self._thread = None
+                    return
+                now = time.monotonic()
+                sessions = {
+                    profile_id: session
+                    for profile_id, session in self._sessions.items()
+                    if now - session.started_at <= self._max_duration_sec
+                }
+                # 세션 종료(_finish)와 샘플 집계가 겹치지 않도록 잠금 안에서 샘플링한다.
+                if sessions:
+                    self._sample(sessions, self._loop, self._loop_thread_id, own_thread_id)
+            time.sleep(self._interval_sec)
+
+    def _sample(
+        self,
+        sessions: dict[str, _ProfileSession],
+        loop: asyncio.AbstractEventLoop | None,
+        loop_thread_id: int | None,
+        own_thread_id: int,
+    ) -> None:
+        """모든 스레드의 현재 스택을 한 번 샘플링하여 세션에 반영한다."""
+        frames = sys._current_frames()
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        single_session = next(iter(sessions.values())) if len(sessions) == 1 else None
+
+        for thread_id, frame in frames.items():
+            if thread_id == own_thread_id:
+                continue
+            if thread_id == loop_thread_id and loop is not None:
+                task = asyncio.current_task(loop)
+                profile_id = task.get_context().get(_ACTIVE_PROFILE) if task is not None else None
+                session = sessions.get(profile_id) if profile_id else None
+                if session is not None:
+                    session.samples[_fold_stack(frame)] += 1
+            elif single_session is not None and thread_names.get(thread_id, "").startswith("asyncio_"):
+                stack = _fold_stack(frame)
+                single_session.samples[f"[thread:{thread_names[thread_id]}];{stack}"] += 1
+                single_session.thread_samples += 1
+
+
+def create_request_profiler(app_settings: AppSettings) -> RequestProfiler:
+    """설정에 따라 요청 프로파일러를 생성한다.
+
+    Args:
+        app_settings (AppSettings): 애플리케이션 설정.
+
+    Returns:
+        RequestProfiler: 요청 프로파일러.
+    """
+    return RequestProfiler(
+        output_dir=app_settings.profiling_dir,
+        interval_sec=app_settings.profiling_interval_ms / 1000,
+        max_duration_sec=app_settings.profiling_max_duration_sec,
+        max_files=app_settings.profiling_max_files,
+    )
+
+
+PROFILER = create_request_profiler(settings)
+
+
+def is_profile_requested(metadata: dict[str, Any] | None) -> bool:
+    """A2A 메타데이터에 프로파일 플래그가 있는지 확인한다."""
+    if not settings.profiling_enabled or not metadata:
+        return False
+    value = metadata.get(PROFILE_METADATA_KEY)
+    return value is True or str(value).lower() in _TRUTHY
+
+
+class ProfilingMiddleware:
+    """`X-Profile-Request` 헤더가 있는 요청을 프로파일링하는 ASGI 미들웨어.
+
+    헤더 값이 ID 형식이면 프로파일 ID로 사용하고, 응답에 `X-Profile-Id` 헤더로 ID를 돌려준다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """ProfilingMiddleware 인스턴스를 초기화한다."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """헤더가 있으면 요청 처리 전체를 프로파일 세션 안에서 실행한다."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        requested = next((value for key, value in scope.get("headers", []) if key == PROFILE_HEADER), None)
+        if requested is None:
+            await self.app(scope, receive, send)
+            return
+
+        value = requested.decode("latin-1").strip()
+        async with PROFILER.session(None if value.lower() in _TRUTHY else value) as profile_id:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start" and profile_id:
+                    message["headers"] = [
+                        *message.get("headers", []),
+                        (PROFILE_ID_HEADER, profile_id.encode("latin-1")),
+                    ]
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+
+def attach_http_profiling(app: A2AFastAPIApplication) -> None:
+    """요청 프로파일링 미들웨어와 `/profiles` 다운로드 엔드포인트를 추가한다.
+
+    `profiling_enabled` 설정이 꺼져 있으면 아무것도 추가하지 않는다.
+    """
+    if not settings.profiling_enabled:
+        return
+
+    router = APIRouter()
+
+    @router.get("/profiles")
+    async def list_profiles() -> list[dict[str, Any]]:
+        return await asyncio.to_thread(PROFILER.list_profiles)
+
+    @router.get("/profiles/{profile_id}")
+    async def download_profile(profile_id: str) -> FileResponse:
+        path = PROFILER.path_for(profile_id)
+        if path is None:
+            raise HTTPException(status_code=404, detail="Profile not found")
+        return FileResponse(path, media_type="text/plain", filename=path.name)
+
+    app.include_router(router)
+    app.add_middleware(ProfilingMiddleware)
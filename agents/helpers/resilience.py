@@ -0,0 +1,290 @@
+"""서브 에이전트 호출 서킷 브레이커 및 헤지 요청 모듈.
+
+서브 에이전트 호출용 공유 HTTP 클라이언트의 전송 계층에서 서브 에이전트별로 다음을 적용한다.
+
+- 서킷 브레이커: 연속 실패(전송 오류, 5xx)가 임계치에 이르면 일정 시간 즉시 실패시키고,
+  이후 한 건의 시험 요청이 성공하면 다시 닫는다.
+- 헤지 요청: 멱등한 서브 에이전트(`hedge_agents`) 호출이 최근 지연 시간의 백분위수를 넘기면 같은 요청을
+  한 번 더 보내고(복제본이 여럿이면 로드 밸런서가 다른 복제본을 고른다) 먼저 끝난 응답을 사용한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import threading
+import time
+from collections import deque
+from typing import Any
+
+import httpx
+
+from agents.helpers.load_balancer import AGENT_BALANCER, AgentLoadBalancer, create_load_balancing_transport
+from common.deadline import expired
+from common.logger import get_logger
+from common.metrics import REGISTRY
+from common.settings import settings
+
+logger = get_logger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+_STATE_VALUES = {STATE_CLOSED: 0.0, STATE_HALF_OPEN: 1.0, STATE_OPEN: 2.0}
+LATENCY_HISTORY_SIZE = 200
+
+_BREAKERS: dict[str, CircuitBreaker] = {}
+_LATENCIES: dict[str, _LatencyTracker] = {}
+
+CIRCUIT_BREAKER_STATE = REGISTRY.gauge(
+    "circuit_breaker_state",
+    "Sub-agent circuit breaker state (0=closed, 1=half_open, 2=open).",
+    ("agent",),
+)
+CIRCUIT_BREAKER_REJECTIONS_TOTAL = REGISTRY.counter(
+    "circuit_breaker_rejections_total",
+    "Sub-agent calls rejected while the circuit breaker was open.",
+    ("agent",),
+)
+HEDGED_REQUESTS_TOTAL = REGISTRY.counter(
+    "hedged_requests_total",
+    "Hedged sub-agent calls by which attempt answered first.",
+    ("agent", "winner"),
+)
+
+
+class CircuitOpenError(httpx.TransportError):
+    """서킷 브레이커가 열려 서브 에이전트 호출을 보내지 않았을 때 발생하는 예외."""
+
+
+class CircuitBreaker:
+    """연속 실패 횟수 기반 서킷 브레이커."""
+
+    def __init__(self, name: str, failure_threshold: int, reset_sec: float) -> None:
+        """CircuitBreaker 인스턴스를 초기화한다.
+
+        Args:
+            name (str): 서브 에이전트 이름.
+            failure_threshold (int): 서킷을 여는 연속 실패 횟수.
+            reset_sec (float): 서킷을 연 뒤 시험 요청을 허용하기까지의 시간(초).
+        """
+        self.name = name
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_sec = reset_sec
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+        CIRCUIT_BREAKER_STATE.set(name, value=_STATE_VALUES[STATE_CLOSED])
+
+    @property
+    def state(self) -> str:
+        """현재 상태("closed", "open", "half_open")."""
+        return self._state
+
+    def allow(self) -> bool:
+        """요청을 보내도 되는지 확인한다. 열린 뒤 `reset_sec`이 지나면 시험 요청 한 건만 허용한다."""
+        with self._lock:
+            if self._state == STATE_CLOSED:
+                return True
+            if self._state == STATE_OPEN and time.monotonic() - self._opened_at >= self._reset_sec:
+                self._transition(STATE_HALF_OPEN)
+            if self._state == STATE_HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """성공을 기록한다. 시험 요청이 성공하면 서킷을 닫는다."""
+        with self._lock:
+            self._failures = 0
+            self._probe_in_flight = False
+            if self._state != STATE_CLOSED:
+                self._transition(STATE_CLOSED)
+
+    def record_failure(self) -> None:
+        """실패를 기록한다. 연속 실패가 임계치에 이르거나 시험 요청이 실패하면 서킷을 연다."""
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._state == STATE_HALF_OPEN or self._failures >= self._failure_threshold:
+                self._opened_at = time.monotonic()
+                if self._state != STATE_OPEN:
+                    self._transition(STATE_OPEN)
+
+    def release(self) -> None:
+        """결과를 판단할 수 없이 중단된(취소된) 요청의 시험 요청 슬롯을 되돌린다."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def snapshot(self) -> dict[str, Any]:
+        """상태 요약을 반환한다."""
+        return {"state": self._state, "consecutive_failures": self._failures}
+
+    def _transition(self, state: str) -> None:
+        """상태를 바꾸고 로그와 메트릭에 기록한다. 잠금을 잡은 상태에서 호출한다."""
+        logger.info("Circuit breaker agent=%s state=%s->%s failures=%s", self.name, self._state, state, self._failures)
+        self._state = state
+        CIRCUIT_BREAKER_STATE.set(self.name, value=_STATE_VALUES[state])
+
+
+class _LatencyTracker:
+    """성공한 호출의 최근 지연 시간 이력."""
+
+    def __init__(self) -> None:
+        """_LatencyTracker 인스턴스를 초기화한다."""
+        self._samples: deque[float] = deque(maxlen=LATENCY_HISTORY_SIZE)
+
+    def observe(self, latency_sec: float) -> None:
+        """지연 시간을 기록한다."""
+        self._samples.append(latency_sec)
+
+    def percentile(self, percentile: float, min_samples: int) -> float | None:
+        """지연 시간 백분위수(초)를 반환한다. 표본이 부족하면 None."""
+        if len(self._samples) < max(2, min_samples):
+            return None
+        cut_points = statistics.quantiles(self._samples, n=100, method="inclusive")
+        index = min(98, max(0, round(percentile) - 1))
+        return cut_points[index]
+
+
+class ResilientTransport(httpx.AsyncBaseTransport):
+    """서브 에이전트별 서킷 브레이커와 헤지 요청을 적용하는 httpx 전송 계층."""
+
+    def __init__(self, balancer: AgentLoadBalancer, transport: httpx.AsyncBaseTransport) -> None:
+        """ResilientTransport 인스턴스를 초기화한다.
+
+        Args:
+            balancer (AgentLoadBalancer): 요청 URL을 서브 에이전트 이름으로 매핑할 로드 밸런서.
+            transport (httpx.AsyncBaseTransport): 실제 요청을 보낼 전송 계층.
+        """
+        self._balancer = balancer
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """서킷 브레이커를 확인한 뒤 요청을 보내고(필요하면 헤지하여) 결과를 기록한다."""
+        pool = self._balancer.pool_for(request.url)
+        if pool is None:
+            return await self._transport.handle_async_request(request)
+
+        breaker = get_circuit_breaker(pool.name)
+        if not breaker.allow():
+            CIRCUIT_BREAKER_REJECTIONS_TOTAL.inc(pool.name)
+            raise CircuitOpenError(f"Circuit breaker for {pool.name} is open", request=request)
+
+        started = time.monotonic()
+        try:
+            hedge_delay = _hedge_delay(pool.name) if _hedgeable(pool.name, request) else None
+            if hedge_delay is None:
+                response = await self._transport.handle_async_request(request)
+            else:
+                response = await self._send_hedged(pool.name, request, hedge_delay)
+        except httpx.TransportError:
+            # 호출자의 데드라인이 다해 끊긴 요청은 서브 에이전트 실패로 세지 않는다.
+            if expired():
+                breaker.release()
+            else:
+                breaker.record_failure()
+            raise
+        except BaseException:
+            # 취소 등 서브 에이전트 상태와 무관한 중단은 실패로 세지 않는다.
+            breaker.release()
+            raise
+
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+            if request.method == "POST":
+                _LATENCIES.setdefault(pool.name, _LatencyTracker()).observe(time.monotonic() - started)
+        return response
+
+    async def aclose(self) -> None:
+        """실제 전송 계층을 닫는다."""
+        await self._transport.aclose()
+
+    async def _send_hedged(self, name: str, request: httpx.Request, hedge_delay: float) -> httpx.Response:
+        """첫 요청이 `hedge_delay` 안에 끝나지 않으면 같은 요청을 한 번 더 보내고 먼저 성공한 응답을 반환한다."""
+        primary = asyncio.create_task(self._transport.handle_async_request(request))
+        pending = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=hedge_delay)
+            if done:
+                return primary.result()
+
+            logger.info("Hedging request agent=%s after_sec=%.2f", name, hedge_delay)
+            hedge = asyncio.create_task(self._transport.handle_async_request(request))
+            attempts = {primary: "primary", hedge: "hedge"}
+            pending = set(attempts)
+            winner: asyncio.Task[httpx.Response] | None = None
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next(
+                    (task for task in done if task.exception() is None and task.result().status_code < 500), None
+                )
+            if winner is None:
+                # 둘 다 실패하면 첫 요청의 결과(응답 또는 예외)를 그대로 전달한다.
+                HEDGED_REQUESTS_TOTAL.inc(name, "none")
+                winner = primary
+            else:
+                HEDGED_REQUESTS_TOTAL.inc(name, attempts[winner])
+            # 반환하지 않는 완료 응답(예: 먼저 끝난 5xx 응답)을 닫아 연결과 처리 중 요청 수를 반환한다.
+            for task in attempts:
+                if task is not winner and task.done() and task.exception() is None:
+                    await task.result().aclose()
+            return winner.result()
+        finally:
+            for task in pending:
+                task.cancel()
+                task.add_done_callback(_close_abandoned_response)
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """서브 에이전트의 서킷 브레이커를 반환한다. 처음 호출할 때 생성한다."""
+    breaker = _BREAKERS.get(name)
+    if breaker is None:
+        breaker = _BREAKERS.setdefault(
+            name, CircuitBreaker(name, settings.breaker_failure_threshold, settings.breaker_reset_sec)
+        )
+    return breaker
+
+
+def circuit_snapshot() -> dict[str, Any]:
+    """서브 에이전트별 서킷 브레이커 상태와 헤지 지연 기준(초)을 반환한다."""
+    return {name: {**breaker.snapshot(), "hedge_after_sec": _hedge_delay(name)} for name, breaker in _BREAKERS.items()}
+
+
+def _hedge_agents() -> set[str]:
+    """헤지 요청을 허용한 서브 에이전트 이름 집합."""
+    return {name.strip() for name in settings.hedge_agents.split(",") if name.strip()}
+
+
+def _hedgeable(name: str, request: httpx.Request) -> bool:
+    """헤지 대상 요청인지 확인한다. 멱등한 서브 에이전트의 비스트리밍 메시지 전송만 헤지한다."""
+    return (
+        name in _hedge_agents()
+        and request.method == "POST"
+        and "text/event-stream" not in request.headers.get("accept", "")
+        and isinstance(request.stream, httpx.ByteStream)
+    )
+
+
+def _hedge_delay(name: str) -> float | None:
+    """헤지 요청을 보낼 지연 기준(초). 헤지 대상이 아니거나 표본이 부족하면 None."""
+    tracker = _LATENCIES.get(name)
+    if tracker is None or name not in _hedge_agents():
+        return None
+    return tracker.percentile(settings.hedge_percentile, settings.hedge_min_samples)
+
+
+def _close_abandoned_response(task: asyncio.Task[httpx.Response]) -> None:
+    """취소 전에 끝난 헤지 패배 요청의 응답을 닫아 연결과 처리 중 요청 수를 반환한다."""
+    if task.cancelled() or task.exception() is not None:
+        return
+    asyncio.ensure_future(task.result().aclose())
+
+
+def create_resilient_transport() -> ResilientTransport:
+    """로드 밸런싱 전송 계층 위에 서킷 브레이커와 헤지 요청을 적용한 전송 계층을 만든다."""
+    return ResilientTransport(AGENT_BALANCER, create_load_balancing_transport())
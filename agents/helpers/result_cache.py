@@ -0,0 +1,39 @@
+"""오케스트레이터 파이프라인 결과 캐시 요청 처리 모듈.
+
+`Cache-Control: no-cache`(또는 no-store, max-age=0) 요청은 결과 캐시를 건너뛰고 파이프라인을 새로 실행한다.
+`no-cache` 요청의 새 결과는 다시 캐시에 저장되므로 대시보드에서 강제 새로고침에 사용할 수 있다.
+`no-store` 요청(예: 워치리스트 증분 실행)의 결과는 캐시에 저장하지 않는다.
+"""
+
+from __future__ import annotations
+
+from a2a.server.apps import A2AFastAPIApplication
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from common.result_cache import cache_bypass_scope, is_cache_bypass_requested, is_cache_store_forbidden
+
+
+class ResultCacheMiddleware:
+    """요청의 `Cache-Control` 헤더에 따라 결과 캐시 사용 여부를 설정하는 ASGI 미들웨어."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """ResultCacheMiddleware 인스턴스를 초기화한다."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """캐시 우회 요청이면 우회 컨텍스트 안에서 처리한다."""
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        cache_control = Headers(scope=scope).get("cache-control")
+        with cache_bypass_scope(
+            is_cache_bypass_requested(cache_control), no_store=is_cache_store_forbidden(cache_control)
+        ):
+            await self.app(scope, receive, send)
+
+
+def attach_http_result_cache(app: A2AFastAPIApplication) -> None:
+    """결과 캐시 우회 헤더를 처리하는 미들웨어를 추가한다."""
+    app.add_middleware(ResultCacheMiddleware)
@@ -0,0 +1,571 @@
+"""오케스트레이터 실행 승인 제어 및 공정 스케줄링 모듈.
+
+동시에 들어오는 파이프라인 실행(`message/send`, `message/stream`)을 다음 규칙으로 승인한다.
+
+- 동시 실행 수는 `scheduler_max_runs`로 제한하고, 나머지는 길이가 제한된 대기열에서 기다린다.
+  대기열이 가득 차거나 대기 시간이 `scheduler_queue_timeout_sec`(또는 남은 데드라인)를 넘으면 503으로 거절한다.
+- 대기열은 우선순위 레인(interactive, batch)으로 나뉜다. 대화형 실행을 먼저 승인하되,
+  `scheduler_batch_every`번째 슬롯마다 대기 중인 배치 실행에 양보하여 배치 실행이 굶지 않게 한다.
+- 레인 안에서는 테넌트를 순환하며 승인하고, 테넌트별 동시 실행 수와 대기 수를 제한한다.
+
+서브 에이전트 호출은 `StageLimitTransport`가 서브 에이전트(단계)별 동시 호출 수를 프로세스 전역으로 제한한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+import httpx
+from a2a.server.apps import A2AFastAPIApplication
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from agents.helpers.load_balancer import AGENT_BALANCER, AgentLoadBalancer
+from agents.helpers.resilience import create_resilient_transport
+from common import fast_json
+from common.deadline import remaining
+from common.logger import get_logger
+from common.metrics import REGISTRY
+from common.settings import settings
+
+logger = get_logger(__name__)
+
+TENANT_HEADER = "x-tenant-id"
+PRIORITY_HEADER = "x-run-priority"
+QUEUE_WAIT_HEADER = "x-queue-wait-ms"
+TENANT_METADATA_KEY = "tenant"
+PRIORITY_METADATA_KEY = "priority"
+DEFAULT_TENANT = "anonymous"
+LANE_INTERACTIVE = "interactive"
+LANE_BATCH = "batch"
+LANES = (LANE_INTERACTIVE, LANE_BATCH)
+SCHEDULED_METHODS = frozenset({"message/send", "message/stream"})
+# 실행 시간 이동 평균의 가중치 (Retry-After 추정용)
+RUN_TIME_EWMA_ALPHA = 0.2
+
+SCHEDULER_RUNNING_RUNS = REGISTRY.gauge(
+    "scheduler_running_runs",
+    "Pipeline runs currently admitted by the orchestrator scheduler.",
+    ("lane",),
+)
+SCHEDULER_QUEUED_RUNS = REGISTRY.gauge(
+    "scheduler_queued_runs",
+    "Pipeline runs waiting in the orchestrator scheduler queue.",
+    ("lane",),
+)
+SCHEDULER_REJECTIONS_TOTAL = REGISTRY.counter(
+    "scheduler_rejections_total",
+    "Pipeline runs rejected by the orchestrator scheduler.",
+    ("lane", "reason"),
+)
+SCHEDULER_QUEUE_WAIT_SECONDS = REGISTRY.histogram(
+    "scheduler_queue_wait_seconds",
+    "Time pipeline runs spent waiting for admission.",
+    ("lane",),
+)
+STAGE_INFLIGHT_CALLS = REGISTRY.gauge(
+    "stage_inflight_calls",
+    "Sub-agent calls currently holding a stage concurrency slot.",
+    ("agent",),
+)
+STAGE_QUEUE_WAIT_SECONDS = REGISTRY.histogram(
+    "stage_queue_wait_seconds",
+    "Time sub-agent calls spent waiting for a stage concurrency slot.",
+    ("agent",),
+)
+
+
+class AdmissionRejected(Exception):
+    """스케줄러가 실행을 승인하지 않았을 때 발생하는 예외."""
+
+    def __init__(self, status_code: int, reason: str, retry_after_sec: int) -> None:
+        """AdmissionRejected 인스턴스를 초기화한다.
+
+        Args:
+            status_code (int): 응답 상태 코드. 전체 과부하는 503, 테넌트 한도 초과는 429.
+            reason (str): 거절 사유. 예) "queue_full".
+            retry_after_sec (int): 다시 시도하기까지 기다릴 시간(초) 추정치.
+        """
+        super().__init__(reason)
+        self.status_code = status_code
+        self.reason = reason
+        self.retry_after_sec = retry_after_sec
+
+
+class _Waiter:
+    """대기열에서 승인을 기다리는 실행 하나."""
+
+    __slots__ = ("tenant", "lane", "future")
+
+    def __init__(self, tenant: str, lane: str) -> None:
+        """_Waiter 인스턴스를 초기화한다."""
+        self.tenant = tenant
+        self.lane = lane
+        self.future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+
+class RunScheduler:
+    """우선순위 레인과 테넌트별 공정 분배를 적용하는 실행 승인 스케줄러.
+
+    하나의 이벤트 루프에서만 사용하므로 잠금 없이 상태를 갱신한다.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_runs: int,
+        queue_size: int,
+        tenant_max_runs: int,
+        tenant_queue_size: int,
+        batch_every: int,
+    ) -> None:
+        """RunScheduler 인스턴스를 초기화한다.
+
+        Args:
+            max_runs (int): 동시 실행 수 상한.
+            queue_size (int): 대기열 전체 길이 상한.
+            tenant_max_runs (int): 테넌트별 동시 실행 수 상한.
+            tenant_queue_size (int): 테넌트별 대기 수 상한.
+            batch_every (int): 배치 실행에 양보하는 슬롯 간격. 0이면 대화형 실행을 항상 먼저 승인한다.
+        """
+        self._max_runs = max(1, max_runs)
+        self._queue_size = max(0, queue_size)
+        self._tenant_max_runs = max(1, tenant_max_runs)
+        self._tenant_queue_size = max(0, tenant_queue_size)
+        self._batch_every = max(0, batch_every)
+        self._running = 0
+        self._running_by_tenant: dict[str, int] = {}
+        self._queued_by_tenant: dict[str, int] = {}
+        # 레인별로 테넌트 순환 순서를 유지하는 테넌트 -> 대기 실행 큐
+        self._queues: dict[str, OrderedDict[str, deque[_Waiter]]] = {lane: OrderedDict() for lane in LANES}
+        self._queued = 0
+        self._interactive_streak = 0
+        self._avg_run_sec: float | None = None
+
+    async def acquire(self, tenant: str, lane: str, timeout_sec: float | None) -> float:
+        """실행 슬롯을 얻을 때까지 기다린다.
+
+        Args:
+            tenant (str): 테넌트 식별자.
+            lane (str): 우선순위 레인("interactive" 또는 "batch").
+            timeout_sec (float | None): 대기열에서 기다릴 최대 시간(초). None이면 무기한.
+
+        Returns:
+            float: 대기한 시간(초).
+
+        Raises:
+            AdmissionRejected: 대기열이 가득 찼거나 대기 시간이 초과된 경우.
+        """
+        if self._running < self._max_runs and self._can_start(tenant) and not self._queued_by_tenant.get(tenant):
+            self._start(tenant, lane)
+            return 0.0
+        if self._queued >= self._queue_size:
+            self._reject(lane, 503, "queue_full")
+        if self._queued_by_tenant.get(tenant, 0) >= self._tenant_queue_size:
+            self._reject(lane, 429, "tenant_queue_full")
+
+        waiter = _Waiter(tenant, lane)
+        self._enqueue(waiter)
+        logger.info("Run queued tenant=%s lane=%s queued=%s running=%s", tenant, lane, self._queued, self._running)
+        started = time.monotonic()
+        try:
+            async with asyncio.timeout(timeout_sec):
+                await waiter.future
+        except TimeoutError:
+            # 시간 초과와 승인이 겹쳤으면 얻은 슬롯을 그대로 사용한다.
+            if not _granted(waiter):
+                self._remove(waiter)
+                self._reject(lane, 503, "queue_timeout")
+        except BaseException:
+            if _granted(waiter):
+                self.release(tenant, lane)
+            else:
+                self._remove(waiter)
+            raise
+        waited = time.monotonic() - started
+        SCHEDULER_QUEUE_WAIT_SECONDS.observe(waited, lane)
+        return waited
+
+    def release(self, tenant: str, lane: str, run_sec: float | None = None) -> None:
+        """실행 슬롯을 반환하고 대기 중인 실행을 승인한다.
+
+        Args:
+            tenant (str): 테넌트 식별자.
+            lane (str): 우선순위 레인.
+            run_sec (float | None): 실행에 걸린 시간(초). Retry-After 추정에 사용한다.
+        """
+        self._running -= 1
+        count = self._running_by_tenant.get(tenant, 0) - 1
+        if count > 0:
+            self._running_by_tenant[tenant] = count
+        else:
+            self._running_by_tenant.pop(tenant, None)
+        SCHEDULER_RUNNING_RUNS.dec(lane)
+        if run_sec is not None:
+            self._avg_run_sec = (
+                run_sec
+                if self._avg_run_sec is None
+                else (1 - RUN_TIME_EWMA_ALPHA) * self._avg_run_sec + RUN_TIME_EWMA_ALPHA * run_sec
+            )
+        self._dispatch()
+
+    def snapshot(self) -> dict[str, Any]:
+        """실행/대기 현황을 반환한다."""
+        tenants = set(self._running_by_tenant) | set(self._queued_by_tenant)
+        return {
+            "running": self._running,
+            "max_runs": self._max_runs,
+            "queued": {lane: sum(len(waiters) for waiters in queue.values()) for lane, queue in self._queues.items()},
+            "tenants": {
+                tenant: {
+                    "running": self._running_by_tenant.get(tenant, 0),
+                    "queued": self._queued_by_tenant.get(tenant, 0),
+                }
+                for tenant in sorted(tenants)
+            },
+        }
+
+    def _can_start(self, tenant: str) -> bool:
+        """테넌트가 동시 실행 한도 안에 있는지 여부."""
+        return self._running_by_tenant.get(tenant, 0) < self._tenant_max_runs
+
+    def _start(self, tenant: str, lane: str) -> None:
+        """실행 슬롯을 점유한다."""
+        self._running += 1
+        self._running_by_tenant[tenant] = self._running_by_tenant.get(tenant, 0) + 1
+        SCHEDULER_RUNNING_RUNS.inc(lane)
+
+    def _enqueue(self, waiter: _Waiter) -> None:
+        """대기열의 레인/테넌트 큐 끝에 추가한다."""
+        self._queues[waiter.lane].setdefault(waiter.tenant, deque()).append(waiter)
+        self._queued += 1
+        self._queued_by_tenant[waiter.tenant] = self._queued_by_tenant.get(waiter.tenant, 0) + 1
+        SCHEDULER_QUEUED_RUNS.inc(waiter.lane)
+
+    def _remove(self, waiter: _Waiter) -> None:
+        """대기열에서 빼낸다. 이미 빠진 실행이면 무시한다."""
+        queue = self._queues[waiter.lane]
+        waiters = queue.get(waiter.tenant)
+        if waiters is None or waiter not in waiters:
+            return
+        waiters.remove(waiter)
+        if not waiters:
+            del queue[waiter.tenant]
+        self._queued -= 1
+        count = self._queued_by_tenant[waiter.tenant] - 1
+        if count > 0:
+            self._queued_by_tenant[waiter.tenant] = count
+        else:
+            del self._queued_by_tenant[waiter.tenant]
+        SCHEDULER_QUEUED_RUNS.dec(waiter.lane)
+
+    def _dispatch(self) -> None:
+        """빈 슬롯이 있는 동안 다음 차례의 대기 실행을 승인한다."""
+        while self._running < self._max_runs and self._queued:
+            waiter = self._next_waiter()
+            if waiter is None:
+                # 대기 중인 테넌트가 모두 동시 실행 한도에 걸려 있다.
+                return
+            self._remove(waiter)
+            if waiter.future.done():
+                continue
+            if waiter.lane == LANE_BATCH:
+                self._interactive_streak = 0
+            elif self._queues[LANE_BATCH]:
+                self._interactive_streak += 1
+            self._start(waiter.tenant, waiter.lane)
+            waiter.future.set_result(None)
+
+    def _next_waiter(self) -> _Waiter | None:
+        """레인 우선순위와 테넌트 순환 순서에 따라 다음에 승인할 실행을 고른다."""
+        lanes = LANES
+        if self._batch_every and self._interactive_streak >= self._batch_every - 1:
+            lanes = (LANE_BATCH, LANE_INTERACTIVE)
+        for lane in lanes:
+            queue = self._queues[lane]
+            for tenant, waiters in queue.items():
+                if self._can_start(tenant):
+                    # 승인한 테넌트는 레인 순환 순서의 맨 뒤로 보낸다.
+                    queue.move_to_end(tenant)
+                    return waiters[0]
+        return None
+
+    def _reject(self, lane: str, status_code: int, reason: str) -> None:
+        """거절을 기록하고 AdmissionRejected를 발생시킨다."""
+        SCHEDULER_REJECTIONS_TOTAL.inc(lane, reason)
+        logger.info("Run rejected lane=%s reason=%s queued=%s running=%s", lane, reason, self._queued, self._running)
+        raise AdmissionRejected(status_code, reason, self._retry_after_sec())
+
+    def _retry_after_sec(self) -> int:
+        """대기열이 빠질 때까지의 시간(초)을 평균 실행 시간으로 추정한다."""
+        if self._avg_run_sec is None:
+            return 1
+        return max(1, math.ceil(self._avg_run_sec * (self._queued + 1) / self._max_runs))
+
+
+def _granted(waiter: _Waiter) -> bool:
+    """대기 실행이 슬롯을 받았는지 여부."""
+    return waiter.future.done() and not waiter.future.cancelled()
+
+
+class AdmissionMiddleware:
+    """파이프라인 실행 요청을 스케줄러에 통과시킨 뒤 처리하는 ASGI 미들웨어.
+
+    JSON-RPC `message/send`, `message/stream` 요청만 스케줄링하고, 태스크 조회/취소 등은 그대로 통과시킨다.
+    테넌트는 `X-Tenant-Id` 헤더, 메타데이터 `tenant`, 클라이언트 주소 순으로, 레인은 `X-Run-Priority` 헤더,
+    메타데이터 `priority` 순으로 정한다. (기본값 interactive)
+    """
+
+    def __init__(self, app: ASGIApp, scheduler: RunScheduler, queue_timeout_sec: float) -> None:
+        """AdmissionMiddleware 인스턴스를 초기화한다.
+
+        Args:
+            app (ASGIApp): 감쌀 ASGI 앱.
+            scheduler (RunScheduler): 실행 승인 스케줄러.
+            queue_timeout_sec (float): 대기열에서 기다릴 최대 시간(초). 남은 데드라인이 더 짧으면 그 시간까지만 기다린다.
+        """
+        self.app = app
+        self.scheduler = scheduler
+        self.queue_timeout_sec = queue_timeout_sec
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """실행 요청이면 슬롯을 얻은 뒤 처리하고, 거절되면 503/429 응답을 보낸다."""
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        body = await _read_body(receive)
+        replay = _replay_receive(body, receive)
+        request = _parse_json_rpc(body)
+        if request is None or request.get("method") not in SCHEDULED_METHODS:
+            await self.app(scope, replay, send)
+            return
+
+        headers = Headers(scope=scope)
+        metadata = _request_metadata(request)
+        tenant = _tenant_of(headers, metadata, scope)
+        lane = _lane_of(headers, metadata)
+        timeout_sec = self.queue_timeout_sec
+        left = remaining()
+        if left is not None:
+            timeout_sec = max(0.0, min(timeout_sec, left))
+
+        try:
+            waited = await self.scheduler.acquire(tenant, lane, timeout_sec)
+        except AdmissionRejected as exc:
+            response = JSONResponse(
+                {"error": "overloaded", "reason": exc.reason},
+                status_code=exc.status_code,
+                headers={"Retry-After": str(exc.retry_after_sec)},
+            )
+            await response(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[QUEUE_WAIT_HEADER] = str(int(waited * 1000))
+            await send(message)
+
+        started = time.monotonic()
+        try:
+            await self.app(scope, replay, send_wrapper)
+        finally:
+            self.scheduler.release(tenant, lane, time.monotonic() - started)
+
+
+async def _read_body(receive: Receive) -> bytes:
+    """요청 본문을 끝까지 읽는다."""
+    chunks: list[bytes] = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+def _replay_receive(body: bytes, receive: Receive) -> Receive:
+    """이미 읽은 본문을 한 번 돌려준 뒤 원래 receive(연결 종료 감지 등)로 넘기는 receive를 만든다."""
+    replayed = False
+
+    async def replay() -> Message:
+        nonlocal replayed
+        if not replayed:
+            replayed = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return replay
+
+
+def _parse_json_rpc(body: bytes) -> dict[str, Any] | None:
+    """JSON-RPC 요청 본문을 파싱한다. 형식이 다르면 None."""
+    try:
+        request = fast_json.loads(body)
+    except ValueError:
+        return None
+    return request if isinstance(request, dict) else None
+
+
+def _request_metadata(request: dict[str, Any]) -> dict[str, Any]:
+    """요청 메타데이터와 메시지 메타데이터를 합친다. (요청 메타데이터 우선)"""
+    params = request.get("params")
+    if not isinstance(params, dict):
+        return {}
+    message = params.get("message")
+    metadata: dict[str, Any] = {}
+    for source in (message.get("metadata") if isinstance(message, dict) else None, params.get("metadata")):
+        if isinstance(source, dict):
+            metadata.update(source)
+    return metadata
+
+
+def _tenant_of(headers: Headers, metadata: dict[str, Any], scope: Scope) -> str:
+    """요청의 테넌트를 정한다."""
+    tenant = headers.get(TENANT_HEADER) or metadata.get(TENANT_METADATA_KEY)
+    if tenant:
+        return str(tenant)[:64]
+    client = scope.get("client")
+    return client[0] if client else DEFAULT_TENANT
+
+
+def _lane_of(headers: Headers, metadata: dict[str, Any]) -> str:
+    """요청의 우선순위 레인을 정한다. 알 수 없는 값이면 interactive."""
+    lane = str(headers.get(PRIORITY_HEADER) or metadata.get(PRIORITY_METADATA_KEY) or "").strip().lower()
+    return lane if lane in LANES else LANE_INTERACTIVE
+
+
+class _StageLimit:
+    """서브 에이전트 하나의 동시 호출 슬롯."""
+
+    def __init__(self, limit: int) -> None:
+        """_StageLimit 인스턴스를 초기화한다."""
+        self.limit = limit
+        self.in_flight = 0
+        self.semaphore = asyncio.Semaphore(limit)
+
+
+class StageLimitTransport(httpx.AsyncBaseTransport):
+    """서브 에이전트(단계)별 동시 호출 수를 제한하는 httpx 전송 계층.
+
+    슬롯은 응답 본문을 다 읽거나 닫을 때 반환한다. 슬롯을 기다리는 시간은 남은 데드라인으로 제한된다.
+    """
+
+    def __init__(self, balancer: AgentLoadBalancer, transport: httpx.AsyncBaseTransport) -> None:
+        """StageLimitTransport 인스턴스를 초기화한다.
+
+        Args:
+            balancer (AgentLoadBalancer): 요청 URL을 서브 에이전트 이름으로 매핑할 로드 밸런서.
+            transport (httpx.AsyncBaseTransport): 실제 요청을 보낼 전송 계층.
+        """
+        self._balancer = balancer
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """단계 슬롯을 얻은 뒤 요청을 보낸다."""
+        pool = self._balancer.pool_for(request.url)
+        stage = _stage_limit(pool.name) if pool is not None and request.method == "POST" else None
+        if pool is None or stage is None:
+            return await self._transport.handle_async_request(request)
+
+        started = time.monotonic()
+        try:
+            async with asyncio.timeout(remaining()):
+                await stage.semaphore.acquire()
+        except TimeoutError as exc:
+            raise httpx.PoolTimeout(f"Timed out waiting for a {pool.name} call slot", request=request) from exc
+        STAGE_QUEUE_WAIT_SECONDS.observe(time.monotonic() - started, pool.name)
+        stage.in_flight += 1
+        STAGE_INFLIGHT_CALLS.inc(pool.name)
+
+        def release() -> None:
+            stage.in_flight -= 1
+            STAGE_INFLIGHT_CALLS.dec(pool.name)
+            stage.semaphore.release()
+
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            release()
+            raise
+        response.stream = _SlotStream(response.stream, release)
+        return response
+
+    async def aclose(self) -> None:
+        """실제 전송 계층을 닫는다."""
+        await self._transport.aclose()
+
+
+class _SlotStream(httpx.AsyncByteStream):
+    """응답 본문을 닫을 때 단계 슬롯을 반환하는 스트림."""
+
+    def __init__(
+        self, stream: httpx.AsyncByteStream | httpx.SyncByteStream | Any, release: Callable[[], None]
+    ) -> None:
+        """_SlotStream 인스턴스를 초기화한다."""
+        self._stream = stream
+        self._release: Callable[[], None] | None = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """원본 스트림을 그대로 전달한다."""
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        """원본 스트림을 닫고 슬롯을 한 번만 반환한다."""
+        if self._release is not None:
+            self._release()
+            self._release = None
+        await self._stream.aclose()
+
+
+_STAGE_LIMITS: dict[str, _StageLimit | None] = {}
+
+
+def _stage_limit(name: str) -> _StageLimit | None:
+    """서브 에이전트의 동시 호출 슬롯을 반환한다. `{name}_agent_max_concurrency`가 0 이하이면 None."""
+    if name not in _STAGE_LIMITS:
+        limit = int(getattr(settings, f"{name}_agent_max_concurrency", 0) or 0)
+        _STAGE_LIMITS[name] = _StageLimit(limit) if limit > 0 else None
+    return _STAGE_LIMITS[name]
+
+
+def scheduler_snapshot() -> dict[str, Any]:
+    """실행 스케줄러와 단계별 동시 호출 현황을 반환한다."""
+    return {
+        "runs": RUN_SCHEDULER.snapshot(),
+        "stages": {
+            name: {"limit": stage.limit, "in_flight": stage.in_flight}
+            for name, stage in _STAGE_LIMITS.items()
+            if stage is not None
+        },
+    }
+
+
+def create_stage_limited_transport() -> StageLimitTransport:
+    """서킷 브레이커/헤지/로드 밸런싱 전송 계층 위에 단계별 동시 호출 상한을 적용한 전송 계층을 만든다."""
+    return StageLimitTransport(AGENT_BALANCER, create_resilient_transport())
+
+
+def attach_http_admission(app: A2AFastAPIApplication) -> None:
+    """실행 승인 제어 미들웨어를 추가한다."""
+    app.add_middleware(
+        AdmissionMiddleware, scheduler=RUN_SCHEDULER, queue_timeout_sec=settings.scheduler_queue_timeout_sec
+    )
+
+
+RUN_SCHEDULER = RunScheduler(
+    max_runs=settings.scheduler_max_runs,
+    queue_size=settings.scheduler_queue_size,
+    tenant_max_runs=settings.scheduler_tenant_max_runs,
+    tenant_queue_size=settings.scheduler_tenant_queue_size,
+    batch_every=settings.scheduler_batch_every,
+)
@@ -0,0 +1,171 @@
+"""에이전트 서버 콜드 스타트 벤치마크 모듈.
+
+각 `*_server` 모듈의 임포트 시간 프로파일(`python -X importtime`)과, 서버 프로세스를 띄운 뒤
+`/health`가 처음 응답하기까지의 시간(time-to-healthy) 및 에이전트 로드 완료까지의 시간(time-to-ready)을 측정한다.
+
+사용 예:
+    python -m agents.helpers.startup_benchmark
+    python -m agents.helpers.startup_benchmark crawler sentiment --output .data/startup.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+AGENTS = ("orchestrator", "crawler", "parser", "sentiment", "insight")
+DEFAULT_PORT_BASE = 8300
+DEFAULT_TIMEOUT_SEC = 120.0
+POLL_INTERVAL_SEC = 0.05
+TOP_PACKAGES = 8
+
+
+def server_module(agent: str) -> str:
+    """에이전트 이름에 해당하는 서버 모듈 경로를 반환한다."""
+    return f"agents.{agent}_agent.{agent}_server"
+
+
+def profile_imports(module: str, top: int = TOP_PACKAGES) -> dict[str, Any]:
+    """새 인터프리터에서 모듈을 임포트하며 `-X importtime` 결과를 패키지별로 집계한다.
+
+    Args:
+        module (str): 임포트할 모듈 경로.
+        top (int): 결과에 포함할 상위 패키지 수.
+
+    Returns:
+        dict[str, Any]: 모듈 누적 임포트 시간(ms)과 자체 임포트 시간 상위 패키지 목록.
+    """
+    completed = subprocess.run(  # nosec
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    self_us: Counter[str] = Counter()
+    total_us = 0
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        try:
+            self_part, cumulative_part, name = line.removeprefix("import time:").split("|", 2)
+            self_time, cumulative = int(self_part), int(cumulative_part)
+        except ValueError:
+            continue
+        name = name.strip()
+        self_us[_package_label(name)] += self_time
+        if name == module:
+            total_us = cumulative
+    return {
+        "import_ms": round(total_us / 1000, 1),
+        "top_packages_ms": {name: round(us / 1000, 1) for name, us in self_us.most_common(top)},
+    }
+
+
+def _package_label(module: str) -> str:
+    """집계 단위 패키지 이름을 반환한다. 네임스페이스 패키지(google 등)는 두 단계까지 사용한다."""
+    parts = module.split(".")
+    if parts[0] in {"google", "agents"} and len(parts) > 1:
+        return ".".join(parts[:2])
+    return parts[0]
+
+
+def measure_startup(agent: str, port: int, timeout_sec: float = DEFAULT_TIMEOUT_SEC) -> dict[str, Any]:
+    """서버 프로세스를 띄워 time-to-healthy와 time-to-ready를 측정한다.
+
+    Args:
+        agent (str): 에이전트 이름. 예) "crawler".
+        port (int): 서버가 바인딩할 포트.
+        timeout_sec (float): 최대 대기 시간(초).
+
+    Returns:
+        dict[str, Any]: healthy_sec(첫 `/health` 200 응답), ready_sec(`agent_loaded` 참) 측정값.
+            시간 안에 도달하지 못한 항목은 None.
+    """
+    env = {**os.environ, f"{agent.upper()}_AGENT_PUBLIC_PORT": str(port), "AGENT_PRELOAD": "true"}
+    started = time.perf_counter()
+    process = subprocess.Popen(  # nosec
+        [sys.executable, "-m", server_module(agent)],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    healthy_sec: float | None = None
+    ready_sec: float | None = None
+    try:
+        with httpx.Client(timeout=1.0) as client:
+            while time.perf_counter() - started < timeout_sec and process.poll() is None:
+                try:
+                    response = client.get(f"http://127.0.0.1:{port}/health")
+                except httpx.HTTPError:
+                    response = None
+                if response is not None and response.status_code == 200:
+                    elapsed = time.perf_counter() - started
+                    if healthy_sec is None:
+                        healthy_sec = elapsed
+                    if response.json().get("agent_loaded"):
+                        ready_sec = elapsed
+                        break
+                time.sleep(POLL_INTERVAL_SEC)
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+    return {
+        "healthy_sec": round(healthy_sec, 3) if healthy_sec is not None else None,
+        "ready_sec": round(ready_sec, 3) if ready_sec is not None else None,
+    }
+
+
+def _format_result(result: dict[str, Any]) -> str:
+    """벤치마크 결과를 한 줄 요약으로 변환한다."""
+    packages = ", ".join(f"{name}={ms}ms" for name, ms in result["top_packages_ms"].items())
+    return (
+        f"{result['agent']:<13} import={result['import_ms']:>7}ms "
+        f"healthy={result['healthy_sec']}s ready={result['ready_sec']}s\n    top: {packages}"
+    )
+
+
+def main() -> None:
+    """CLI 진입점. 에이전트별 임포트 프로파일과 시작 시간을 출력하고 선택적으로 JSONL에 누적 기록한다."""
+    parser = argparse.ArgumentParser(description="Measure agent server import time and time-to-healthy.")
+    parser.add_argument("agents", nargs="*", help=f"측정할 에이전트 (기본: 전체, 선택: {', '.join(AGENTS)})")
+    parser.add_argument("--port-base", type=int, default=DEFAULT_PORT_BASE, help="측정용 서버 포트 시작 번호")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT_SEC, help="에이전트별 최대 대기 시간(초)")
+    parser.add_argument("--imports-only", action="store_true", help="서버를 띄우지 않고 임포트 프로파일만 측정")
+    parser.add_argument("--output", help="결과를 누적 기록할 JSONL 파일 경로")
+    args = parser.parse_args()
+    unknown = sorted(set(args.agents) - set(AGENTS))
+    if unknown:
+        parser.error(f"unknown agents: {', '.join(unknown)}")
+
+    results = []
+    for index, agent in enumerate(args.agents or AGENTS):
+        result: dict[str, Any] = {"agent": agent, "measured_at": time.time(), **profile_imports(server_module(agent))}
+        if args.imports_only:
+            result.update({"healthy_sec": None, "ready_sec": None})
+        else:
+            result.update(measure_startup(agent, args.port_base + index, args.timeout))
+        results.append(result)
+        print(_format_result(result))
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with output.open("a", encoding="utf-8") as file:
+            for result in results:
+                file.write(json.dumps(result, ensure_ascii=False) + "\n")
+
+
+if __name__ == "__main__":
+    main()
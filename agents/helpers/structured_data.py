@@ -0,0 +1,294 @@
+"""에이전트 간 구조화 데이터 전송 모듈.
+
+에이전트 요청은 "지시문: [JSON 배열]" 형태의 텍스트로 전달되어, 기사 배열이 JSON 문자열 안에 다시
+이스케이프된 채 전송된다. 이 모듈은 다음을 제공한다.
+
+- 서버: 에이전트 카드에 구조화 데이터 확장(지원 압축 방식 포함)을 광고하고, 압축된 요청 본문을 해제하며,
+  구조화 `DataPart`를 에이전트 LLM이 읽을 간결한 텍스트로 복원하는 변환기.
+- 클라이언트: 에이전트 카드 응답에서 확장 지원 여부를 기록하고, 지원하는 서브 에이전트에 한해 요청 텍스트의
+  JSON 본문을 `DataPart`로 분리하며 큰 요청 본문을 압축하는 httpx 훅.
+
+응답은 ADK `RemoteA2aAgent`가 A2A 파트 변환기를 적용하지 않으므로 텍스트 파트로 유지하되 gzip으로 압축한다.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import zlib
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+import httpx
+from a2a.extensions.common import HTTP_EXTENSION_HEADER
+from a2a.server.apps import A2AFastAPIApplication
+from a2a.types import AgentExtension, DataPart, Part
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from common import fast_json
+from common.logger import get_logger
+from common.settings import settings
+
+try:
+    import zstandard  # type: ignore[import-not-found]
+except ModuleNotFoundError:
+    zstandard = None
+
+if TYPE_CHECKING:
+    from google.genai import types as genai_types
+
+logger = get_logger(__name__)
+
+STRUCTURED_DATA_EXTENSION_URI = "urn:finance-news:a2a:structured-data:v1"
+STRUCTURED_DATA_MIME_TYPE = "application/json"
+STRUCTURED_DATA_METADATA_KEY = "structured_data"
+# 지원 압축 방식. 클라이언트는 앞쪽 방식을 우선 사용한다. (zstd는 zstandard 패키지가 있을 때만)
+SUPPORTED_ENCODINGS: tuple[str, ...] = ("zstd", "gzip") if zstandard is not None else ("gzip",)
+MAX_DECOMPRESSED_BYTES = 64 * 1024 * 1024
+# 요청 텍스트에서 JSON 본문 후보를 찾을 때 시도할 최대 시작 위치 수
+MAX_JSON_CANDIDATES = 16
+
+_PEER_ENCODINGS: dict[str, tuple[str, ...]] = {}
+
+
+def structured_data_extension() -> AgentExtension:
+    """에이전트 카드에 광고할 구조화 데이터 확장 정보를 반환한다."""
+    return AgentExtension(
+        uri=STRUCTURED_DATA_EXTENSION_URI,
+        description="Accepts JSON payloads as DataPart and compressed request bodies.",
+        required=False,
+        params={"mime_type": STRUCTURED_DATA_MIME_TYPE, "encodings": list(SUPPORTED_ENCODINGS)},
+    )
+
+
+def split_structured_text(text: str, min_chars: int) -> dict[str, Any] | None:
+    """요청 텍스트에서 가장 앞쪽의 큰 JSON 배열/객체를 분리한다.
+
+    Args:
+        text (str): 요청 텍스트. 예) "Extract article text from this list: [...]".
+        min_chars (int): 분리할 JSON 본문의 최소 글자 수.
+
+    Returns:
+        dict[str, Any] | None: {"prefix", "payload", "suffix"} 구조. 충분히 큰 JSON 본문이 없으면 None.
+    """
+    if len(text) < min_chars:
+        return None
+    decoder = json.JSONDecoder()
+    start = _next_json_start(text, 0)
+    for _ in range(MAX_JSON_CANDIDATES):
+        if start < 0:
+            return None
+        try:
+            payload, end = decoder.raw_decode(text, start)
+        except ValueError:
+            start = _next_json_start(text, start + 1)
+            continue
+        if end - start >= min_chars:
+            return {"prefix": text[:start], "payload": payload, "suffix": text[end:]}
+        start = _next_json_start(text, end)
+    return None
+
+
+def _next_json_start(text: str, offset: int) -> int:
+    """offset 이후 처음 나오는 '[' 또는 '{' 위치를 반환한다. 없으면 -1."""
+    positions = [position for position in (text.find("[", offset), text.find("{", offset)) if position >= 0]
+    return min(positions, default=-1)
+
+
+def join_structured_text(data: dict[str, Any]) -> str:
+    """`split_structured_text` 결과를 공백 없는 JSON 본문을 가진 텍스트로 되돌린다."""
+    return f"{data.get('prefix', '')}{fast_json.dumps_str(data.get('payload'))}{data.get('suffix', '')}"
+
+
+def _is_structured_part(part: DataPart) -> bool:
+    """이 모듈이 만든 구조화 DataPart인지 확인한다."""
+    return bool(part.metadata) and part.metadata.get(STRUCTURED_DATA_METADATA_KEY) == STRUCTURED_DATA_EXTENSION_URI
+
+
+def create_structured_genai_part_converter(
+    card_url: str,
+) -> Callable[[genai_types.Part], Part | None]:
+    """서브 에이전트 호출용 GenAI→A2A 파트 변환기를 만든다.
+
+    서브 에이전트 카드가 구조화 데이터 확장을 광고한 경우에만 요청 텍스트의 큰 JSON 본문을 `DataPart`로
+    분리하고, 그 외에는 ADK 기본 변환기를 사용한다.
+
+    Args:
+        card_url (str): 서브 에이전트 카드 URL.
+
+    Returns:
+        Callable[[genai_types.Part], Part | None]: `RemoteA2aAgent(genai_part_converter=...)`에 전달할 변환기.
+    """
+    from google.adk.a2a.converters.part_converter import convert_genai_part_to_a2a_part
+
+    origin = _origin(card_url)
+
+    def convert(part: genai_types.Part) -> Part | None:
+        if part.text and not part.thought and settings.a2a_structured_data and origin in _PEER_ENCODINGS:
+            data = split_structured_text(part.text, settings.a2a_structured_min_chars)
+            if data is not None:
+                return Part(
+                    root=DataPart(
+                        data=data,
+                        metadata={STRUCTURED_DATA_METADATA_KEY: STRUCTURED_DATA_EXTENSION_URI},
+                    )
+                )
+        return convert_genai_part_to_a2a_part(part)
+
+    return convert
+
+
+def create_structured_a2a_part_converter() -> Callable[[Part], genai_types.Part | None]:
+    """에이전트 서버용 A2A→GenAI 파트 변환기를 만든다.
+
+    구조화 `DataPart`는 간결한 JSON 본문을 가진 텍스트 파트로 복원하고, 그 외에는 ADK 기본 변환기를 사용한다.
+
+    Returns:
+        Callable[[Part], genai_types.Part | None]: `A2aAgentExecutorConfig(a2a_part_converter=...)`에 전달할 변환기.
+    """
+    from google.adk.a2a.converters.part_converter import convert_a2a_part_to_genai_part
+    from google.genai import types as genai_types
+
+    def convert(part: Part) -> genai_types.Part | None:
+        root = part.root
+        if isinstance(root, DataPart) and _is_structured_part(root):
+            return genai_types.Part(text=join_structured_text(root.data))
+        return convert_a2a_part_to_genai_part(part)
+
+    return convert
+
+
+def _origin(url: str) -> str:
+    """URL의 scheme://host:port 부분을 반환한다."""
+    parsed = urlsplit(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+def structured_data_event_hooks() -> dict[str, list[Callable[..., Any]]]:
+    """서브 에이전트 호출용 httpx 이벤트 훅을 반환한다.
+
+    요청 훅은 확장을 광고한 서브 에이전트에 확장 활성화 헤더를 붙이고 큰 본문을 압축하며,
+    응답 훅은 에이전트 카드 응답에서 확장 지원 여부와 압축 방식을 기록한다.
+    """
+    return {"request": [_compress_request], "response": [_record_peer_card]}
+
+
+async def _compress_request(request: httpx.Request) -> None:
+    """확장을 지원하는 서브 에이전트로 가는 큰 요청 본문을 압축한다."""
+    encodings = _PEER_ENCODINGS.get(_origin(str(request.url)))
+    if encodings is None or not settings.a2a_structured_data or request.method != "POST":
+        return
+    request.headers[HTTP_EXTENSION_HEADER] = STRUCTURED_DATA_EXTENSION_URI
+    if "content-encoding" in request.headers or not isinstance(request.stream, httpx.ByteStream):
+        return
+    body = request.content
+    if len(body) < settings.a2a_compression_min_bytes:
+        return
+    encoding = next((name for name in SUPPORTED_ENCODINGS if name in encodings), None)
+    if encoding is None:
+        return
+    compressed = _compress(body, encoding)
+    request.stream = httpx.ByteStream(compressed)
+    request.headers["Content-Encoding"] = encoding
+    request.headers["Content-Length"] = str(len(compressed))
+
+
+async def _record_peer_card(response: httpx.Response) -> None:
+    """에이전트 카드 응답에서 구조화 데이터 확장 지원 여부를 기록한다."""
+    if response.request.method != "GET" or not response.url.path.endswith("agent-card.json"):
+        return
+    if response.status_code != 200:
+        return
+    await response.aread()
+    try:
+        card = fast_json.loads(response.content)
+    except ValueError:
+        return
+    extensions = ((card.get("capabilities") or {}).get("extensions")) or []
+    extension = next((ext for ext in extensions if ext.get("uri") == STRUCTURED_DATA_EXTENSION_URI), None)
+    origins = {_origin(str(response.url))}
+    if card.get("url"):
+        origins.add(_origin(card["url"]))
+    for origin in origins:
+        if extension is None:
+            _PEER_ENCODINGS.pop(origin, None)
+            continue
+        _PEER_ENCODINGS[origin] = tuple((extension.get("params") or {}).get("encodings") or ())
+    logger.info("Structured data peer=%s supported=%s", response.url.host, extension is not None)
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    """본문을 지정 방식으로 압축한다."""
+    if encoding == "zstd" and zstandard is not None:
+        return zstandard.ZstdCompressor().compress(body)
+    return gzip.compress(body, compresslevel=6)
+
+
+def _decompress(body: bytes, encoding: str) -> bytes:
+    """본문 압축을 해제한다. 해제 크기가 상한을 넘으면 ValueError를 발생시킨다."""
+    if encoding == "zstd" and zstandard is not None:
+        return zstandard.ZstdDecompressor().decompress(body, max_output_size=MAX_DECOMPRESSED_BYTES)
+    if encoding == "gzip":
+        decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+        data = decompressor.decompress(body, MAX_DECOMPRESSED_BYTES)
+        if decompressor.unconsumed_tail:
+            raise ValueError("decompressed body too large")
+        return data
+    raise ValueError(f"unsupported content encoding: {encoding}")
+
+
+class RequestDecompressionMiddleware:
+    """`Content-Encoding`으로 압축된 요청 본문을 해제하는 ASGI 미들웨어."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """RequestDecompressionMiddleware 인스턴스를 초기화한다.
+
+        Args:
+            app (ASGIApp): 감쌀 ASGI 앱.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """압축된 요청 본문을 해제한 뒤 앱에 전달한다."""
+        encoding = Headers(scope=scope).get("content-encoding") if scope["type"] == "http" else None
+        if not encoding:
+            await self.app(scope, receive, send)
+            return
+
+        chunks: list[bytes] = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        try:
+            body = _decompress(b"".join(chunks), encoding.strip().lower())
+        except (ValueError, OSError, EOFError, zlib.error) as exc:
+            logger.info("Rejecting compressed request encoding=%s error=%s", encoding, exc)
+            await PlainTextResponse("Invalid compressed request body", status_code=400)(scope, receive, send)
+            return
+
+        headers = MutableHeaders(scope=scope)
+        del headers["content-encoding"]
+        headers["content-length"] = str(len(body))
+        replayed = False
+
+        async def replay() -> Message:
+            nonlocal replayed
+            if replayed:
+                return await receive()
+            replayed = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        await self.app(scope, replay, send)
+
+
+def attach_http_compression(app: A2AFastAPIApplication) -> None:
+    """압축된 요청 본문 해제 미들웨어와 (확장 사용 시) gzip 응답 압축 미들웨어를 추가한다."""
+    if settings.a2a_structured_data:
+        app.add_middleware(GZipMiddleware, minimum_size=settings.a2a_compression_min_bytes)
+    app.add_middleware(RequestDecompressionMiddleware)
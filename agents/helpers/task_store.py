@@ -0,0 +1,305 @@
+"""크기/수명 제한이 있는 A2A 태스크 저장소 모듈.
+
+기본 `InMemoryTaskStore`는 태스크와 아티팩트를 무한히 보관한다. 이 모듈의 저장소는 태스크를
+압축 직렬화하여 보관하고, 개수/바이트/수명 한도를 넘는 오래된 태스크를 제거한다.
+개수/바이트 한도로는 종료된 태스크만 제거하며, 진행 중인 태스크는 수명 한도로만 제거한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+
+from a2a.server.context import ServerCallContext
+from a2a.server.tasks import InMemoryTaskStore, TaskStore
+from a2a.types import Task, TaskState
+
+from common.logger import get_logger
+from common.settings import AppSettings
+
+logger = get_logger(__name__)
+
+# 이 크기(바이트) 이상인 직렬화 태스크만 압축한다.
+COMPRESSION_THRESHOLD_BYTES = 1024
+COMPRESSION_LEVEL = 6
+
+_FLAG_RAW = b"\x00"
+_FLAG_ZLIB = b"\x01"
+
+# 개수/바이트 한도로 제거할 수 있는 종료 상태
+TERMINAL_STATES = frozenset({TaskState.completed, TaskState.failed, TaskState.canceled, TaskState.rejected})
+
+
+def serialize_task(task: Task) -> bytes:
+    """태스크를 압축된 바이트로 직렬화한다.
+
+    Args:
+        task (Task): 직렬화할 태스크.
+
+    Returns:
+        bytes: 1바이트 압축 플래그가 앞에 붙은 직렬화 결과.
+    """
+    payload = task.model_dump_json(exclude_none=True).encode("utf-8")
+    if len(payload) < COMPRESSION_THRESHOLD_BYTES:
+        return _FLAG_RAW + payload
+    return _FLAG_ZLIB + zlib.compress(payload, COMPRESSION_LEVEL)
+
+
+def is_terminal(task: Task) -> bool:
+    """태스크가 종료 상태(completed, failed, canceled, rejected)인지 확인한다."""
+    return task.status.state in TERMINAL_STATES
+
+
+def deserialize_task(data: bytes) -> Task:
+    """`serialize_task`로 직렬화된 바이트를 태스크로 복원한다.
+
+    Args:
+        data (bytes): 직렬화된 태스크.
+
+    Returns:
+        Task: 복원된 태스크.
+    """
+    flag, payload = data[:1], data[1:]
+    if flag == _FLAG_ZLIB:
+        payload = zlib.decompress(payload)
+    return Task.model_validate_json(payload)
+
+
+class BoundedInMemoryTaskStore(TaskStore):
+    """개수/바이트/수명 한도를 갖는 메모리 태스크 저장소.
+
+    태스크는 압축 직렬화된 형태로 보관하며, 개수/바이트 한도를 넘으면 가장 오래 갱신되지 않은 종료 태스크부터
+    제거한다. 진행 중인 태스크는 수명 한도를 넘을 때만 제거한다.
+    """
+
+    def __init__(self, *, max_tasks: int, max_bytes: int, max_age_sec: float) -> None:
+        """BoundedInMemoryTaskStore 인스턴스를 초기화한다.
+
+        Args:
+            max_tasks (int): 최대 태스크 수.
+            max_bytes (int): 직렬화 기준 최대 총 바이트 수.
+            max_age_sec (float): 마지막 갱신 이후 태스크를 유지할 최대 시간(초).
+        """
+        self._max_tasks = max(1, max_tasks)
+        self._max_bytes = max(1, max_bytes)
+        self._max_age_sec = max_age_sec
+        self._tasks: OrderedDict[str, tuple[float, bytes, bool]] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = asyncio.Lock()
+
+    async def save(self, task: Task, context: ServerCallContext | None = None) -> None:
+        """태스크를 저장하거나 갱신한다."""
+        data = serialize_task(task)
+        async with self._lock:
+            self._remove(task.id)
+            self._tasks[task.id] = (time.monotonic(), data, is_terminal(task))
+            self._total_bytes += len(data)
+            self._evict()
+
+    async def get(self, task_id: str, context: ServerCallContext | None = None) -> Task | None:
+        """태스크를 조회한다. 만료된 태스크는 None을 반환한다."""
+        async with self._lock:
+            self._evict()
+            entry = self._tasks.get(task_id)
+        if entry is None:
+            return None
+        return deserialize_task(entry[1])
+
+    async def delete(self, task_id: str, context: ServerCallContext | None = None) -> None:
+        """태스크를 삭제한다."""
+        async with self._lock:
+            self._remove(task_id)
+
+    def stats(self) -> dict[str, int]:
+        """저장소 사용량을 반환한다.
+
+        Returns:
+            dict[str, int]: 태스크 수와 직렬화 기준 총 바이트 수.
+        """
+        return {"tasks": len(self._tasks), "bytes": self._total_bytes}
+
+    def _remove(self, task_id: str) -> None:
+        """태스크를 제거하고 바이트 합계를 갱신한다."""
+        entry = self._tasks.pop(task_id, None)
+        if entry is not None:
+            self._total_bytes -= len(entry[1])
+
+    def _over_limit(self) -> bool:
+        """개수 또는 바이트 한도를 넘었는지 여부."""
+        return len(self._tasks) > self._max_tasks or self._total_bytes > self._max_bytes
+
+    def _evict(self) -> None:
+        """수명 한도를 넘은 태스크를 제거한 뒤, 개수/바이트 한도 안에 들 때까지 오래된 종료 태스크를 제거한다."""
+        expire_before = time.monotonic() - self._max_age_sec
+        while self._tasks:
+            task_id, (updated_at, _, _) = next(iter(self._tasks.items()))
+            if updated_at >= expire_before:
+                break
+            self._remove(task_id)
+            logger.info("Evicted expired task from in-memory store task_id=%s", task_id)
+
+        if not self._over_limit():
+            return
+        # 진행 중인 태스크는 건너뛰므로 종료 태스크가 없으면 한도를 잠시 넘을 수 있다.
+        for task_id in [task_id for task_id, (_, _, terminal) in self._tasks.items() if terminal]:
+            self._remove(task_id)
+            logger.info("Evicted task from in-memory store task_id=%s", task_id)
+            if not self._over_limit():
+                break
+
+
+class SqliteTaskStore(TaskStore):
+    """SQLite 파일 기반 태스크 저장소.
+
+    프로세스 재시작 후에도 태스크 상태가 유지되며, 수명 한도를 넘는 태스크와 개수/바이트 한도를 넘는 종료 태스크를
+    제거한다.
+    SQLite 호출은 워커 스레드에서 실행해 이벤트 루프를 막지 않는다.
+    """
+
+    def __init__(self, path: str, *, max_tasks: int, max_bytes: int, max_age_sec: float) -> None:
+        """SqliteTaskStore 인스턴스를 초기화한다.
+
+        Args:
+            path (str): SQLite 데이터베이스 파일 경로.
+            max_tasks (int): 최대 태스크 수.
+            max_bytes (int): 직렬화 기준 최대 총 바이트 수.
+            max_age_sec (float): 마지막 갱신 이후 태스크를 유지할 최대 시간(초).
+        """
+        self._max_tasks = max(1, max_tasks)
+        self._max_bytes = max(1, max_bytes)
+        self._max_age_sec = max_age_sec
+        self._lock = threading.Lock()
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS tasks ("
+            " id TEXT PRIMARY KEY,"
+            " updated_at REAL NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " payload BLOB NOT NULL,"
+            " terminal INTEGER NOT NULL DEFAULT 0)"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(tasks)")}
+        if "terminal" not in columns:
+            self._conn.execute("ALTER TABLE tasks ADD COLUMN terminal INTEGER NOT NULL DEFAULT 0")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_updated_at ON tasks (updated_at)")
+        with self._lock:
+            self._evict_locked()
+
+    async def save(self, task: Task, context: ServerCallContext | None = None) -> None:
+        """태스크를 저장하거나 갱신한다."""
+        data = serialize_task(task)
+        await asyncio.to_thread(self._save_sync, task.id, data, is_terminal(task))
+
+    async def get(self, task_id: str, context: ServerCallContext | None = None) -> Task | None:
+        """태스크를 조회한다. 만료된 태스크는 None을 반환한다."""
+        data = await asyncio.to_thread(self._get_sync, task_id)
+        if data is None:
+            return None
+        return deserialize_task(data)
+
+    async def delete(self, task_id: str, context: ServerCallContext | None = None) -> None:
+        """태스크를 삭제한다."""
+        await asyncio.to_thread(self._delete_sync, task_id)
+
+    def stats(self) -> dict[str, int]:
+        """저장소 사용량을 반환한다.
+
+        Returns:
+            dict[str, int]: 태스크 수와 직렬화 기준 총 바이트 수.
+        """
+        with self._lock:
+            count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM tasks").fetchone()
+        return {"tasks": int(count), "bytes": int(total)}
+
+    def close(self) -> None:
+        """데이터베이스 연결을 닫는다."""
+        with self._lock:
+            self._conn.close()
+
+    def _save_sync(self, task_id: str, data: bytes, terminal: bool) -> None:
+        """태스크를 저장하고 한도를 넘는 태스크를 제거한다."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO tasks (id, updated_at, size, payload, terminal) VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT(id) DO UPDATE SET"
+                " updated_at = excluded.updated_at, size = excluded.size, payload = excluded.payload,"
+                " terminal = excluded.terminal",
+                (task_id, time.time(), len(data), data, int(terminal)),
+            )
+            self._evict_locked()
+
+    def _get_sync(self, task_id: str) -> bytes | None:
+        """만료되지 않은 태스크의 직렬화 바이트를 조회한다."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM tasks WHERE id = ? AND updated_at >= ?",
+                (task_id, time.time() - self._max_age_sec),
+            ).fetchone()
+        return row[0] if row else None
+
+    def _delete_sync(self, task_id: str) -> None:
+        """태스크를 삭제한다."""
+        with self._lock:
+            self._conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+
+    def _evict_locked(self) -> None:
+        """수명 한도를 넘은 태스크와 개수/바이트 한도를 넘는 오래된 종료 태스크를 제거한다.
+        호출 측에서 잠금을 보유해야 한다.
+        """
+        self._conn.execute("DELETE FROM tasks WHERE updated_at < ?", (time.time() - self._max_age_sec,))
+
+        count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM tasks").fetchone()
+        if count <= self._max_tasks and total <= self._max_bytes:
+            return
+
+        # 진행 중인 태스크를 먼저, 종료 태스크는 최신순으로 누적하여 한도를 넘는 종료 태스크만 제거한다.
+        self._conn.execute(
+            "DELETE FROM tasks WHERE id IN ("
+            " SELECT id FROM ("
+            "  SELECT id, terminal,"
+            "   ROW_NUMBER() OVER (ORDER BY terminal, updated_at DESC) AS rank,"
+            "   SUM(size) OVER (ORDER BY terminal, updated_at DESC ROWS UNBOUNDED PRECEDING) AS running_size"
+            "  FROM tasks)"
+            " WHERE terminal = 1 AND (rank > ? OR running_size > ?))",
+            (self._max_tasks, self._max_bytes),
+        )
+        logger.info("Evicted tasks from sqlite store over limits count=%s bytes=%s", count, total)
+
+
+def create_task_store(app_settings: AppSettings, app_name: str) -> TaskStore:
+    """설정에 따라 A2A 태스크 저장소를 생성한다.
+
+    Args:
+        app_settings (AppSettings): 애플리케이션 설정.
+        app_name (str): 에이전트 이름. SQLite 파일 이름에 사용한다.
+
+    Returns:
+        TaskStore: `task_store_backend` 설정에 맞는 태스크 저장소.
+    """
+    backend = app_settings.task_store_backend
+    if backend == "sqlite":
+        file_name = f"{app_name.lower().replace(' ', '_')}_tasks.sqlite3"
+        path = str(Path(app_settings.task_store_dir) / file_name)
+        logger.info("Using sqlite task store path=%s", path)
+        return SqliteTaskStore(
+            path,
+            max_tasks=app_settings.task_store_max_tasks,
+            max_bytes=app_settings.task_store_max_bytes,
+            max_age_sec=app_settings.task_store_max_age_sec,
+        )
+    if backend == "unbounded":
+        return InMemoryTaskStore()
+    return BoundedInMemoryTaskStore(
+        max_tasks=app_settings.task_store_max_tasks,
+        max_bytes=app_settings.task_store_max_bytes,
+        max_age_sec=app_settings.task_store_max_age_sec,
+    )
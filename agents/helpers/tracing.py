@@ -0,0 +1,64 @@
+"""에이전트 서버 분산 트레이싱 모듈.
+
+들어오는 요청의 W3C traceparent 헤더에서 트레이스 컨텍스트를 복원하고, 요청 처리 전체를 서버 스팬으로 감싼다.
+ADK의 invocation/agent/LLM/툴 스팬은 이 서버 스팬의 하위로 기록되어 오케스트레이터 호출과 이어진다.
+"""
+
+from __future__ import annotations
+
+from a2a.server.apps import A2AFastAPIApplication
+from opentelemetry import propagate, trace
+from opentelemetry.trace import SpanKind, Status, StatusCode
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from common.telemetry import get_tracer
+
+# 트레이싱하지 않는 경로 (주기적으로 호출되는 운영용 엔드포인트)
+UNTRACED_PATHS = frozenset({"/health", "/metrics"})
+
+
+class TracingMiddleware:
+    """요청별 서버 스팬을 만들고 전파된 트레이스 컨텍스트를 이어받는 ASGI 미들웨어."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """TracingMiddleware 인스턴스를 초기화한다."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """요청을 서버 스팬 안에서 처리한다."""
+        if scope["type"] != "http" or scope.get("path") in UNTRACED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        carrier = {key.decode("latin-1"): value.decode("latin-1") for key, value in scope.get("headers", [])}
+        parent_context = propagate.extract(carrier)
+        span_name = f"{scope['method']} {scope.get('path', '')}"
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                span.set_attribute("http.response.status_code", message["status"])
+                if message["status"] >= 500:
+                    span.set_status(Status(StatusCode.ERROR))
+            await send(message)
+
+        with get_tracer().start_as_current_span(span_name, context=parent_context, kind=SpanKind.SERVER) as span:
+            span.set_attribute("http.request.method", scope["method"])
+            span.set_attribute("url.path", scope.get("path", ""))
+            await self.app(scope, receive, send_wrapper)
+
+
+def annotate_current_span(attributes: dict[str, str | int | None]) -> None:
+    """현재 스팬에 속성을 추가한다. 값이 None인 속성은 건너뛴다.
+
+    Args:
+        attributes (dict[str, str | int | None]): 스팬 속성.
+    """
+    span = trace.get_current_span()
+    if not span.is_recording():
+        return
+    span.set_attributes({key: value for key, value in attributes.items() if value is not None})
+
+
+def attach_http_tracing(app: A2AFastAPIApplication) -> None:
+    """요청 트레이싱 미들웨어를 추가한다."""
+    app.add_middleware(TracingMiddleware)
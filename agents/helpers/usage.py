@@ -0,0 +1,64 @@
+"""에이전트 서버 실행 단위 LLM 사용량 집계 모듈.
+
+요청마다 실행 원장을 만들어 이 프로세스의 LLM 호출과 하위 서브 에이전트가 보고한 사용량을 누적하고,
+응답 헤더로 상위 호출자에게 사용량을 돌려준다. 최근 실행 요약은 `/usage`에서 조회할 수 있다.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from a2a.server.apps import A2AFastAPIApplication
+from fastapi import APIRouter
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from common import fast_json
+from common.usage import LLM_USAGE_HEADER, RUN_BUDGET_HEADER, RUN_ID_HEADER, recent_runs, run_usage_scope
+
+
+class UsageMiddleware:
+    """요청별 실행 원장을 설정하고 응답 헤더로 LLM 사용량을 보고하는 ASGI 미들웨어.
+
+    스트리밍 응답은 헤더가 먼저 전송되므로 사용량이 헤더에 포함되지 않으며, 실행 종료 시 로그와
+    `/usage`로만 확인할 수 있다.
+    """
+
+    def __init__(self, app: ASGIApp, agent_name: str) -> None:
+        """UsageMiddleware 인스턴스를 초기화한다.
+
+        Args:
+            app (ASGIApp): 감쌀 ASGI 앱.
+            agent_name (str): 사용량을 집계할 에이전트 이름.
+        """
+        self.app = app
+        self.agent_name = agent_name
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """요청을 실행 원장 컨텍스트 안에서 처리한다."""
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        with run_usage_scope(self.agent_name, headers.get(RUN_ID_HEADER), headers.get(RUN_BUDGET_HEADER)) as ledger:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start" and not ledger.empty:
+                    response_headers = MutableHeaders(scope=message)
+                    response_headers[LLM_USAGE_HEADER] = fast_json.dumps_str(ledger.to_breakdown())
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+
+def attach_http_usage(app: A2AFastAPIApplication, *, agent_name: str) -> None:
+    """실행 단위 사용량 집계 미들웨어와 HTTP /usage 엔드포인트를 추가한다."""
+    router = APIRouter()
+
+    @router.get("/usage", include_in_schema=False)
+    async def usage() -> dict[str, Any]:
+        return {"runs": recent_runs()}
+
+    app.include_router(router)
+    app.add_middleware(UsageMiddleware, agent_name=agent_name)
@@ -1,7 +1,22 @@
-"""Insight agent package."""
+"""Insight agent package.
+
+서버 모듈을 임포트할 때 에이전트 구성(ADK, LiteLLM 임포트 포함)이 함께 로드되지 않도록
+공개 이름은 첫 접근 시점에 가져온다.
+"""
 
 from __future__ import annotations
 
-from .insight_agent import INSIGHT_AGENT, generate_insights
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .insight_agent import INSIGHT_AGENT, generate_insights
 
 __all__ = ["INSIGHT_AGENT", "generate_insights"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        from . import insight_agent
+
+        return getattr(insight_agent, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,243 @@
+"""감정 분석 결과 컬럼형 집계 엔진 모듈.
+
+감정 분석 결과 리스트를 한 번만 순회하여 NumPy 컬럼 배열로 적재한 뒤,
+발행사/시간대/감정 구간별 그룹 통계를 벡터 연산으로 계산한다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+# 감정 구간 코드와 라벨
+BAND_NEGATIVE = 0
+BAND_NEUTRAL = 1
+BAND_POSITIVE = 2
+BAND_LABELS = ("negative", "neutral", "positive")
+
+# 발행 시각 문자열에서 시 단위 버킷으로 사용할 접두사 길이 (예: "2025-01-01T09")
+_HOUR_PREFIX_LENGTH = 13
+_UNKNOWN_LABEL = ""
+
+
+@dataclass(frozen=True, slots=True)
+class GroupStats:
+    """그룹별 감정 통계.
+
+    Attributes:
+        label (str): 그룹 라벨(발행사 이름, 시간대, 감정 구간).
+        count (int): 그룹 기사 수.
+        mean_sentiment (float): 평균 감정 점수.
+        var_sentiment (float): 감정 점수 분산(모분산).
+        min_sentiment (float): 최저 감정 점수.
+        max_sentiment (float): 최고 감정 점수.
+        mean_relevance (float): 평균 관련도.
+        min_index (int): 최저 감정 점수 기사의 행 인덱스.
+        max_index (int): 최고 감정 점수 기사의 행 인덱스.
+    """
+
+    label: str
+    count: int
+    mean_sentiment: float
+    var_sentiment: float
+    min_sentiment: float
+    max_sentiment: float
+    mean_relevance: float
+    min_index: int
+    max_index: int
+
+    @property
+    def std_sentiment(self) -> float:
+        """감정 점수 표준편차."""
+        return float(np.sqrt(self.var_sentiment))
+
+
+class SentimentFrame:
+    """감정 분석 결과를 컬럼형 NumPy 배열로 보관하는 프레임.
+
+    Attributes:
+        sentiment (np.ndarray): 감정 점수 배열(float64).
+        relevance (np.ndarray): 관련도 배열(float64).
+        publisher_codes (np.ndarray): 발행사 코드 배열(int64). `publishers`의 인덱스.
+        publishers (list[str]): 발행사 라벨 리스트.
+        hour_codes (np.ndarray): 발행 시간대 코드 배열(int64). `hours`의 인덱스.
+        hours (list[str]): 발행 시간대 라벨 리스트(UTC, "YYYY-MM-DDTHH").
+        titles (list[str]): 기사 제목 리스트.
+        urls (list[str]): 기사 URL 리스트.
+    """
+
+    def __init__(
+        self,
+        *,
+        sentiment: np.ndarray,
+        relevance: np.ndarray,
+        publisher_codes: np.ndarray,
+        publishers: list[str],
+        hour_codes: np.ndarray,
+        hours: list[str],
+        titles: list[str],
+        urls: list[str],
+    ) -> None:
+        """SentimentFrame 인스턴스를 초기화한다."""
+        self.sentiment = sentiment
+        self.relevance = relevance
+        self.publisher_codes = publisher_codes
+        self.publishers = publishers
+        self.hour_codes = hour_codes
+        self.hours = hours
+        self.titles = titles
+        self.urls = urls
+
+    def __len__(self) -> int:
+        """프레임의 행 수를 반환한다."""
+        return int(self.sentiment.shape[0])
+
+    @classmethod
+    def from_results(cls, results: list[dict[str, Any]]) -> SentimentFrame:
+        """감정 분석 결과 리스트를 한 번 순회하여 프레임을 생성한다.
+
+        Args:
+            results (list[dict[str, Any]]): 감정 분석 결과 리스트.
+                각 항목은 {"document": {...}, "sentiment": float, "relevance": float} 형태.
+
+        Returns:
+            SentimentFrame: 컬럼형 프레임.
+        """
+        sentiment: list[float] = []
+        relevance: list[float] = []
+        publisher_codes: list[int] = []
+        hour_codes: list[int] = []
+        titles: list[str] = []
+        urls: list[str] = []
+        publisher_index: dict[str, int] = {}
+        hour_index: dict[str, int] = {}
+
+        # 행 단위 접근은 이 한 번의 순회로 끝내고, 이후 집계는 모두 배열 연산으로 수행한다.
+        for item in results:
+            document = item.get("document") or {}
+            sentiment.append(item.get("sentiment") or 0.0)
+            relevance.append(item.get("relevance") or 0.0)
+            titles.append(document.get("title") or "")
+            urls.append(document.get("url") or "")
+
+            publisher = document.get("publisher") or _UNKNOWN_LABEL
+            code = publisher_index.get(publisher)
+            if code is None:
+                code = publisher_index[publisher] = len(publisher_index)
+            publisher_codes.append(code)
+
+            published_at = document.get("published_at")
+            hour = published_at[:_HOUR_PREFIX_LENGTH] if isinstance(published_at, str) else _UNKNOWN_LABEL
+            code = hour_index.get(hour)
+            if code is None:
+                code = hour_index[hour] = len(hour_index)
+            hour_codes.append(code)
+
+        return cls(
+            sentiment=np.clip(np.asarray(sentiment, dtype=np.float64), -1.0, 1.0),
+            relevance=np.clip(np.asarray(relevance, dtype=np.float64), 0.0, 1.0),
+            publisher_codes=np.asarray(publisher_codes, dtype=np.int64),
+            publishers=list(publisher_index),
+            hour_codes=np.asarray(hour_codes, dtype=np.int64),
+            hours=list(hour_index),
+            titles=titles,
+            urls=urls,
+        )
+
+    def band_codes(self, threshold: float) -> np.ndarray:
+        """감정 점수를 부정/중립/긍정 구간 코드로 변환한다.
+
+        Args:
+            threshold (float): 긍정/부정 판단 임계값.
+
+        Returns:
+            np.ndarray: 구간 코드 배열(`BAND_NEGATIVE`, `BAND_NEUTRAL`, `BAND_POSITIVE`).
+        """
+        codes = np.full(len(self), BAND_NEUTRAL, dtype=np.int64)
+        codes[self.sentiment >= threshold] = BAND_POSITIVE
+        codes[self.sentiment <= -threshold] = BAND_NEGATIVE
+        return codes
+
+    def group_stats(
+        self,
+        codes: np.ndarray,
+        labels: list[str] | tuple[str, ...],
+        mask: np.ndarray | None = None,
+    ) -> list[GroupStats]:
+        """그룹 코드별 감정 통계를 벡터 연산으로 계산한다.
+
+        Args:
+            codes (np.ndarray): 행별 그룹 코드 배열. `labels`의 인덱스.
+            labels (list[str] | tuple[str, ...]): 그룹 라벨 리스트.
+            mask (np.ndarray | None): 집계에 포함할 행 마스크. None이면 전체 행.
+
+        Returns:
+            list[GroupStats]: 기사가 있는 그룹의 통계 리스트(그룹 코드 순).
+        """
+        rows = np.arange(len(self)) if mask is None else np.flatnonzero(mask)
+        if rows.size == 0:
+            return []
+
+        group_count = len(labels)
+        group_codes = codes[rows]
+        sentiment = self.sentiment[rows]
+
+        counts = np.bincount(group_codes, minlength=group_count)
+        sums = np.bincount(group_codes, weights=sentiment, minlength=group_count)
+        squares = np.bincount(group_codes, weights=sentiment * sentiment, minlength=group_count)
+        relevance_sums = np.bincount(group_codes, weights=self.relevance[rows], minlength=group_count)
+
+        safe_counts = np.maximum(counts, 1)
+        means = sums / safe_counts
+        variances = np.maximum(squares / safe_counts - means * means, 0.0)
+        mean_relevances = relevance_sums / safe_counts
+
+        mins = np.full(group_count, np.inf)
+        maxs = np.full(group_count, -np.inf)
+        np.minimum.at(mins, group_codes, sentiment)
+        np.maximum.at(maxs, group_codes, sentiment)
+
+        # 그룹 최저/최고 점수와 같은 값을 갖는 첫 행을 대표 행으로 선택한다.
+        positions = np.arange(rows.size)
+        min_positions = np.full(group_count, rows.size)
+        max_positions = np.full(group_count, rows.size)
+        is_min = sentiment == mins[group_codes]
+        is_max = sentiment == maxs[group_codes]
+        np.minimum.at(min_positions, group_codes[is_min], positions[is_min])
+        np.minimum.at(max_positions, group_codes[is_max], positions[is_max])
+
+        stats: list[GroupStats] = []
+        for code in np.flatnonzero(counts):
+            min_row = int(rows[min_positions[code]])
+            max_row = int(rows[max_positions[code]])
+            stats.append(
+                GroupStats(
+                    label=labels[code],
+                    count=int(counts[code]),
+                    mean_sentiment=float(means[code]),
+                    var_sentiment=float(variances[code]),
+                    min_sentiment=float(mins[code]),
+                    max_sentiment=float(maxs[code]),
+                    mean_relevance=float(mean_relevances[code]),
+                    min_index=min_row,
+                    max_index=max_row,
+                )
+            )
+        return stats
+
+    def top_publishers(self, mask: np.ndarray, limit: int) -> list[str]:
+        """마스크에 포함된 행에서 기사 수가 많은 발행사를 반환한다.
+
+        Args:
+            mask (np.ndarray): 대상 행 마스크.
+            limit (int): 최대 반환 개수.
+
+        Returns:
+            list[str]: 기사 수 내림차순 발행사 라벨 리스트.
+        """
+        counts = np.bincount(self.publisher_codes[mask], minlength=len(self.publishers))
+        ranked = np.argsort(-counts, kind="stable")
+        labels = [self.publishers[code] for code in ranked if counts[code] > 0 and self.publishers[code]]
+        return labels[:limit]
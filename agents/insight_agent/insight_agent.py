@@ -2,18 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections import Counter
 from typing import Any
 
+import numpy as np
 from google.adk.agents.llm_agent import LlmAgent
-from google.adk.models.lite_llm import LiteLlm
 from google.adk.tools.function_tool import FunctionTool
-from litellm import completion
 
+from agents.insight_agent.aggregation import (
+    BAND_LABELS,
+    BAND_NEGATIVE,
+    BAND_POSITIVE,
+    GroupStats,
+    SentimentFrame,
+)
+from agents.insight_agent.rolling_stats import RollingSentimentStore, SeriesSnapshot
 from common import Insight
+from common.llm_cache import cached_acompletion, create_lite_llm
 from common.logger import get_logger
 from common.prompts import INSIGHT_PROMPT
 from common.settings import settings
 from common.telemetry import instrument_langfuse
+from common.usage import current_budget_directive, note_degradation
 
 logger = get_logger(__name__)
 
@@ -21,14 +33,43 @@ instrument_langfuse()
 
 MIN_RELEVANCE_THRESHOLD = 0.3
 HIGH_SENTIMENT_THRESHOLD = 0.3
+MAX_GROUP_BULLETS = 5
+MIN_SUMMARY_ARTICLES = 3
+MAX_PUBLISHER_SUMMARIES = 3
+LLM_SUMMARY_MAX_CONCURRENCY = 4
+LLM_SUMMARY_TIMEOUT_SEC = 30.0
+
+# 롤링 윈도우 통계 설정: 1시간 버킷 × 7일 윈도우
+ROLLING_BUCKET_SEC = 3600
+ROLLING_WINDOW_BUCKETS = 24 * 7
+ROLLING_EWMA_ALPHA = 0.1
+ROLLING_MAX_SERIES = 2048
+ROLLING_MAX_SEEN_URLS = 50_000
+MIN_BASELINE_ARTICLES = 5
+TREND_Z_SCORE_THRESHOLD = 2.0
+
+ROLLING_STORE = RollingSentimentStore(
+    bucket_sec=ROLLING_BUCKET_SEC,
+    window_buckets=ROLLING_WINDOW_BUCKETS,
+    ewma_alpha=ROLLING_EWMA_ALPHA,
+    max_series=ROLLING_MAX_SERIES,
+    max_seen_urls=ROLLING_MAX_SEEN_URLS,
+)
 
 
-def generate_insights(sentiment_results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+async def generate_insights(
+    sentiment_results: list[dict[str, Any]], query: str = "", min_relevance: float = MIN_RELEVANCE_THRESHOLD
+) -> list[dict[str, Any]]:
     """감정 분석 결과를 바탕으로 실행 가능한 인사이트를 생성한다.
 
+    `query`가 주어지면 결과를 쿼리별 롤링 통계에 반영하고, 이전 실행들로 쌓인 기준선 대비
+    감정 추세 인사이트를 함께 생성한다. 실행 LLM 예산 지시에 따라 LLM 요약 인사이트는 생략될 수 있다.
+
     Args:
         sentiment_results (list[dict[str, Any]]): 감정 분석 결과 리스트.
             각 항목은 {"document": {...}, "sentiment": float, "relevance": float} 형태.
+        query (str): 파이프라인 검색어. 예) "tesla OR nvda".
+        min_relevance (float): 인사이트에 포함할 기사의 최소 관련도.
 
     Returns:
         list[dict[str, Any]]: 인사이트 리스트. Insight 스키마와 호환.
@@ -40,111 +81,294 @@ def generate_insights(sentiment_results: list[dict[str, Any]]) -> list[dict[str,
     logger.info("Generating insights from sentiment results count=%s", len(sentiment_results))
 
     # 관련도가 높은 기사만 필터링
-    relevant_results = [item for item in sentiment_results if item.get("relevance", 0.0) >= MIN_RELEVANCE_THRESHOLD]
+    relevant_results = [item for item in sentiment_results if item.get("relevance", 0.0) >= min_relevance]
 
     if not relevant_results:
         logger.info("No relevant articles found; returning empty result")
         return []
 
-    # 감정별로 그룹화
-    positive_articles = [item for item in relevant_results if item.get("sentiment", 0.0) >= HIGH_SENTIMENT_THRESHOLD]
-    negative_articles = [item for item in relevant_results if item.get("sentiment", 0.0) <= -HIGH_SENTIMENT_THRESHOLD]
+    # LLM 요약(전체 + 발행사 그룹)을 먼저 띄워 두고, 그동안 결정적 집계를 수행한다.
+    # 실행 LLM 예산이 부족하면 요약을 생략하고 결정적 집계 인사이트만 반환한다.
+    summary_groups = _build_summary_groups(relevant_results)
+    directive = current_budget_directive()
+    if directive.skip_llm_summary:
+        note_degradation("insight_summary", directive, skipped_summaries=len(summary_groups))
+        summary_groups = []
+    semaphore = asyncio.Semaphore(LLM_SUMMARY_MAX_CONCURRENCY)
+    summary_tasks = [
+        asyncio.create_task(_generate_llm_summary_insight(articles, insight_title=title, semaphore=semaphore))
+        for title, articles in summary_groups
+    ]
 
-    insights: list[dict[str, Any]] = []
-
-    # 긍정 인사이트 생성
-    if positive_articles:
-        positive_insight = _generate_sentiment_insight(
-            positive_articles,
-            sentiment_type="positive",
-        )
-        if positive_insight:
-            insights.append(positive_insight)
-
-    # 부정 인사이트 생성
-    if negative_articles:
-        negative_insight = _generate_sentiment_insight(
-            negative_articles,
-            sentiment_type="negative",
-        )
-        if negative_insight:
-            insights.append(negative_insight)
+    insights = await asyncio.to_thread(_aggregate_sentiment_insights, relevant_results, query)
 
-    # 전체 요약 인사이트 생성 (LLM 사용)
-    if len(relevant_results) >= 3:
-        summary_insight = _generate_llm_summary_insight(relevant_results)
-        if summary_insight:
-            insights.append(summary_insight)
+    summary_insights = await asyncio.gather(*summary_tasks)
+    insights.extend(insight for insight in summary_insights if insight)
 
     logger.info("Generated insights count=%s", len(insights))
     return insights
 
 
-def _generate_sentiment_insight(
-    articles: list[dict[str, Any]],
-    sentiment_type: str,
-) -> dict[str, Any] | None:
-    """감정 그룹별 인사이트를 생성한다.
+def _aggregate_sentiment_insights(relevant_results: list[dict[str, Any]], query: str = "") -> list[dict[str, Any]]:
+    """관련 기사를 컬럼형 프레임으로 적재해 결정적 인사이트를 생성한다.
 
     Args:
-        articles (list[dict[str, Any]]): 감정 분석 결과 리스트.
-        sentiment_type (str): "positive" 또는 "negative".
+        relevant_results (list[dict[str, Any]]): 관련도 필터를 통과한 감정 분석 결과 리스트.
+        query (str): 파이프라인 검색어. 비어 있으면 롤링 통계를 갱신하지 않는다.
 
     Returns:
-        dict[str, Any] | None: 생성된 인사이트. 없으면 None.
+        list[dict[str, Any]]: 긍정/부정, 발행사별, 시간대별, 기준선 대비 추세 인사이트 리스트.
     """
-    if not articles:
+    frame = SentimentFrame.from_results(relevant_results)
+    bands = frame.band_codes(HIGH_SENTIMENT_THRESHOLD)
+
+    insights: list[dict[str, Any]] = []
+
+    # 감정 구간별 인사이트 생성 (긍정 → 부정)
+    band_stats = {stats.label: stats for stats in frame.group_stats(bands, BAND_LABELS)}
+    for band, sentiment_type in ((BAND_POSITIVE, "positive"), (BAND_NEGATIVE, "negative")):
+        stats = band_stats.get(BAND_LABELS[band])
+        if stats is not None:
+            insights.append(_generate_sentiment_insight(frame, stats, bands == band, sentiment_type))
+
+    # 발행사별 감정 분포 인사이트 생성
+    publisher_stats = [stats for stats in frame.group_stats(frame.publisher_codes, frame.publishers) if stats.label]
+    if len(publisher_stats) >= 2:
+        insights.append(_generate_publisher_insight(publisher_stats))
+
+    # 시간대별 감정 추이 인사이트 생성
+    hour_stats = [stats for stats in frame.group_stats(frame.hour_codes, frame.hours) if stats.label]
+    if len(hour_stats) >= 2:
+        insights.append(_generate_hourly_trend_insight(hour_stats))
+
+    # 롤링 통계 갱신 및 기준선 대비 추세 인사이트 생성
+    if query:
+        trend_insight = _update_rolling_trend(frame, query)
+        if trend_insight:
+            insights.append(trend_insight)
+
+    return insights
+
+
+def _update_rolling_trend(frame: SentimentFrame, query: str) -> dict[str, Any] | None:
+    """새 기사만 쿼리/발행사별 롤링 통계에 반영하고 기준선 대비 추세 인사이트를 생성한다.
+
+    Args:
+        frame (SentimentFrame): 관련 기사 프레임.
+        query (str): 파이프라인 검색어.
+
+    Returns:
+        dict[str, Any] | None: 추세 인사이트. 기준선이 충분히 쌓이지 않았으면 None.
+    """
+    scope = " ".join(query.lower().split())
+    now = time.time()
+
+    new_rows = ROLLING_STORE.filter_new(scope, frame.urls)
+    ROLLING_STORE.update(f"query:{scope}", frame.sentiment[new_rows], now)
+
+    # 발행사 코드로 정렬한 뒤 경계에서 나누어 발행사별 배치를 한 번에 반영한다.
+    codes = frame.publisher_codes[new_rows]
+    values = frame.sentiment[new_rows]
+    order = np.argsort(codes, kind="stable")
+    boundaries = np.flatnonzero(np.diff(codes[order])) + 1
+    for group in np.split(order, boundaries):
+        publisher = frame.publishers[codes[group[0]]] if group.size else ""
+        if publisher:
+            ROLLING_STORE.update(f"query:{scope}|publisher:{publisher}", values[group], now)
+
+    snapshot = ROLLING_STORE.snapshot(f"query:{scope}", now)
+    logger.info("Updated rolling sentiment stats query=%s new_articles=%s", scope, int(new_rows.sum()))
+    if snapshot is None or snapshot.baseline_count < MIN_BASELINE_ARTICLES or snapshot.current_count == 0:
         return None
 
-    avg_sentiment = sum(item.get("sentiment", 0.0) for item in articles) / len(articles)
-    avg_relevance = sum(item.get("relevance", 0.0) for item in articles) / len(articles)
+    bullets = [
+        f"현재 평균 감정 점수: {snapshot.current_mean:+.2f} ({snapshot.current_count}개)",
+        f"기준선 평균 감정 점수: {snapshot.baseline_mean:+.2f} "
+        f"(표준편차 {snapshot.baseline_std:.2f}, {snapshot.baseline_count}개, 최근 {ROLLING_WINDOW_BUCKETS * ROLLING_BUCKET_SEC // 3600}시간)",
+        f"기준선 대비 변화: {snapshot.shift:+.2f} (z={snapshot.z_score:+.1f})",
+        f"감정 EWMA: {snapshot.ewma:+.2f}",
+    ]
+
+    # 기준선이 있는 발행사 중 변화가 큰 순서로 추가
+    publisher_shifts: list[tuple[str, SeriesSnapshot]] = []
+    for publisher in frame.publishers:
+        if not publisher:
+            continue
+        publisher_snapshot = ROLLING_STORE.snapshot(f"query:{scope}|publisher:{publisher}", now)
+        if publisher_snapshot and publisher_snapshot.baseline_count and publisher_snapshot.current_count:
+            publisher_shifts.append((publisher, publisher_snapshot))
+    publisher_shifts.sort(key=lambda pair: abs(pair[1].shift), reverse=True)
+    for publisher, publisher_snapshot in publisher_shifts[:3]:
+        bullets.append(f"{publisher} 변화: {publisher_snapshot.shift:+.2f} ({publisher_snapshot.current_count}개)")
+
+    direction = "상승" if snapshot.shift > 0 else "하락" if snapshot.shift < 0 else "유지"
+    insight = Insight(
+        title=f"'{' '.join(query.split())}' 감정 추세 {direction} (기준선 대비 {snapshot.shift:+.2f})",
+        bullets=bullets,
+        actionable=abs(snapshot.z_score) >= TREND_Z_SCORE_THRESHOLD,
+        confidence=round(min(1.0, snapshot.baseline_count / (snapshot.baseline_count + MIN_BASELINE_ARTICLES)), 2),
+    )
 
-    # 제목과 발행사 추출
-    titles = []
-    publishers = set()
-    for item in articles[:5]:  # 최대 5개만
-        doc = item.get("document", {})
-        title = doc.get("title", "")
-        publisher = doc.get("publisher", "")
-        if title:
-            titles.append(title)
+    return insight.model_dump()
+
+
+def _build_summary_groups(relevant_results: list[dict[str, Any]]) -> list[tuple[str, list[dict[str, Any]]]]:
+    """LLM 요약 대상 그룹(전체 + 기사 수 상위 발행사)을 구성한다.
+
+    Args:
+        relevant_results (list[dict[str, Any]]): 관련도 필터를 통과한 감정 분석 결과 리스트.
+
+    Returns:
+        list[tuple[str, list[dict[str, Any]]]]: (인사이트 제목, 그룹 기사 리스트) 튜플 리스트.
+    """
+    if len(relevant_results) < MIN_SUMMARY_ARTICLES:
+        return []
+
+    groups: list[tuple[str, list[dict[str, Any]]]] = [("전체 시장 동향 분석", relevant_results)]
+
+    by_publisher: dict[str, list[dict[str, Any]]] = {}
+    for item in relevant_results:
+        publisher = (item.get("document") or {}).get("publisher")
         if publisher:
-            publishers.add(publisher)
+            by_publisher.setdefault(publisher, []).append(item)
+
+    # 단일 발행사만 있으면 전체 요약과 동일하므로 그룹 요약을 생략한다.
+    if len(by_publisher) < 2:
+        return groups
+
+    counts = Counter({publisher: len(items) for publisher, items in by_publisher.items()})
+    for publisher, count in counts.most_common(MAX_PUBLISHER_SUMMARIES):
+        if count < MIN_SUMMARY_ARTICLES:
+            break
+        groups.append((f"{publisher} 보도 동향 분석", by_publisher[publisher]))
+
+    return groups
+
+
+def _generate_sentiment_insight(
+    frame: SentimentFrame,
+    stats: GroupStats,
+    mask: np.ndarray,
+    sentiment_type: str,
+) -> dict[str, Any]:
+    """감정 구간별 인사이트를 생성한다.
+
+    Args:
+        frame (SentimentFrame): 관련 기사 프레임.
+        stats (GroupStats): 감정 구간 통계.
+        mask (np.ndarray): 감정 구간에 속한 행 마스크.
+        sentiment_type (str): "positive" 또는 "negative".
+
+    Returns:
+        dict[str, Any]: 생성된 인사이트.
+    """
+    publishers = frame.top_publishers(mask, limit=3)
 
     if sentiment_type == "positive":
-        title = f"긍정적 시장 신호 감지 ({len(articles)}개 기사)"
-        bullets = [
-            f"평균 감정 점수: {avg_sentiment:.2f} (긍정)",
-            f"관련 기사 수: {len(articles)}개",
-            f"주요 발행사: {', '.join(list(publishers)[:3])}",
-        ]
+        title = f"긍정적 시장 신호 감지 ({stats.count}개 기사)"
+        label = "긍정"
+        representative_title = frame.titles[stats.max_index]
     else:
-        title = f"부정적 시장 신호 감지 ({len(articles)}개 기사)"
-        bullets = [
-            f"평균 감정 점수: {avg_sentiment:.2f} (부정)",
-            f"관련 기사 수: {len(articles)}개",
-            f"주요 발행사: {', '.join(list(publishers)[:3])}",
-        ]
+        title = f"부정적 시장 신호 감지 ({stats.count}개 기사)"
+        label = "부정"
+        representative_title = frame.titles[stats.min_index]
 
-    # 대표 기사 제목 추가
-    if titles:
-        bullets.append(f"주요 기사: {titles[0][:80]}...")
+    bullets = [
+        f"평균 감정 점수: {stats.mean_sentiment:.2f} ({label}, 표준편차 {stats.std_sentiment:.2f})",
+        f"감정 점수 범위: {stats.min_sentiment:.2f} ~ {stats.max_sentiment:.2f}",
+        f"관련 기사 수: {stats.count}개",
+        f"주요 발행사: {', '.join(publishers)}",
+    ]
+
+    # 가장 극단적인 감정의 기사를 대표 기사로 추가
+    if representative_title:
+        bullets.append(f"주요 기사: {representative_title[:80]}...")
 
     insight = Insight(
         title=title,
         bullets=bullets,
         actionable=True,
-        confidence=round(avg_relevance, 2),
+        confidence=round(stats.mean_relevance, 2),
     )
 
     return insight.model_dump()
 
 
-def _generate_llm_summary_insight(articles: list[dict[str, Any]]) -> dict[str, Any] | None:
-    """LLM을 사용하여 전체 요약 인사이트를 생성한다.
+def _generate_publisher_insight(publisher_stats: list[GroupStats]) -> dict[str, Any]:
+    """발행사별 감정 분포 인사이트를 생성한다.
+
+    Args:
+        publisher_stats (list[GroupStats]): 발행사별 통계 리스트.
+
+    Returns:
+        dict[str, Any]: 생성된 인사이트.
+    """
+    ranked = sorted(publisher_stats, key=lambda stats: stats.count, reverse=True)
+    bullets = [
+        f"{stats.label}: 평균 {stats.mean_sentiment:+.2f} (표준편차 {stats.std_sentiment:.2f}, {stats.count}개)"
+        for stats in ranked[:MAX_GROUP_BULLETS]
+    ]
+
+    # 발행사 간 평균 감정 격차가 크면 보도 관점이 엇갈린다고 판단한다.
+    means = [stats.mean_sentiment for stats in ranked[:MAX_GROUP_BULLETS]]
+    spread = max(means) - min(means)
+    total = sum(stats.count for stats in publisher_stats)
+    confidence = sum(stats.mean_relevance * stats.count for stats in publisher_stats) / total
+
+    insight = Insight(
+        title=f"발행사별 감정 분포 ({len(publisher_stats)}개 발행사)",
+        bullets=bullets,
+        actionable=spread >= HIGH_SENTIMENT_THRESHOLD,
+        confidence=round(confidence, 2),
+    )
+
+    return insight.model_dump()
+
+
+def _generate_hourly_trend_insight(hour_stats: list[GroupStats]) -> dict[str, Any]:
+    """시간대별 감정 추이 인사이트를 생성한다.
+
+    Args:
+        hour_stats (list[GroupStats]): 시간대별 통계 리스트.
+
+    Returns:
+        dict[str, Any]: 생성된 인사이트.
+    """
+    # 라벨이 ISO8601 접두사이므로 문자열 정렬이 시간 순서와 같다.
+    ordered = sorted(hour_stats, key=lambda stats: stats.label)
+    recent = ordered[-MAX_GROUP_BULLETS:]
+    shift = ordered[-1].mean_sentiment - ordered[0].mean_sentiment
+
+    bullets = [
+        f"{stats.label.replace('T', ' ')}시: 평균 {stats.mean_sentiment:+.2f} ({stats.count}개)" for stats in recent
+    ]
+    bullets.append(f"감정 변화: {ordered[0].mean_sentiment:+.2f} → {ordered[-1].mean_sentiment:+.2f} ({shift:+.2f})")
+
+    total = sum(stats.count for stats in hour_stats)
+    confidence = sum(stats.mean_relevance * stats.count for stats in hour_stats) / total
+
+    insight = Insight(
+        title=f"시간대별 감정 추이 ({len(hour_stats)}개 시간대)",
+        bullets=bullets,
+        actionable=abs(shift) >= HIGH_SENTIMENT_THRESHOLD,
+        confidence=round(confidence, 2),
+    )
+
+    return insight.model_dump()
+
+
+async def _generate_llm_summary_insight(
+    articles: list[dict[str, Any]],
+    *,
+    insight_title: str,
+    semaphore: asyncio.Semaphore,
+) -> dict[str, Any] | None:
+    """LLM을 사용하여 기사 그룹의 요약 인사이트를 생성한다.
 
     Args:
         articles (list[dict[str, Any]]): 감정 분석 결과 리스트.
+        insight_title (str): 생성할 인사이트 제목.
+        semaphore (asyncio.Semaphore): 동시 LLM 호출 수를 제한하는 세마포어.
 
     Returns:
         dict[str, Any] | None: 생성된 인사이트. 실패 시 None.
@@ -177,18 +401,22 @@ def _generate_llm_summary_insight(articles: list[dict[str, Any]]) -> dict[str, A
 각 항목은 한 줄로 간결하게 작성하고, 불렛 포인트 형식으로 반환하세요."""
 
     try:
-        response = completion(
-            model=settings.openai_model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.3,
-            max_tokens=200,
-        )
+        async with semaphore:
+            response = await asyncio.wait_for(
+                cached_acompletion(
+                    model=settings.openai_model,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0.3,
+                    max_tokens=200,
+                ),
+                timeout=LLM_SUMMARY_TIMEOUT_SEC,
+            )
 
         content = response.choices[0].message.content.strip()
         bullets = [line.strip() for line in content.split("\n") if line.strip() and not line.strip().startswith("#")]
 
         insight = Insight(
-            title="전체 시장 동향 분석",
+            title=insight_title,
             bullets=bullets[:5],  # 최대 5개
             actionable=True,
             confidence=0.85,
@@ -196,13 +424,16 @@ def _generate_llm_summary_insight(articles: list[dict[str, Any]]) -> dict[str, A
 
         return insight.model_dump()
 
+    except TimeoutError:
+        logger.info("LLM summary generation timed out title=%s", insight_title)
+        return None
     except Exception as exc:
-        logger.info("LLM summary generation failed: %s", exc)
+        logger.info("LLM summary generation failed title=%s: %s", insight_title, exc)
         return None
 
 
 INSIGHT_TOOL = FunctionTool(func=generate_insights)
-INSIGHT_MODEL = LiteLlm(model=settings.openai_model, tool_choice="auto")
+INSIGHT_MODEL = create_lite_llm(settings.openai_model, tool_choice="auto")
 
 INSIGHT_AGENT = LlmAgent(
     name="finance_news_insight_agent",
@@ -0,0 +1,265 @@
+"""온라인 롤링 윈도우 감정 통계 저장소 모듈.
+
+반복 실행되는 워치리스트 파이프라인의 감정 점수를 시간 버킷 단위로 누적한다.
+윈도우 합계를 증분 갱신하므로 새 기사 하나당 O(1)로 기준선 대비 추세를 계산할 수 있다.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+
+import numpy as np
+
+
+class _Moments:
+    """개수, 합, 제곱합으로 평균과 분산을 계산하는 누적 모멘트."""
+
+    __slots__ = ("count", "total", "squares")
+
+    def __init__(self, count: int = 0, total: float = 0.0, squares: float = 0.0) -> None:
+        """_Moments 인스턴스를 초기화한다."""
+        self.count = count
+        self.total = total
+        self.squares = squares
+
+    def add(self, other: _Moments) -> None:
+        """다른 모멘트를 더한다."""
+        self.count += other.count
+        self.total += other.total
+        self.squares += other.squares
+
+    def subtract(self, other: _Moments) -> None:
+        """다른 모멘트를 뺀다."""
+        self.count -= other.count
+        self.total -= other.total
+        self.squares -= other.squares
+
+    @property
+    def mean(self) -> float:
+        """평균."""
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def variance(self) -> float:
+        """모분산."""
+        if not self.count:
+            return 0.0
+        mean = self.mean
+        return max(self.squares / self.count - mean * mean, 0.0)
+
+
+@dataclass(frozen=True, slots=True)
+class SeriesSnapshot:
+    """감정 시계열의 현재 버킷과 기준선 비교 결과.
+
+    Attributes:
+        current_count (int): 현재 버킷 기사 수.
+        current_mean (float): 현재 버킷 평균 감정 점수.
+        baseline_count (int): 기준선(윈도우 내 이전 버킷) 기사 수.
+        baseline_mean (float): 기준선 평균 감정 점수.
+        baseline_std (float): 기준선 감정 점수 표준편차.
+        ewma (float): 기사 단위 지수가중이동평균.
+    """
+
+    current_count: int
+    current_mean: float
+    baseline_count: int
+    baseline_mean: float
+    baseline_std: float
+    ewma: float
+
+    @property
+    def shift(self) -> float:
+        """기준선 대비 현재 평균 변화량."""
+        return self.current_mean - self.baseline_mean
+
+    @property
+    def z_score(self) -> float:
+        """기준선 표준편차로 정규화한 변화량. 표준편차가 0이면 0."""
+        return self.shift / self.baseline_std if self.baseline_std > 0 else 0.0
+
+
+class SentimentSeries:
+    """시간 버킷 링 버퍼로 관리되는 단일 감정 시계열."""
+
+    __slots__ = ("_buckets", "_window", "_bucket_sec", "_max_buckets", "ewma")
+
+    def __init__(self, *, bucket_sec: int, max_buckets: int) -> None:
+        """SentimentSeries 인스턴스를 초기화한다.
+
+        Args:
+            bucket_sec (int): 버킷 크기(초).
+            max_buckets (int): 윈도우에 유지할 최대 버킷 수.
+        """
+        self._buckets: deque[tuple[int, _Moments]] = deque()
+        self._window = _Moments()
+        self._bucket_sec = bucket_sec
+        self._max_buckets = max_buckets
+        self.ewma: float | None = None
+
+    def add_batch(self, values: np.ndarray, now: float, alpha: float) -> None:
+        """현재 버킷에 감정 점수 배치를 추가하고 EWMA를 갱신한다.
+
+        Args:
+            values (np.ndarray): 도착 순서의 감정 점수 배열.
+            now (float): 현재 시각(epoch 초).
+            alpha (float): EWMA 평활 계수.
+        """
+        if values.size == 0:
+            return
+
+        bucket_start = self._advance(now)
+        if not self._buckets or self._buckets[-1][0] != bucket_start:
+            self._buckets.append((bucket_start, _Moments()))
+
+        batch = _Moments(int(values.size), float(values.sum()), float(np.dot(values, values)))
+        self._buckets[-1][1].add(batch)
+        self._window.add(batch)
+
+        # 순차 EWMA 갱신을 가중합 한 번으로 계산한다: 최신 값일수록 가중치가 크다.
+        decay = 1.0 - alpha
+        weights = alpha * decay ** np.arange(values.size - 1, -1, -1, dtype=np.float64)
+        carried = self.ewma * decay**values.size if self.ewma is not None else 0.0
+        if self.ewma is None:
+            # 첫 배치는 첫 값을 초기 EWMA로 사용한다.
+            weights[0] = decay ** (values.size - 1)
+        self.ewma = float(carried + np.dot(weights, values))
+
+    def snapshot(self, now: float) -> SeriesSnapshot | None:
+        """현재 버킷과 기준선 비교 결과를 반환한다.
+
+        Args:
+            now (float): 현재 시각(epoch 초).
+
+        Returns:
+            SeriesSnapshot | None: 비교 결과. 윈도우에 데이터가 없으면 None.
+        """
+        bucket_start = self._advance(now)
+        if not self._buckets or self.ewma is None:
+            return None
+
+        current = self._buckets[-1][1] if self._buckets[-1][0] == bucket_start else _Moments()
+        baseline = _Moments(self._window.count, self._window.total, self._window.squares)
+        baseline.subtract(current)
+
+        return SeriesSnapshot(
+            current_count=current.count,
+            current_mean=current.mean,
+            baseline_count=baseline.count,
+            baseline_mean=baseline.mean,
+            baseline_std=float(np.sqrt(baseline.variance)),
+            ewma=self.ewma,
+        )
+
+    def _advance(self, now: float) -> int:
+        """윈도우 밖으로 밀려난 버킷을 제거하고 현재 버킷 시작 시각을 반환한다.
+
+        Args:
+            now (float): 현재 시각(epoch 초).
+
+        Returns:
+            int: 현재 버킷 시작 시각(epoch 초).
+        """
+        bucket_start = int(now // self._bucket_sec) * self._bucket_sec
+        oldest_allowed = bucket_start - (self._max_buckets - 1) * self._bucket_sec
+        while self._buckets and self._buckets[0][0] < oldest_allowed:
+            _, expired = self._buckets.popleft()
+            self._window.subtract(expired)
+        return bucket_start
+
+
+class RollingSentimentStore:
+    """쿼리/발행사별 감정 시계열을 보관하는 메모리 한정 저장소.
+
+    시계열 수와 URL 중복 확인 집합은 LRU로 상한을 유지하며, 모든 메서드는 스레드 안전하다.
+    """
+
+    def __init__(
+        self,
+        *,
+        bucket_sec: int,
+        window_buckets: int,
+        ewma_alpha: float,
+        max_series: int,
+        max_seen_urls: int,
+    ) -> None:
+        """RollingSentimentStore 인스턴스를 초기화한다.
+
+        Args:
+            bucket_sec (int): 버킷 크기(초).
+            window_buckets (int): 윈도우에 유지할 버킷 수.
+            ewma_alpha (float): EWMA 평활 계수(0에서 1 사이).
+            max_series (int): 유지할 최대 시계열 수.
+            max_seen_urls (int): 중복 확인용으로 기억할 최대 URL 수.
+        """
+        self._bucket_sec = max(1, bucket_sec)
+        self._window_buckets = max(2, window_buckets)
+        self._ewma_alpha = min(max(ewma_alpha, 0.0), 1.0)
+        self._max_series = max(1, max_series)
+        self._max_seen_urls = max(1, max_seen_urls)
+        self._series: OrderedDict[str, SentimentSeries] = OrderedDict()
+        self._seen_urls: OrderedDict[tuple[str, str], None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def filter_new(self, scope: str, urls: list[str]) -> np.ndarray:
+        """이전 실행에서 이미 반영한 기사를 제외하는 마스크를 반환하고, 새 URL을 기록한다.
+
+        Args:
+            scope (str): 중복 판단 범위(예: 정규화된 쿼리).
+            urls (list[str]): 기사 URL 리스트. 빈 문자열은 항상 새 기사로 간주한다.
+
+        Returns:
+            np.ndarray: 새 기사면 True인 불리언 마스크.
+        """
+        mask = np.ones(len(urls), dtype=bool)
+        with self._lock:
+            for row, url in enumerate(urls):
+                if not url:
+                    continue
+                key = (scope, url)
+                if key in self._seen_urls:
+                    self._seen_urls.move_to_end(key)
+                    mask[row] = False
+                    continue
+                self._seen_urls[key] = None
+            while len(self._seen_urls) > self._max_seen_urls:
+                self._seen_urls.popitem(last=False)
+        return mask
+
+    def update(self, key: str, values: np.ndarray, now: float) -> None:
+        """시계열에 감정 점수 배치를 추가한다.
+
+        Args:
+            key (str): 시계열 키.
+            values (np.ndarray): 감정 점수 배열.
+            now (float): 현재 시각(epoch 초).
+        """
+        if values.size == 0:
+            return
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = SentimentSeries(bucket_sec=self._bucket_sec, max_buckets=self._window_buckets)
+                self._series[key] = series
+            self._series.move_to_end(key)
+            series.add_batch(values, now, self._ewma_alpha)
+            while len(self._series) > self._max_series:
+                self._series.popitem(last=False)
+
+    def snapshot(self, key: str, now: float) -> SeriesSnapshot | None:
+        """시계열의 기준선 비교 결과를 반환한다.
+
+        Args:
+            key (str): 시계열 키.
+            now (float): 현재 시각(epoch 초).
+
+        Returns:
+            SeriesSnapshot | None: 비교 결과. 시계열이 없으면 None.
+        """
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                return None
+            return series.snapshot(now)
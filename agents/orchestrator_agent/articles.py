@@ -0,0 +1,126 @@
+"""오케스트레이터 기사 저장소 기록/조회 모듈.
+
+모든 단계 출력이 오케스트레이터를 거치므로, 오케스트레이터가 단일 기록자로서 각 단계 출력을 기사 저장소에
+일괄 기록한다. 크롤링/본문 추출 결과는 기사로, 감정 분석 결과는 검색어별 점수로, 인사이트는 실행별로 저장한다.
+중복 제거/본문 축약 단계는 새 데이터를 만들지 않으므로 기록하지 않는다.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from a2a.server.apps import A2AFastAPIApplication
+from fastapi import APIRouter, HTTPException, Query
+
+from agents.orchestrator_agent.checkpoints import STAGE_BY_TOOL
+from common import fast_json
+from common.article_store import ARTICLES, DEFAULT_SEARCH_LIMIT, MAX_SEARCH_LIMIT
+from common.logger import get_logger
+from common.usage import current_ledger
+
+if TYPE_CHECKING:
+    from google.adk.tools.base_tool import BaseTool
+    from google.adk.tools.tool_context import ToolContext
+
+logger = get_logger(__name__)
+
+
+def _as_list(value: Any) -> Any:
+    """툴 응답(`{"result": ...}` 또는 JSON 문자열)을 파싱한다. 파싱할 수 없으면 None."""
+    if isinstance(value, dict) and set(value) == {"result"}:
+        value = value["result"]
+    if isinstance(value, str):
+        try:
+            value = fast_json.loads(value)
+        except ValueError:
+            return None
+    return value
+
+
+async def record_stage_output(stage: str, value: Any, *, query: str, run_id: str | None) -> None:
+    """단계 출력을 기사 저장소에 기록한다. 저장소 오류는 파이프라인을 중단하지 않도록 로그만 남긴다.
+
+    Args:
+        stage (str): 체크포인트 단계 이름. 예) "crawl", "sentiment".
+        value (Any): 단계 출력(툴 응답).
+        query (str): 파이프라인 검색어.
+        run_id (str | None): 실행 ID.
+    """
+    if ARTICLES is None or stage not in ("crawl", "parse", "sentiment", "insight"):
+        return
+    try:
+        if stage == "insight":
+            if run_id:
+                await ARTICLES.record_insights(_as_list(value) or value, query=query, run_id=run_id)
+            return
+        items = _as_list(value)
+        if not isinstance(items, list) or not items:
+            return
+        if stage == "sentiment":
+            count = await ARTICLES.record_sentiments(items, query=query, run_id=run_id)
+        else:
+            count = await ARTICLES.record_documents(items, query=query, run_id=run_id)
+        logger.info("Articles recorded stage=%s count=%s", stage, count)
+    except sqlite3.Error as exc:
+        logger.info("Article store write failed stage=%s error=%s", stage, exc)
+
+
+async def record_stage_articles(
+    tool: BaseTool, args: dict[str, Any], tool_context: ToolContext, tool_response: Any
+) -> dict[str, Any] | None:
+    """완료한 단계의 출력을 기사 저장소에 기록한다. (after_tool_callback)"""
+    from tools.pipeline_cache_tool import PIPELINE_CACHE_STATE_KEY
+
+    stage = STAGE_BY_TOOL.get(tool.name)
+    if stage is None or ARTICLES is None:
+        return None
+    params = (tool_context.state.get(PIPELINE_CACHE_STATE_KEY) or {}).get("params") or [""]
+    ledger = current_ledger()
+    await record_stage_output(
+        stage, tool_response, query=str(params[0]), run_id=ledger.run_id if ledger is not None else None
+    )
+    return None
+
+
+def _parse_time(value: str | None) -> float | None:
+    """ISO8601 시각 쿼리 파라미터를 Unix 시각으로 변환한다."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=f"Invalid ISO8601 time: {value}") from exc
+
+
+def attach_http_articles(app: A2AFastAPIApplication) -> None:
+    """저장된 기사 조회(`GET /articles`)와 검색어별 인사이트 이력(`GET /articles/insights`) 엔드포인트를 추가한다.
+    `article_store_enabled` 설정이 꺼져 있으면 아무것도 추가하지 않는다.
+    """
+    if ARTICLES is None:
+        return
+
+    router = APIRouter()
+
+    @router.get("/articles")
+    async def search_articles(
+        query: str | None = Query(default=None, description="파이프라인 검색어"),
+        publisher: str | None = Query(default=None, description="발행 매체 이름"),
+        since: str | None = Query(default=None, description="이 시각(ISO8601) 이후 발행된 기사"),
+        until: str | None = Query(default=None, description="이 시각(ISO8601) 이전 발행된 기사"),
+        limit: int = Query(default=DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_SEARCH_LIMIT),
+    ) -> dict[str, Any]:
+        articles = await ARTICLES.search(
+            query=query, publisher=publisher, since=_parse_time(since), until=_parse_time(until), limit=limit
+        )
+        return {"count": len(articles), "articles": articles}
+
+    @router.get("/articles/insights")
+    async def recent_insights(
+        query: str = Query(description="파이프라인 검색어"),
+        limit: int = Query(default=10, ge=1, le=100),
+    ) -> dict[str, Any]:
+        return {"query": query, "insights": await ARTICLES.recent_insights(query, limit)}
+
+    app.include_router(router)
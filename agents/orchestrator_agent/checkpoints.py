@@ -0,0 +1,80 @@
+"""오케스트레이터 단계 체크포인트 콜백 모듈.
+
+툴 호출 결과를 실행 ID(`X-Run-Id`)별 단계 체크포인트로 툴 인자 해시와 함께 저장하고, 같은 실행 ID에서 같은 인자로
+다시 호출된 단계는 서브 에이전트나 로컬 툴을 호출하지 않고 저장된 출력을 반환한다. 재시도한 실행은 마지막으로
+완료한 단계 다음부터 실제로 실행된다. 인자가 다르면(다른 검색어, 줄어든 page_size/text_limit 등) 툴을 실행하고
+체크포인트를 덮어쓴다.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from common.checkpoints import CHECKPOINTS, STAGE_PARAMS, args_digest
+from common.logger import get_logger
+from common.usage import current_ledger
+
+if TYPE_CHECKING:
+    from google.adk.tools.base_tool import BaseTool
+    from google.adk.tools.tool_context import ToolContext
+
+logger = get_logger(__name__)
+
+# 오케스트레이터 툴 이름 -> 체크포인트 단계
+STAGE_BY_TOOL = {
+    "crawler_agent": "crawl",
+    "parser_agent": "parse",
+    "dedupe_documents": "dedupe",
+    "truncate_documents": "truncate",
+    "sentiment_agent": "sentiment",
+    "insight_agent": "insight",
+}
+# 실행 파라미터를 기록할 툴 (결과 캐시 조회 시 추출된 파라미터)
+PARAMS_TOOL = "lookup_pipeline_cache"
+
+# 체크포인트로 대신한 툴 호출 ID (after_tool_callback에서 다시 저장하지 않는다)
+_RESTORED_CALLS: set[str] = set()
+
+
+def _current_run_id() -> str | None:
+    """현재 요청의 실행 ID. 체크포인트를 쓰지 않으면 None."""
+    ledger = current_ledger()
+    if CHECKPOINTS is None or ledger is None:
+        return None
+    return ledger.run_id
+
+
+async def restore_stage_checkpoint(tool: BaseTool, args: dict[str, Any], tool_context: ToolContext) -> Any | None:
+    """같은 실행에서 같은 인자로 이미 완료한 단계면 저장된 출력을 반환하여 툴 호출을 건너뛴다. (before_tool_callback)"""
+    stage = STAGE_BY_TOOL.get(tool.name)
+    run_id = _current_run_id()
+    if stage is None or run_id is None:
+        return None
+    found, value = await CHECKPOINTS.load(run_id, stage, args_hash=args_digest(args))
+    if not found:
+        return None
+    logger.info("Stage restored from checkpoint run_id=%s stage=%s", run_id, stage)
+    if tool_context.function_call_id:
+        _RESTORED_CALLS.add(tool_context.function_call_id)
+    return value if isinstance(value, dict) else {"result": value}
+
+
+async def save_stage_checkpoint(
+    tool: BaseTool, args: dict[str, Any], tool_context: ToolContext, tool_response: Any
+) -> dict[str, Any] | None:
+    """완료한 단계의 출력(결과 캐시 조회 툴은 실행 파라미터)을 체크포인트로 저장한다. (after_tool_callback)"""
+    if tool_context.function_call_id in _RESTORED_CALLS:
+        _RESTORED_CALLS.discard(tool_context.function_call_id)
+        return None
+    run_id = _current_run_id()
+    if run_id is None:
+        return None
+    if tool.name == PARAMS_TOOL:
+        await CHECKPOINTS.save(run_id, STAGE_PARAMS, args)
+        return None
+    stage = STAGE_BY_TOOL.get(tool.name)
+    if stage is None:
+        return None
+    await CHECKPOINTS.save(run_id, stage, tool_response, args_hash=args_digest(args))
+    logger.info("Stage checkpoint saved run_id=%s stage=%s", run_id, stage)
+    return None
@@ -2,59 +2,119 @@
 
 from __future__ import annotations
 
+import httpx
+from a2a.client import ClientConfig, ClientFactory
+from a2a.types import TransportProtocol
 from google.adk.agents.llm_agent import LlmAgent
 from google.adk.agents.remote_a2a_agent import (
     AGENT_CARD_WELL_KNOWN_PATH,
     RemoteA2aAgent,
 )
-from google.adk.models.lite_llm import LiteLlm
 from google.adk.tools.agent_tool import AgentTool
 
+from agents.helpers.load_balancer import register_sub_agent
+from agents.helpers.scheduler import create_stage_limited_transport
+from agents.helpers.structured_data import create_structured_genai_part_converter, structured_data_event_hooks
+from agents.orchestrator_agent.articles import record_stage_articles
+from agents.orchestrator_agent.checkpoints import restore_stage_checkpoint, save_stage_checkpoint
+from common.deadline import deadline_event_hooks
+from common.http_clients import HTTP_CLIENTS
+from common.llm_cache import create_lite_llm
 from common.logger import get_logger
 from common.prompts import ORCHESTRATOR_PROMPT
 from common.settings import settings
 from common.telemetry import instrument_langfuse
+from common.usage import usage_event_hooks
 from tools.dedupe_tool import create_dedupe_tool
+from tools.pipeline_cache_tool import answer_from_pipeline_cache, create_pipeline_cache_tool, store_pipeline_result
+from tools.truncate_tool import create_truncate_tool
 
 logger = get_logger(__name__)
 
+REMOTE_AGENT_TIMEOUT_SEC = 600.0
 
-def _build_agent_card_url(agent_public_host: str, agent_public_port: int) -> str:
-    """에이전트 카드 URL을 생성한다.
+
+def _build_agent_card_url(agent_name: str) -> str:
+    """서브 에이전트 복제본을 로드 밸런서에 등록하고 에이전트 카드 URL을 생성한다.
+
+    카드는 첫 번째 복제본 주소로 조회하지만, 어느 복제본 주소로 보내는 요청이든 로드 밸런서가 복제본 중 하나로 분산한다.
 
     Args:
-        agent_public_host (str): 공개된 에이전트 호스트.
-        agent_public_port (int): 공개된 에이전트 포트.
+        agent_name (str): 서브 에이전트 이름. 예) "parser".
 
     Returns:
         str: well-known 경로가 포함된 카드 URL.
     """
-    normalized = f"http://{agent_public_host}:{agent_public_port}"
+    normalized = register_sub_agent(agent_name)[0]
     return f"{normalized.rstrip('/')}/{AGENT_CARD_WELL_KNOWN_PATH}"
 
 
 OPENAI_MODEL_NAME = settings.openai_model
-LLM_MODEL = LiteLlm(model=OPENAI_MODEL_NAME, tool_choice="auto")
+LLM_MODEL = create_lite_llm(OPENAI_MODEL_NAME, tool_choice="auto")
+
+# 서브 에이전트 호출에 트레이스 컨텍스트(traceparent)와 실행 ID/예산 지시를 전파하고,
+# 응답의 LLM 사용량을 실행 원장에 합산하는 공유 A2A 클라이언트 팩토리 (프로세스 공용 커넥션 풀 사용)
+# 구조화 데이터 확장을 광고한 서브 에이전트에는 큰 요청 본문을 압축하여 보내고,
+# 복제본이 여러 개인 서브 에이전트는 전송 계층에서 처리 중 요청이 가장 적은 복제본으로 분산한다.
+# 요청의 남은 데드라인을 전파하고, 서브 에이전트별 서킷 브레이커와 (설정 시) 헤지 요청을 적용한다.
+# 서브 에이전트별 동시 호출 수는 프로세스 전역 상한(`*_AGENT_MAX_CONCURRENCY`)을 넘지 않는다.
+_USAGE_HOOKS = usage_event_hooks()
+_STRUCTURED_DATA_HOOKS = structured_data_event_hooks()
+_DEADLINE_HOOKS = deadline_event_hooks()
+REMOTE_AGENT_HTTP_CLIENT = HTTP_CLIENTS.async_client(
+    "agents",
+    timeout=httpx.Timeout(REMOTE_AGENT_TIMEOUT_SEC),
+    transport=create_stage_limited_transport(),
+    event_hooks={
+        "request": [*_DEADLINE_HOOKS["request"], *_USAGE_HOOKS["request"], *_STRUCTURED_DATA_HOOKS["request"]],
+        "response": [*_USAGE_HOOKS["response"], *_STRUCTURED_DATA_HOOKS["response"]],
+    },
+)
+REMOTE_AGENT_CLIENT_FACTORY = ClientFactory(
+    config=ClientConfig(
+        httpx_client=REMOTE_AGENT_HTTP_CLIENT,
+        streaming=False,
+        polling=False,
+        supported_transports=[TransportProtocol.jsonrpc],
+    )
+)
+
+CRAWLER_AGENT_CARD_URL = _build_agent_card_url("crawler")
+PARSER_AGENT_CARD_URL = _build_agent_card_url("parser")
+SENTIMENT_AGENT_CARD_URL = _build_agent_card_url("sentiment")
+INSIGHT_AGENT_CARD_URL = _build_agent_card_url("insight")
+
+# 서버 시작 시 서브 에이전트마다 미리 연결해 두어 첫 호출의 연결 수립 지연을 없앤다.
+for _card_url in (CRAWLER_AGENT_CARD_URL, PARSER_AGENT_CARD_URL, SENTIMENT_AGENT_CARD_URL, INSIGHT_AGENT_CARD_URL):
+    HTTP_CLIENTS.register_warmup("agents", _card_url)
 
 CRAWLER_AGENT = RemoteA2aAgent(
     name="crawler_agent",
     description="Collect financial news metadata within a given lookback window.",
-    agent_card=_build_agent_card_url(settings.crawler_agent_public_host, settings.crawler_agent_public_port),
+    agent_card=CRAWLER_AGENT_CARD_URL,
+    a2a_client_factory=REMOTE_AGENT_CLIENT_FACTORY,
+    genai_part_converter=create_structured_genai_part_converter(CRAWLER_AGENT_CARD_URL),
 )
 PARSER_AGENT = RemoteA2aAgent(
     name="parser_agent",
     description="Extract readable article text from HTML documents.",
-    agent_card=_build_agent_card_url(settings.parser_agent_public_host, settings.parser_agent_public_port),
+    agent_card=PARSER_AGENT_CARD_URL,
+    a2a_client_factory=REMOTE_AGENT_CLIENT_FACTORY,
+    genai_part_converter=create_structured_genai_part_converter(PARSER_AGENT_CARD_URL),
 )
 SENTIMENT_AGENT = RemoteA2aAgent(
     name="sentiment_agent",
     description="Compute sentiment and relevance scores for each article.",
-    agent_card=_build_agent_card_url(settings.sentiment_agent_public_host, settings.sentiment_agent_public_port),
+    agent_card=SENTIMENT_AGENT_CARD_URL,
+    a2a_client_factory=REMOTE_AGENT_CLIENT_FACTORY,
+    genai_part_converter=create_structured_genai_part_converter(SENTIMENT_AGENT_CARD_URL),
 )
 INSIGHT_AGENT = RemoteA2aAgent(
     name="insight_agent",
     description="Generate actionable insights from sentiment analysis results.",
-    agent_card=_build_agent_card_url(settings.insight_agent_public_host, settings.insight_agent_public_port),
+    agent_card=INSIGHT_AGENT_CARD_URL,
+    a2a_client_factory=REMOTE_AGENT_CLIENT_FACTORY,
+    genai_part_converter=create_structured_genai_part_converter(INSIGHT_AGENT_CARD_URL),
 )
 
 CRAWLER_AGENT_TOOL = AgentTool(CRAWLER_AGENT)
@@ -70,19 +130,32 @@ except RuntimeError as exc:
     logger.info("Dedupe tool initialization failed: %s", exc)
     DEDUPE_TOOL = None
 
+try:
+    TRUNCATE_TOOL = create_truncate_tool()
+except RuntimeError as exc:
+    logger.info("Truncate tool initialization failed: %s", exc)
+    TRUNCATE_TOOL = None
+
 TOOLING = [
+    create_pipeline_cache_tool(),
     CRAWLER_AGENT_TOOL,
     PARSER_AGENT_TOOL,
     SENTIMENT_AGENT_TOOL,
     INSIGHT_AGENT_TOOL,
 ]
-if DEDUPE_TOOL is not None:
-    TOOLING.insert(2, DEDUPE_TOOL)
+# 파서와 감정 분석 사이에 로컬 함수 툴(중복 제거 → 본문 축약)을 배치한다.
+TOOLING[3:3] = [tool for tool in (DEDUPE_TOOL, TRUNCATE_TOOL) if tool is not None]
 
 ORCHESTRATOR_AGENT = LlmAgent(
     name="finance_news_orchestrator_agent",
     model=LLM_MODEL,
     instruction=ORCHESTRATOR_PROMPT,
     tools=TOOLING,
+    # 결과 캐시 적중 시 모델 호출 없이 캐시된 인사이트로 응답하고, 새로 생성한 인사이트는 캐시에 저장한다.
+    # 같은 실행 ID로 다시 호출된 단계는 체크포인트로 대신하고, 완료한 단계 출력은 체크포인트로 저장한다.
+    # 단계 출력(기사, 점수, 인사이트)은 기사 저장소에도 누적 기록한다.
+    before_model_callback=answer_from_pipeline_cache,
+    before_tool_callback=restore_stage_checkpoint,
+    after_tool_callback=[save_stage_checkpoint, store_pipeline_result, record_stage_articles],
 )
 logger.info("Orchestration agent initialized.")
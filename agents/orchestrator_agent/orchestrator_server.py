@@ -1,10 +1,21 @@
 import warnings
 
+import httpx
 import uvicorn
 from a2a.types import AgentSkill
 
-from agents.helpers.create_a2a_server import attach_http_health, create_agent_a2a_server
-from agents.orchestrator_agent.orchestrator_agent import ORCHESTRATOR_AGENT
+from agents.helpers.create_a2a_server import SubAgent, attach_http_health, create_agent_a2a_server
+from agents.helpers.deadline import attach_http_deadline
+from agents.helpers.load_balancer import register_sub_agent
+from agents.helpers.metrics import attach_http_metrics
+from agents.helpers.profiler import attach_http_profiling
+from agents.helpers.result_cache import attach_http_result_cache
+from agents.helpers.scheduler import attach_http_admission
+from agents.helpers.structured_data import attach_http_compression
+from agents.helpers.tracing import attach_http_tracing
+from agents.helpers.usage import attach_http_usage
+from agents.orchestrator_agent.articles import attach_http_articles
+from agents.orchestrator_agent.rerun import attach_http_checkpoints
 from common.settings import settings
 
 warnings.filterwarnings("ignore", category=UserWarning)
@@ -12,12 +23,26 @@ warnings.filterwarnings("ignore", category=UserWarning)
 ORCHESTRATOR_AGENT_PUBLIC_HOST = settings.orchestrator_agent_public_host
 ORCHESTRATOR_AGENT_PUBLIC_PORT = settings.orchestrator_agent_public_port
 
-# 서브 에이전트 정보
-SUB_AGENTS = []
+
+def _build_sub_agents(name: str) -> list[SubAgent]:
+    """서브 에이전트 복제본마다 헬스 폴링 대상을 만든다. 복제본이 여러 개면 이름에 순번을 붙인다."""
+    endpoints = [httpx.URL(endpoint) for endpoint in register_sub_agent(name)]
+    if len(endpoints) == 1:
+        return [SubAgent(name, endpoints[0].host, endpoints[0].port or 80)]
+    return [SubAgent(f"{name}-{index}", url.host, url.port or 80) for index, url in enumerate(endpoints, start=1)]
+
+
+# 서브 에이전트 정보 (복제본별)
+SUB_AGENTS = [
+    *_build_sub_agents("crawler"),
+    *_build_sub_agents("parser"),
+    *_build_sub_agents("sentiment"),
+    *_build_sub_agents("insight"),
+]
 
 # 오케스트레이션 에이전트 A2A 서버 생성
 app = create_agent_a2a_server(
-    agent=ORCHESTRATOR_AGENT,
+    agent="agents.orchestrator_agent.orchestrator_agent:ORCHESTRATOR_AGENT",
     name="Orchestrator Agent",
     description="Orchestrate the financial news analysis pipeline",
     version="0.1.0",
@@ -50,6 +75,36 @@ attach_http_health(
     deps_timeout_sec=1.2,
 )
 
+# 실행 단위 LLM 사용량 집계 (X-LLM-Usage 보고, X-Run-Budget 예산 지시 수신)
+attach_http_usage(app, agent_name="Orchestrator Agent")
+
+# 실행 승인 제어 (대기열, 테넌트별 공정 분배, 우선순위 레인). 대기 시간도 요청 데드라인에 포함된다.
+attach_http_admission(app)
+
+# 실행 체크포인트 조회 및 하위 단계 재실행 (/runs/{run_id}/checkpoints, /runs/{run_id}/rerun)
+attach_http_checkpoints(app)
+
+# 기사 저장소 조회 (/articles, /articles/insights)
+attach_http_articles(app)
+
+# 파이프라인 결과 캐시 우회 (Cache-Control: no-cache 요청은 파이프라인을 새로 실행)
+attach_http_result_cache(app)
+
+# 요청 데드라인 (X-Deadline-Ms 헤더 또는 RUN_DEADLINE_SEC, 초과 시 504)
+attach_http_deadline(app)
+
+# HTTP /metrics 처리
+attach_http_metrics(app)
+
+# 요청 단위 프로파일링 (X-Profile-Request 헤더 또는 메타데이터 profile 플래그)
+attach_http_profiling(app)
+
+# 요청 트레이싱 (traceparent 전파)
+attach_http_tracing(app)
+
+# 압축 요청 본문 해제 및 응답 gzip 압축 (구조화 데이터 확장)
+attach_http_compression(app)
+
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=ORCHESTRATOR_AGENT_PUBLIC_PORT)  # nosec
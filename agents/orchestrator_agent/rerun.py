@@ -0,0 +1,175 @@
+"""저장된 단계 체크포인트에서 하위 단계만 다시 실행하는 모듈.
+
+`POST /runs/{run_id}/rerun`은 `from_stage` 직전 단계의 체크포인트를 입력으로 `from_stage`부터 마지막 단계까지를
+오케스트레이터 LLM 없이 순서대로 실행하고, 각 단계 출력을 다시 체크포인트로 저장한다.
+예) 저장된 감정 분석 결과로 관련도 임계값만 바꿔 인사이트를 다시 생성한다.
+ADK/에이전트 모듈은 첫 재실행 요청에서 로드한다.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Literal
+from uuid import uuid4
+
+from a2a.client import A2ACardResolver, A2AClientError, Client
+from a2a.server.apps import A2AFastAPIApplication
+from a2a.types import Message, Role, Task, TaskState, TextPart
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel, Field
+
+from agents.orchestrator_agent.articles import record_stage_output
+from common import fast_json
+from common.checkpoints import CHECKPOINTS, STAGE_PARAMS, STAGES, downstream_stages
+from common.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 재실행은 이전 단계 출력이 필요하므로 crawl부터는 다시 실행할 수 없다.
+RerunStage = Literal["parse", "dedupe", "truncate", "sentiment", "insight"]
+DEFAULT_TEXT_LIMIT = 1000
+
+_CLIENTS: dict[str, Client] = {}
+
+
+class RerunRequest(BaseModel):
+    """하위 단계 재실행 요청."""
+
+    from_stage: RerunStage = Field(description="다시 실행할 첫 단계. 이전 단계의 체크포인트를 입력으로 사용한다.")
+    query: str | None = Field(default=None, description="검색어. 없으면 원래 실행의 파라미터를 사용한다.")
+    text_limit: int | None = Field(default=None, ge=1, description="truncate 단계의 본문 길이 제한.")
+    min_relevance: float | None = Field(
+        default=None, ge=0.0, le=1.0, description="insight 단계에서 사용할 최소 관련도 임계값."
+    )
+
+
+async def rerun_stages(run_id: str, request: RerunRequest) -> dict[str, Any]:
+    """저장된 체크포인트에서 `from_stage`부터 마지막 단계까지 다시 실행한다.
+
+    Args:
+        run_id (str): 원래 실행 ID.
+        request (RerunRequest): 재실행 요청.
+
+    Returns:
+        dict[str, Any]: 실행 ID, 다시 실행한 단계 목록, 마지막 단계 출력.
+
+    Raises:
+        LookupError: 이전 단계의 체크포인트가 없는 경우.
+    """
+    if CHECKPOINTS is None:
+        raise LookupError("Checkpoints are disabled")
+    stages = downstream_stages(request.from_stage)
+    upstream = STAGES[STAGES.index(request.from_stage) - 1]
+    found, value = await CHECKPOINTS.load(run_id, upstream)
+    if not found:
+        raise LookupError(f"No checkpoint for stage {upstream} in run {run_id}")
+    _, params = await CHECKPOINTS.load(run_id, STAGE_PARAMS)
+    params = params or {}
+    query = request.query if request.query is not None else str(params.get("query", ""))
+    text_limit = request.text_limit or int(params.get("text_limit") or DEFAULT_TEXT_LIMIT)
+
+    # 하위 단계는 새 입력으로 다시 만들어지므로 이전 출력을 먼저 지운다.
+    await CHECKPOINTS.delete(run_id, stages)
+    logger.info("Rerunning stages run_id=%s stages=%s", run_id, ",".join(stages))
+    for stage in stages:
+        value = await _run_stage(stage, value, query=query, text_limit=text_limit, request=request)
+        await CHECKPOINTS.save(run_id, stage, value)
+        await record_stage_output(stage, value, query=query, run_id=run_id)
+    return {"run_id": run_id, "stages": list(stages), "result": _as_json(value)}
+
+
+async def _run_stage(stage: str, value: Any, *, query: str, text_limit: int, request: RerunRequest) -> Any:
+    """단계 하나를 실행한다. 로컬 툴은 직접 호출하고, 서브 에이전트는 오케스트레이터와 같은 요청 문장으로 호출한다."""
+    from tools.dedupe_tool import dedupe_documents
+    from tools.truncate_tool import truncate_documents
+
+    documents = _as_json(value)
+    if stage == "dedupe":
+        return dedupe_documents(documents)
+    if stage == "truncate":
+        return truncate_documents(documents, text_limit=text_limit, query=query)
+
+    payload = fast_json.dumps_str(documents)
+    if stage == "parse":
+        return await _call_sub_agent("parser", f"Extract article text from this list: {payload}")
+    if stage == "sentiment":
+        return await _call_sub_agent("sentiment", f"Analyze sentiment and relevance for this list: {payload}")
+    text = f"Generate insights for query={query} from this sentiment analysis: {payload}"
+    if request.min_relevance is not None:
+        text += f" with min_relevance={request.min_relevance}"
+    return await _call_sub_agent("insight", text)
+
+
+def _as_json(value: Any) -> Any:
+    """서브 에이전트의 텍스트 출력이면 JSON으로 파싱한다. 파싱할 수 없으면 그대로 반환한다."""
+    if isinstance(value, dict) and set(value) == {"result"}:
+        value = value["result"]
+    if not isinstance(value, str):
+        return value
+    try:
+        return fast_json.loads(value)
+    except ValueError:
+        return value
+
+
+async def _call_sub_agent(name: str, text: str) -> str:
+    """오케스트레이터의 서브 에이전트 클라이언트(로드 밸런싱, 서킷 브레이커, 구조화 데이터 포함)로 메시지를 보낸다."""
+    from google.genai import types as genai_types
+
+    from agents.helpers.structured_data import create_structured_genai_part_converter
+    from agents.orchestrator_agent import orchestrator_agent
+
+    card_url = getattr(orchestrator_agent, f"{name.upper()}_AGENT_CARD_URL")
+    client = _CLIENTS.get(name)
+    if client is None:
+        resolver = A2ACardResolver(
+            httpx_client=orchestrator_agent.REMOTE_AGENT_HTTP_CLIENT,
+            base_url=card_url.removesuffix(orchestrator_agent.AGENT_CARD_WELL_KNOWN_PATH),
+        )
+        client = _CLIENTS[name] = orchestrator_agent.REMOTE_AGENT_CLIENT_FACTORY.create(
+            await resolver.get_agent_card()
+        )
+
+    part = create_structured_genai_part_converter(card_url)(genai_types.Part(text=text))
+    message = Message(message_id=uuid4().hex, role=Role.user, parts=[part])
+    texts: list[str] = []
+    async for event in client.send_message(message):
+        result = event[0] if isinstance(event, tuple) else event
+        if isinstance(result, Task):
+            if result.status.state == TaskState.failed:
+                raise RuntimeError(f"{name} agent failed task_id={result.id}")
+            texts = _text_parts(result.artifacts or []) or _text_parts(
+                [result.status.message] if result.status.message else []
+            )
+        else:
+            texts = _text_parts([result])
+    return "\n".join(texts)
+
+
+def _text_parts(items: list[Any]) -> list[str]:
+    """parts 속성을 가진 객체들에서 텍스트 파트를 수집한다."""
+    return [part.root.text for item in items for part in item.parts if isinstance(part.root, TextPart)]
+
+
+def attach_http_checkpoints(app: A2AFastAPIApplication) -> None:
+    """실행 체크포인트 조회(`GET /runs/{run_id}/checkpoints`)와 하위 단계 재실행(`POST /runs/{run_id}/rerun`)
+    엔드포인트를 추가한다. `checkpoint_enabled` 설정이 꺼져 있으면 아무것도 추가하지 않는다.
+    """
+    if CHECKPOINTS is None:
+        return
+
+    router = APIRouter()
+
+    @router.get("/runs/{run_id}/checkpoints")
+    async def list_checkpoints(run_id: str) -> dict[str, Any]:
+        return {"run_id": run_id, "checkpoints": await CHECKPOINTS.describe(run_id)}
+
+    @router.post("/runs/{run_id}/rerun")
+    async def rerun(run_id: str, request: RerunRequest) -> dict[str, Any]:
+        try:
+            return await rerun_stages(run_id, request)
+        except LookupError as exc:
+            raise HTTPException(status_code=409, detail=str(exc)) from exc
+        except (A2AClientError, RuntimeError) as exc:
+            raise HTTPException(status_code=502, detail=str(exc)) from exc
+
+    app.include_router(router)
@@ -1,7 +1,22 @@
-"""파서 에이전트 패키지."""
+"""파서 에이전트 패키지.
+
+서버 모듈을 임포트할 때 에이전트 구성(ADK, LiteLLM 임포트 포함)이 함께 로드되지 않도록
+공개 이름은 첫 접근 시점에 가져온다.
+"""
 
 from __future__ import annotations
 
-from .parser_agent import PARSER_AGENT, parse_articles
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .parser_agent import PARSER_AGENT, parse_articles
 
 __all__ = ["PARSER_AGENT", "parse_articles"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        from . import parser_agent
+
+        return getattr(parser_agent, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,21 +7,26 @@ from typing import Any
 import httpx
 import trafilatura
 from google.adk.agents.llm_agent import LlmAgent
-from google.adk.models.lite_llm import LiteLlm
 from google.adk.tools.function_tool import FunctionTool
-from pydantic import ValidationError
+from opentelemetry.trace import Status, StatusCode
 
-from common import NewsDoc
+from common import validate_news_docs
+from common.deadline import cap_timeout, expired
+from common.http_clients import HTTP_CLIENTS
+from common.llm_cache import create_lite_llm
 from common.logger import get_logger
 from common.prompts import PARSER_PROMPT
 from common.settings import settings
-from common.telemetry import instrument_langfuse
+from common.telemetry import get_tracer, instrument_langfuse
 
 logger = get_logger(__name__)
 
 DEFAULT_TIMEOUT = 10.0
 MAX_CONCURRENT_REQUESTS = 5
 
+# 기사 HTML 수집은 공유 커넥션 풀을 재사용한다. 같은 언론사 도메인의 기사끼리 연결이 재사용된다.
+ARTICLE_CLIENT = HTTP_CLIENTS.sync_client("articles", timeout=DEFAULT_TIMEOUT, follow_redirects=True)
+
 instrument_langfuse()
 
 
@@ -40,20 +45,21 @@ def parse_articles(documents: list[dict[str, Any]]) -> list[dict[str, Any]]:
 
     logger.info("Parsing articles count=%s", len(documents))
 
-    parsed_documents: list[dict[str, Any]] = []
-    for doc_dict in documents:
-        try:
-            doc = NewsDoc(**doc_dict)
-        except ValidationError as exc:
-            logger.info("Skip document due to validation error=%s", exc)
-            continue
+    valid_documents, skipped = validate_news_docs(documents)
+    if skipped:
+        logger.info("Skip documents due to validation error count=%s", skipped)
 
-        readable_text = _extract_text_from_url(str(doc.url))
+    parsed_documents: list[dict[str, Any]] = []
+    for index, doc in enumerate(valid_documents):
+        if expired():
+            # 데드라인이 지나면 남은 기사는 건너뛰고 지금까지 추출한 결과를 반환한다.
+            logger.info("Request deadline exceeded; skipped documents count=%s", len(valid_documents) - index)
+            break
+        readable_text = _extract_text_from_url(doc["url"])
         if readable_text:
-            doc.readable_text = readable_text
-            parsed_documents.append(doc.model_dump(mode="json"))
+            parsed_documents.append({**doc, "readable_text": readable_text})
         else:
-            logger.info("Skip document due to no readable text url=%s", doc.url)
+            logger.info("Skip document due to no readable text url=%s", doc["url"])
 
     logger.info("Successfully parsed articles count=%s", len(parsed_documents))
     return parsed_documents
@@ -68,19 +74,23 @@ def _extract_text_from_url(url: str) -> str | None:
     Returns:
         str | None: 추출된 본문 텍스트. 실패 시 None.
     """
-    try:
-        response = httpx.get(url, timeout=DEFAULT_TIMEOUT, follow_redirects=True)
-        response.raise_for_status()
-    except httpx.HTTPError as exc:
-        logger.info("Failed to fetch URL=%s, error=%s", url, exc)
-        return None
+    tracer = get_tracer()
+    with tracer.start_as_current_span("parser.fetch", attributes={"url.full": url}) as span:
+        try:
+            response = ARTICLE_CLIENT.get(url, timeout=cap_timeout(DEFAULT_TIMEOUT))
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            logger.info("Failed to fetch URL=%s, error=%s", url, exc)
+            span.set_status(Status(StatusCode.ERROR, str(exc)))
+            return None
 
     html_content = response.text
     if not html_content:
         logger.info("Empty HTML content for URL=%s", url)
         return None
 
-    extracted_text = trafilatura.extract(html_content, include_comments=False, include_tables=False)
+    with tracer.start_as_current_span("parser.extract", attributes={"parser.html_bytes": len(html_content)}):
+        extracted_text = trafilatura.extract(html_content, include_comments=False, include_tables=False)
     if not extracted_text or len(extracted_text.strip()) < 100:
         logger.info("No meaningful text extracted from URL=%s", url)
         return None
@@ -89,7 +99,7 @@ def _extract_text_from_url(url: str) -> str | None:
 
 
 PARSER_TOOL = FunctionTool(func=parse_articles)
-PARSER_MODEL = LiteLlm(model=settings.openai_model, tool_choice="auto")
+PARSER_MODEL = create_lite_llm(settings.openai_model, tool_choice="auto")
 
 PARSER_AGENT = LlmAgent(
     name="finance_news_parser_agent",
@@ -8,7 +8,12 @@ import uvicorn
 from a2a.types import AgentSkill
 
 from agents.helpers.create_a2a_server import attach_http_health, create_agent_a2a_server
-from agents.parser_agent.parser_agent import PARSER_AGENT
+from agents.helpers.deadline import attach_http_deadline
+from agents.helpers.metrics import attach_http_metrics
+from agents.helpers.profiler import attach_http_profiling
+from agents.helpers.structured_data import attach_http_compression
+from agents.helpers.tracing import attach_http_tracing
+from agents.helpers.usage import attach_http_usage
 from common.settings import settings
 
 warnings.filterwarnings("ignore", category=UserWarning)
@@ -17,7 +22,7 @@ PARSER_AGENT_PUBLIC_HOST = settings.parser_agent_public_host
 PARSER_AGENT_PUBLIC_PORT = settings.parser_agent_public_port
 
 app = create_agent_a2a_server(
-    agent=PARSER_AGENT,
+    agent="agents.parser_agent.parser_agent:PARSER_AGENT",
     name="Parser Agent",
     description="Extract readable text from news article URLs",
     version="0.1.0",
@@ -47,6 +52,24 @@ attach_http_health(
     deps_timeout_sec=1.2,
 )
 
+# 실행 단위 LLM 사용량 집계 (X-LLM-Usage 보고, X-Run-Budget 예산 지시 수신)
+attach_http_usage(app, agent_name="Parser Agent")
+
+# 요청 데드라인 (X-Deadline-Ms 헤더 또는 RUN_DEADLINE_SEC, 초과 시 504)
+attach_http_deadline(app)
+
+# HTTP /metrics 처리
+attach_http_metrics(app)
+
+# 요청 단위 프로파일링 (X-Profile-Request 헤더 또는 메타데이터 profile 플래그)
+attach_http_profiling(app)
+
+# 요청 트레이싱 (traceparent 전파)
+attach_http_tracing(app)
+
+# 압축 요청 본문 해제 및 응답 gzip 압축 (구조화 데이터 확장)
+attach_http_compression(app)
+
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=PARSER_AGENT_PUBLIC_PORT)  # nosec
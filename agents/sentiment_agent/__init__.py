@@ -1,7 +1,22 @@
-"""Sentiment agent package."""
+"""Sentiment agent package.
+
+서버 모듈을 임포트할 때 에이전트 구성(ADK, LiteLLM 임포트 포함)이 함께 로드되지 않도록
+공개 이름은 첫 접근 시점에 가져온다.
+"""
 
 from __future__ import annotations
 
-from .sentiment_agent import SENTIMENT_AGENT
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .sentiment_agent import SENTIMENT_AGENT
 
 __all__ = ["SENTIMENT_AGENT"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        from . import sentiment_agent
+
+        return getattr(sentiment_agent, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 from google.adk.agents.llm_agent import LlmAgent
-from google.adk.models.lite_llm import LiteLlm
 
+from common.llm_cache import create_lite_llm
 from common.logger import get_logger
 from common.prompts import SENTIMENT_PROMPT
 from common.settings import settings
@@ -14,7 +14,7 @@ logger = get_logger(__name__)
 
 instrument_langfuse()
 
-SENTIMENT_MODEL = LiteLlm(model=settings.openai_model)
+SENTIMENT_MODEL = create_lite_llm(settings.openai_model)
 
 SENTIMENT_AGENT = LlmAgent(
     name="finance_news_sentiment_agent",
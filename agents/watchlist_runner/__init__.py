@@ -0,0 +1,4 @@
+"""Watchlist runner package.
+
+설정된 워치리스트 검색어를 하나의 장기 실행 프로세스에서 주기적으로 오케스트레이터에 요청한다.
+"""
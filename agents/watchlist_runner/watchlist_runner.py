@@ -0,0 +1,320 @@
+"""워치리스트 주기 실행 모듈.
+
+워치리스트 정의(`watchlist_path`)의 검색어마다 주기적으로 오케스트레이터 파이프라인을 실행한다.
+
+- 오케스트레이터 HTTP 클라이언트와 A2A 클라이언트(에이전트 카드 포함)는 프로세스 전체에서 재사용한다.
+- 마지막 성공 실행 이후 발행된 기사만 처리하도록 `published_after`를 요청에 포함한다(증분 수집).
+- 실행 시작 사이에 최소 간격(`watchlist_stagger_sec`)과 주기 흔들림을 두어 NewsAPI와 LLM 부하를 분산한다.
+- 실패한 실행은 다음 주기에 같은 실행 ID로 다시 요청하여 완료된 단계의 체크포인트를 재사용한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+import time
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import httpx
+from a2a.client import A2ACardResolver, Client, ClientCallContext, ClientConfig, ClientFactory
+from a2a.types import Message, Role, Task, TaskState, TextPart
+
+from common import fast_json
+from common.deadline import deadline_event_hooks, deadline_scope
+from common.http_clients import HTTP_CLIENTS
+from common.logger import get_logger
+from common.settings import AppSettings, settings
+from common.usage import RUN_ID_HEADER
+
+logger = get_logger(__name__)
+
+ORCHESTRATOR_AGENT_URL = f"http://{settings.orchestrator_agent_public_host}:{settings.orchestrator_agent_public_port}"
+# 데드라인이 지난 뒤 오케스트레이터의 504 응답을 받을 수 있도록 클라이언트 시간 초과에 더하는 여유 시간(초)
+DEADLINE_GRACE_SEC = 5.0
+# NewsAPI 색인 지연으로 늦게 나타나는 기사를 놓치지 않도록 증분 기준 시각을 앞당기는 시간(초)
+INCREMENTAL_OVERLAP_SEC = 300.0
+# 오케스트레이터 스케줄러에서 워치리스트 실행이 공유하는 테넌트
+WATCHLIST_TENANT = "watchlist"
+RESULT_PREVIEW_CHARS = 500
+
+
+@dataclass(frozen=True)
+class Watchlist:
+    """워치리스트 항목."""
+
+    name: str
+    query: str
+    interval_sec: float
+    lookback_hours: int = 24
+    page_size: int = 20
+    text_limit: int = 1000
+
+    def to_request_text(self, published_after: str | None) -> str:
+        """오케스트레이터 요청 문장. 증분 실행이면 `published_after`를 포함한다."""
+        text = (
+            f"Run the news pipeline for query={self.query}, lookback_hours={self.lookback_hours}, "
+            f"page_size={self.page_size}, text_limit={self.text_limit}"
+        )
+        if published_after:
+            text += f", published_after={published_after}"
+        return text + "."
+
+
+@dataclass
+class WatchlistState:
+    """워치리스트별 실행 상태. `watchlist_state_path`에 저장되어 재시작 후에도 유지된다."""
+
+    last_success_started_at: str | None = None
+    last_run_at: str | None = None
+    last_status: str | None = None
+    last_duration_sec: float | None = None
+    last_result_preview: str | None = None
+    pending_run_id: str | None = None
+    runs: int = 0
+    failures: int = 0
+
+
+def load_watchlists(path: str, default_interval_sec: float) -> list[Watchlist]:
+    """워치리스트 정의 JSON 파일을 읽는다.
+
+    파일은 항목 리스트 또는 `{"watchlists": [...]}` 형태이며, 각 항목은 `query`(필수), `name`, `interval_sec`,
+    `lookback_hours`, `page_size`, `text_limit`를 가진다.
+
+    Args:
+        path (str): 워치리스트 정의 파일 경로.
+        default_interval_sec (float): `interval_sec`가 없는 항목의 실행 주기(초).
+
+    Returns:
+        list[Watchlist]: 워치리스트 목록.
+
+    Raises:
+        ValueError: 항목에 `query`가 없거나 이름이 중복된 경우.
+    """
+    payload = fast_json.loads(Path(path).read_bytes())
+    items = payload.get("watchlists", []) if isinstance(payload, dict) else payload
+    watchlists: list[Watchlist] = []
+    for item in items:
+        query = str(item.get("query") or "").strip()
+        if not query:
+            raise ValueError(f"Watchlist entry without query: {item}")
+        watchlists.append(
+            Watchlist(
+                name=str(item.get("name") or query),
+                query=query,
+                interval_sec=float(item.get("interval_sec") or default_interval_sec),
+                lookback_hours=int(item.get("lookback_hours") or 24),
+                page_size=int(item.get("page_size") or 20),
+                text_limit=int(item.get("text_limit") or 1000),
+            )
+        )
+    names = [watchlist.name for watchlist in watchlists]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate watchlist names: {names}")
+    return watchlists
+
+
+class WatchlistRunner:
+    """워치리스트를 주기적으로 실행하는 러너."""
+
+    def __init__(
+        self,
+        watchlists: list[Watchlist],
+        *,
+        state_path: str,
+        stagger_sec: float,
+        jitter_ratio: float,
+        max_concurrent_runs: int,
+        deadline_sec: float,
+    ) -> None:
+        """WatchlistRunner 인스턴스를 초기화한다.
+
+        Args:
+            watchlists (list[Watchlist]): 실행할 워치리스트.
+            state_path (str): 실행 상태 JSON 파일 경로.
+            stagger_sec (float): 실행 시작 사이의 최소 간격(초).
+            jitter_ratio (float): 실행 주기에 더하는 무작위 흔들림 비율. 예) 0.1이면 주기의 ±10%.
+            max_concurrent_runs (int): 동시에 실행할 최대 워치리스트 수.
+            deadline_sec (float): 실행별 데드라인(초). 0이면 제한 없음.
+        """
+        self.watchlists = watchlists
+        self._state_path = Path(state_path)
+        self._stagger_sec = max(0.0, stagger_sec)
+        self._jitter_ratio = min(max(0.0, jitter_ratio), 0.5)
+        self._deadline_sec = deadline_sec
+        self._slots = asyncio.Semaphore(max(1, max_concurrent_runs))
+        self._start_lock = asyncio.Lock()
+        self._last_start = float("-inf")
+        self._states: dict[str, WatchlistState] = self._load_states()
+        self._tasks: list[asyncio.Task[None]] = []
+        self._client: Client | None = None
+
+    async def start(self) -> None:
+        """워치리스트마다 실행 루프를 시작한다. 첫 실행은 정의 순서대로 `stagger_sec`씩 어긋나게 시작한다."""
+        if self._tasks:
+            return
+        logger.info("Starting watchlist runner watchlists=%s", len(self.watchlists))
+        self._tasks = [
+            asyncio.create_task(self._loop(watchlist, index * self._stagger_sec), name=f"watchlist-{watchlist.name}")
+            for index, watchlist in enumerate(self.watchlists)
+        ]
+
+    async def stop(self) -> None:
+        """실행 루프를 중지한다."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def snapshot(self) -> dict[str, Any]:
+        """워치리스트별 설정과 실행 상태를 반환한다."""
+        return {
+            watchlist.name: {"query": watchlist.query, "interval_sec": watchlist.interval_sec}
+            | asdict(self._states.setdefault(watchlist.name, WatchlistState()))
+            for watchlist in self.watchlists
+        }
+
+    async def run_once(self, watchlist: Watchlist) -> None:
+        """워치리스트를 한 번 실행하고 상태를 저장한다. 실패는 상태에 기록하고 예외를 전파하지 않는다."""
+        state = self._states.setdefault(watchlist.name, WatchlistState())
+        started_at = datetime.now(UTC)
+        published_after = None
+        if state.last_success_started_at:
+            cutoff = datetime.fromisoformat(state.last_success_started_at) - timedelta(seconds=INCREMENTAL_OVERLAP_SEC)
+            published_after = cutoff.strftime("%Y-%m-%dT%H:%M:%SZ")
+        run_id = state.pending_run_id or f"watchlist-{uuid4().hex}"
+        state.pending_run_id = run_id
+
+        logger.info("Running watchlist name=%s run_id=%s published_after=%s", watchlist.name, run_id, published_after)
+        t0 = time.perf_counter()
+        try:
+            result = await self._send(
+                watchlist.to_request_text(published_after), run_id, incremental=bool(published_after)
+            )
+        except Exception as exc:
+            # 다음 주기에 같은 실행 ID로 다시 요청하여 완료된 단계를 체크포인트에서 이어서 실행한다.
+            state.last_status = "error"
+            state.failures += 1
+            logger.info("Watchlist run failed name=%s run_id=%s error=%s", watchlist.name, run_id, exc)
+        else:
+            state.last_status = "ok"
+            state.last_success_started_at = started_at.isoformat()
+            state.last_result_preview = result[:RESULT_PREVIEW_CHARS]
+            state.pending_run_id = None
+            logger.info("Watchlist run finished name=%s run_id=%s", watchlist.name, run_id)
+        state.runs += 1
+        state.last_run_at = started_at.isoformat()
+        state.last_duration_sec = round(time.perf_counter() - t0, 3)
+        await asyncio.to_thread(self._save_states)
+
+    async def _loop(self, watchlist: Watchlist, initial_delay_sec: float) -> None:
+        """워치리스트 실행 루프. 실행 시작 시각 기준으로 주기(± 흔들림)마다 실행한다."""
+        await asyncio.sleep(initial_delay_sec)
+        while True:
+            async with self._slots:
+                await self._wait_for_start_slot()
+                started = time.monotonic()
+                await self.run_once(watchlist)
+            jitter = random.uniform(-self._jitter_ratio, self._jitter_ratio)  # nosec B311 - 부하 분산용
+            await asyncio.sleep(max(0.0, started + watchlist.interval_sec * (1 + jitter) - time.monotonic()))
+
+    async def _wait_for_start_slot(self) -> None:
+        """직전 실행 시작 후 `stagger_sec`가 지날 때까지 기다린다."""
+        async with self._start_lock:
+            delay = self._last_start + self._stagger_sec - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._last_start = time.monotonic()
+
+    async def _send(self, text: str, run_id: str, *, incremental: bool) -> str:
+        """공유 A2A 클라이언트로 오케스트레이터에 요청하고 최종 응답 텍스트를 반환한다."""
+        client = await self._get_client()
+        headers = {RUN_ID_HEADER: run_id}
+        if incremental:
+            # 증분 요청은 새 기사만 처리하므로 파이프라인 결과 캐시를 건너뛰고, 결과를 전체 기간 결과 자리에
+            # 저장하지 않는다.
+            headers["Cache-Control"] = "no-store"
+        message = Message(
+            message_id=uuid4().hex,
+            role=Role.user,
+            parts=[TextPart(text=text)],
+            metadata={"priority": "batch", "tenant": WATCHLIST_TENANT},
+        )
+        context = ClientCallContext(state={"http_kwargs": {"headers": headers}})
+        texts: list[str] = []
+        with deadline_scope(self._deadline_sec):
+            try:
+                async for event in client.send_message(message, context=context):
+                    result = event[0] if isinstance(event, tuple) else event
+                    if isinstance(result, Task):
+                        if result.status.state == TaskState.failed:
+                            raise RuntimeError(f"Orchestrator task failed task_id={result.id}")
+                        texts = _text_parts(result.artifacts or [])
+                    else:
+                        texts = _text_parts([result])
+            except httpx.HTTPError:
+                # 연결 오류 뒤에는 에이전트 카드를 다시 조회한다.
+                self._client = None
+                raise
+        return texts[-1] if texts else ""
+
+    async def _get_client(self) -> Client:
+        """에이전트 카드를 한 번 조회하고 A2A 클라이언트를 만들어 재사용한다."""
+        if self._client is None:
+            httpx_client = HTTP_CLIENTS.async_client(
+                "watchlist",
+                timeout=httpx.Timeout(self._deadline_sec + DEADLINE_GRACE_SEC if self._deadline_sec > 0 else None),
+                event_hooks=deadline_event_hooks(),
+            )
+            card = await A2ACardResolver(httpx_client=httpx_client, base_url=ORCHESTRATOR_AGENT_URL).get_agent_card()
+            factory = ClientFactory(config=ClientConfig(httpx_client=httpx_client, streaming=False))
+            self._client = factory.create(card=card)
+        return self._client
+
+    def _load_states(self) -> dict[str, WatchlistState]:
+        """저장된 실행 상태를 읽는다. 파일이 없거나 손상되었으면 빈 상태로 시작한다."""
+        try:
+            payload = fast_json.loads(self._state_path.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            logger.info("Ignoring unreadable watchlist state path=%s", self._state_path)
+            return {}
+        fields = WatchlistState.__dataclass_fields__
+        return {
+            name: WatchlistState(**{key: value for key, value in state.items() if key in fields})
+            for name, state in payload.items()
+        }
+
+    def _save_states(self) -> None:
+        """실행 상태를 임시 파일에 쓴 뒤 교체하여 저장한다."""
+        self._state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._state_path.with_suffix(".tmp")
+        tmp_path.write_bytes(fast_json.dumps({name: asdict(state) for name, state in self._states.items()}))
+        os.replace(tmp_path, self._state_path)
+
+
+def _text_parts(items: list[Any]) -> list[str]:
+    """parts 속성을 가진 객체들에서 텍스트 파트를 수집한다."""
+    return [part.root.text for item in items for part in item.parts if isinstance(part.root, TextPart)]
+
+
+def create_watchlist_runner(app_settings: AppSettings) -> WatchlistRunner:
+    """설정에 따라 워치리스트 러너를 생성한다. 정의 파일이 없으면 빈 러너를 반환한다."""
+    try:
+        watchlists = load_watchlists(app_settings.watchlist_path, app_settings.watchlist_interval_sec)
+    except FileNotFoundError:
+        logger.info("Watchlist file not found path=%s", app_settings.watchlist_path)
+        watchlists = []
+    return WatchlistRunner(
+        watchlists,
+        state_path=app_settings.watchlist_state_path,
+        stagger_sec=app_settings.watchlist_stagger_sec,
+        jitter_ratio=app_settings.watchlist_jitter_ratio,
+        max_concurrent_runs=app_settings.watchlist_max_concurrent_runs,
+        deadline_sec=app_settings.run_deadline_sec,
+    )
@@ -0,0 +1,56 @@
+"""워치리스트 러너 서버 모듈.
+
+워치리스트를 주기적으로 실행하는 장기 실행 프로세스로, 헬스 체크와 실행 상태 조회용 HTTP 엔드포인트를 제공한다.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import uvicorn
+from fastapi import FastAPI
+
+from agents.watchlist_runner.watchlist_runner import create_watchlist_runner
+from common.http_clients import HTTP_CLIENTS
+from common.settings import settings
+from common.telemetry import configure_tracing
+
+WATCHLIST_PUBLIC_PORT = settings.watchlist_public_port
+
+configure_tracing("Watchlist Runner")
+WATCHLIST_RUNNER = create_watchlist_runner(settings)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """서버 시작 시 워치리스트 실행 루프를 시작하고 종료 시 중지한다."""
+    await WATCHLIST_RUNNER.start()
+    try:
+        yield
+    finally:
+        await WATCHLIST_RUNNER.stop()
+        await HTTP_CLIENTS.aclose()
+
+
+app = FastAPI(title="Watchlist Runner", version="0.1.0", lifespan=lifespan)
+
+
+@app.get("/health")
+async def health() -> dict[str, Any]:
+    return {
+        "status": "ok",
+        "service": "Watchlist Runner",
+        "version": "0.1.0",
+        "watchlists": len(WATCHLIST_RUNNER.watchlists),
+    }
+
+
+@app.get("/watchlists")
+async def watchlists() -> dict[str, Any]:
+    return WATCHLIST_RUNNER.snapshot()
+
+
+if __name__ == "__main__":
+    uvicorn.run(app, host="0.0.0.0", port=WATCHLIST_PUBLIC_PORT)  # nosec
@@ -2,6 +2,6 @@
 
 from __future__ import annotations
 
-from .schemas import Insight, NewsDoc, SentimentScore
+from .schemas import Insight, NewsDoc, SentimentScore, validate_news_docs
 
-__all__ = ["Insight", "NewsDoc", "SentimentScore"]
+__all__ = ["Insight", "NewsDoc", "SentimentScore", "validate_news_docs"]
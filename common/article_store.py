@@ -0,0 +1,319 @@
+"""파이프라인 기사 저장소 모듈.
+
+파이프라인이 처리한 기사 메타데이터, 추출 본문, 검색어별 감정/관련도 점수, 실행별 인사이트를 로컬 SQLite 파일에
+누적 저장한다. URL 해시, 발행 시각, 발행 매체, 검색어에 인덱스를 두어 재수집 없이 과거 기사를 조회할 수 있다.
+단계 출력은 한 번의 트랜잭션으로 일괄 기록한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from common import fast_json
+from common.logger import get_logger
+from common.settings import AppSettings, settings
+
+logger = get_logger(__name__)
+
+DEFAULT_SEARCH_LIMIT = 50
+MAX_SEARCH_LIMIT = 500
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS articles ("
+    " url_hash TEXT PRIMARY KEY,"
+    " url TEXT NOT NULL,"
+    " title TEXT,"
+    " publisher TEXT,"
+    " published_at REAL,"
+    " readable_text TEXT,"
+    " first_seen_at REAL NOT NULL,"
+    " updated_at REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS idx_articles_published_at ON articles (published_at)",
+    "CREATE INDEX IF NOT EXISTS idx_articles_publisher ON articles (publisher, published_at)",
+    "CREATE TABLE IF NOT EXISTS article_queries ("
+    " query TEXT NOT NULL,"
+    " url_hash TEXT NOT NULL,"
+    " run_id TEXT,"
+    " sentiment REAL,"
+    " relevance REAL,"
+    " seen_at REAL NOT NULL,"
+    " PRIMARY KEY (query, url_hash))",
+    "CREATE INDEX IF NOT EXISTS idx_article_queries_url_hash ON article_queries (url_hash)",
+    "CREATE TABLE IF NOT EXISTS insights ("
+    " run_id TEXT PRIMARY KEY,"
+    " query TEXT NOT NULL,"
+    " created_at REAL NOT NULL,"
+    " payload TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS idx_insights_query ON insights (query, created_at)",
+)
+
+_UPSERT_ARTICLE = (
+    "INSERT INTO articles (url_hash, url, title, publisher, published_at, readable_text, first_seen_at, updated_at)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+    " ON CONFLICT(url_hash) DO UPDATE SET"
+    " title = COALESCE(excluded.title, articles.title),"
+    " publisher = COALESCE(excluded.publisher, articles.publisher),"
+    " published_at = COALESCE(excluded.published_at, articles.published_at),"
+    " readable_text = COALESCE(excluded.readable_text, articles.readable_text),"
+    " updated_at = excluded.updated_at"
+)
+_UPSERT_ARTICLE_QUERY = (
+    "INSERT INTO article_queries (query, url_hash, run_id, sentiment, relevance, seen_at) VALUES (?, ?, ?, ?, ?, ?)"
+    " ON CONFLICT(query, url_hash) DO UPDATE SET"
+    " run_id = excluded.run_id,"
+    " sentiment = COALESCE(excluded.sentiment, article_queries.sentiment),"
+    " relevance = COALESCE(excluded.relevance, article_queries.relevance),"
+    " seen_at = excluded.seen_at"
+)
+
+
+def url_hash(url: str) -> str:
+    """기사 URL의 SHA-256 해시."""
+    return hashlib.sha256(url.strip().encode("utf-8")).hexdigest()
+
+
+def normalize_query(query: str) -> str:
+    """대소문자와 공백 차이를 무시한 검색어. (파이프라인 결과 캐시 키와 같은 규칙)"""
+    return " ".join(query.lower().split())
+
+
+def _timestamp(value: Any) -> float | None:
+    """ISO8601 문자열 또는 datetime 발행 시각을 Unix 시각으로 변환한다. 파싱할 수 없으면 None."""
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def _article_row(document: dict[str, Any], now: float) -> tuple[Any, ...] | None:
+    """`NewsDoc` 호환 문서를 articles 행으로 변환한다. URL이 없으면 None."""
+    url = document.get("url")
+    if not url:
+        return None
+    return (
+        url_hash(str(url)),
+        str(url),
+        document.get("title"),
+        document.get("publisher"),
+        _timestamp(document.get("published_at")),
+        document.get("readable_text") or None,
+        now,
+        now,
+    )
+
+
+def _score(value: Any) -> float | None:
+    """숫자 점수면 float으로, 아니면 None."""
+    return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+
+class ArticleStore:
+    """파이프라인 기사/점수/인사이트를 누적 저장하는 SQLite 저장소.
+
+    비동기 메서드는 SQLite 호출을 워커 스레드에서 실행해 이벤트 루프를 막지 않는다.
+    """
+
+    def __init__(self, path: str) -> None:
+        """ArticleStore 인스턴스를 초기화한다.
+
+        Args:
+            path (str): SQLite 데이터베이스 파일 경로.
+        """
+        self._lock = threading.Lock()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._transaction():
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+
+    async def record_documents(self, documents: list[dict[str, Any]], *, query: str, run_id: str | None) -> int:
+        """크롤링/본문 추출 단계의 문서를 저장한다. 본문이 없는 문서는 기존 본문을 유지한다.
+
+        Args:
+            documents (list[dict[str, Any]]): `NewsDoc` 호환 문서 리스트.
+            query (str): 파이프라인 검색어.
+            run_id (str | None): 실행 ID.
+
+        Returns:
+            int: 저장한 문서 수.
+        """
+        return await asyncio.to_thread(self._record_sync, documents, [], query, run_id)
+
+    async def record_sentiments(self, results: list[dict[str, Any]], *, query: str, run_id: str | None) -> int:
+        """감정 분석 결과(`{"document": NewsDoc, "sentiment", "relevance"}`)를 검색어별 점수와 함께 저장한다.
+
+        Returns:
+            int: 저장한 결과 수.
+        """
+        documents = [item.get("document") or {} for item in results if isinstance(item, dict)]
+        scores = [
+            (_score(item.get("sentiment")), _score(item.get("relevance")))
+            for item in results
+            if isinstance(item, dict)
+        ]
+        return await asyncio.to_thread(self._record_sync, documents, scores, query, run_id)
+
+    async def record_insights(self, insights: Any, *, query: str, run_id: str) -> None:
+        """실행의 최종 인사이트를 저장한다. 같은 실행 ID로 다시 저장하면 덮어쓴다."""
+        payload = insights if isinstance(insights, str) else fast_json.dumps_str(insights, default=str)
+        await asyncio.to_thread(self._record_insights_sync, payload, normalize_query(query), run_id)
+
+    async def search(
+        self,
+        *,
+        query: str | None = None,
+        publisher: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+    ) -> list[dict[str, Any]]:
+        """저장된 기사를 최근 발행 순으로 조회한다.
+
+        Args:
+            query (str | None): 파이프라인 검색어. 지정하면 해당 검색어로 처리된 기사와 점수만 반환한다.
+            publisher (str | None): 발행 매체 이름.
+            since (float | None): 이 Unix 시각 이후 발행된 기사만 반환한다.
+            until (float | None): 이 Unix 시각 이전 발행된 기사만 반환한다.
+            limit (int): 최대 반환 수.
+
+        Returns:
+            list[dict[str, Any]]: 기사 리스트. 검색어를 지정하면 sentiment, relevance를 포함한다.
+        """
+        limit = max(1, min(limit, MAX_SEARCH_LIMIT))
+        return await asyncio.to_thread(self._search_sync, query, publisher, since, until, limit)
+
+    async def recent_insights(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
+        """검색어의 최근 실행 인사이트를 최신순으로 반환한다."""
+        return await asyncio.to_thread(self._recent_insights_sync, normalize_query(query), max(1, limit))
+
+    def snapshot(self) -> dict[str, int]:
+        """저장된 기사, 검색어-기사 쌍, 인사이트 수를 반환한다."""
+        with self._lock:
+            return {
+                table: self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]  # nosec B608 - 고정 테이블명
+                for table in ("articles", "article_queries", "insights")
+            }
+
+    def close(self) -> None:
+        """데이터베이스 연결을 닫는다."""
+        with self._lock:
+            self._conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """쓰기 트랜잭션. 실패하면 롤백한다."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _record_sync(
+        self,
+        documents: list[dict[str, Any]],
+        scores: list[tuple[float | None, float | None]],
+        query: str,
+        run_id: str | None,
+    ) -> int:
+        """문서와 검색어별 점수를 한 트랜잭션으로 저장한다. `scores`가 비어 있으면 점수 없이 저장한다."""
+        now = time.time()
+        normalized_query = normalize_query(query)
+        article_rows: list[tuple[Any, ...]] = []
+        query_rows: list[tuple[Any, ...]] = []
+        for index, document in enumerate(documents):
+            if not isinstance(document, dict) or (row := _article_row(document, now)) is None:
+                continue
+            article_rows.append(row)
+            sentiment, relevance = scores[index] if scores else (None, None)
+            if normalized_query:
+                query_rows.append((normalized_query, row[0], run_id, sentiment, relevance, now))
+        if not article_rows:
+            return 0
+        with self._transaction():
+            self._conn.executemany(_UPSERT_ARTICLE, article_rows)
+            self._conn.executemany(_UPSERT_ARTICLE_QUERY, query_rows)
+        return len(article_rows)
+
+    def _record_insights_sync(self, payload: str, query: str, run_id: str) -> None:
+        """인사이트를 저장한다."""
+        with self._transaction():
+            self._conn.execute(
+                "INSERT INTO insights (run_id, query, created_at, payload) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT(run_id) DO UPDATE SET"
+                " query = excluded.query, created_at = excluded.created_at, payload = excluded.payload",
+                (run_id, query, time.time(), payload),
+            )
+
+    def _search_sync(
+        self, query: str | None, publisher: str | None, since: float | None, until: float | None, limit: int
+    ) -> list[dict[str, Any]]:
+        """조건에 맞는 기사를 조회한다."""
+        columns = "a.url, a.title, a.publisher, a.published_at, a.readable_text"
+        clauses: list[str] = []
+        params: list[Any] = []
+        if query:
+            sql = f"SELECT {columns}, q.sentiment, q.relevance FROM article_queries q JOIN articles a USING (url_hash)"
+            clauses.append("q.query = ?")
+            params.append(normalize_query(query))
+        else:
+            sql = f"SELECT {columns} FROM articles a"
+        if publisher:
+            clauses.append("a.publisher = ?")
+            params.append(publisher)
+        if since is not None:
+            clauses.append("a.published_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("a.published_at < ?")
+            params.append(until)
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY a.published_at DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()  # nosec B608 - 조건은 파라미터로 바인딩한다.
+        articles = [dict(row) for row in rows]
+        for article in articles:
+            if article["published_at"] is not None:
+                article["published_at"] = datetime.fromtimestamp(article["published_at"], UTC).isoformat()
+        return articles
+
+    def _recent_insights_sync(self, query: str, limit: int) -> list[dict[str, Any]]:
+        """검색어의 최근 인사이트를 조회한다."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT run_id, created_at, payload FROM insights WHERE query = ? ORDER BY created_at DESC LIMIT ?",
+                (query, limit),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+
+def create_article_store(app_settings: AppSettings) -> ArticleStore | None:
+    """설정에 따라 기사 저장소를 생성한다. `article_store_enabled`가 꺼져 있으면 None."""
+    if not app_settings.article_store_enabled:
+        return None
+    path = str(Path(app_settings.article_store_dir) / "articles.sqlite3")
+    logger.info("Using article store path=%s", path)
+    return ArticleStore(path)
+
+
+ARTICLES = create_article_store(settings)
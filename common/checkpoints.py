@@ -0,0 +1,220 @@
+"""파이프라인 단계 체크포인트 저장소 모듈.
+
+오케스트레이터 실행 ID(`X-Run-Id`)별로 각 단계(crawl, parse, dedupe, truncate, sentiment, insight)의 출력을
+로컬 SQLite 파일에 저장한다. 같은 실행 ID로 다시 실행하면 같은 입력(툴 인자)으로 완료된 단계는 저장된 출력으로
+대신하고, 저장된 중간 결과에서 하위 단계만 다시 실행할 수 있다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any
+
+from common import fast_json
+from common.logger import get_logger
+from common.settings import AppSettings, settings
+
+logger = get_logger(__name__)
+
+# 파이프라인 단계 순서. "params"는 실행 파라미터(query, lookback_hours, page_size, text_limit)를 보관한다.
+STAGE_PARAMS = "params"
+STAGES = ("crawl", "parse", "dedupe", "truncate", "sentiment", "insight")
+
+# 이 크기(바이트) 이상인 출력만 압축한다.
+COMPRESSION_THRESHOLD_BYTES = 1024
+COMPRESSION_LEVEL = 6
+
+_FLAG_RAW = b"\x00"
+_FLAG_ZLIB = b"\x01"
+
+
+def _encode(value: Any) -> bytes:
+    """단계 출력을 1바이트 압축 플래그가 붙은 JSON 바이트로 직렬화한다."""
+    payload = fast_json.dumps(value)
+    if len(payload) < COMPRESSION_THRESHOLD_BYTES:
+        return _FLAG_RAW + payload
+    return _FLAG_ZLIB + zlib.compress(payload, COMPRESSION_LEVEL)
+
+
+def _decode(data: bytes) -> Any:
+    """`_encode`로 직렬화된 바이트를 복원한다."""
+    flag, payload = data[:1], data[1:]
+    if flag == _FLAG_ZLIB:
+        payload = zlib.decompress(payload)
+    return fast_json.loads(payload)
+
+
+def args_digest(args: dict[str, Any]) -> str:
+    """툴 인자의 SHA-256 해시. 체크포인트가 같은 입력으로 만들어졌는지 확인하는 데 사용한다."""
+    return hashlib.sha256(fast_json.dumps(args, sort_keys=True, default=str)).hexdigest()
+
+
+def downstream_stages(from_stage: str) -> tuple[str, ...]:
+    """지정한 단계와 그 하위 단계를 순서대로 반환한다.
+
+    Args:
+        from_stage (str): 시작 단계.
+
+    Returns:
+        tuple[str, ...]: `from_stage`부터 마지막 단계까지.
+
+    Raises:
+        ValueError: 알 수 없는 단계인 경우.
+    """
+    return STAGES[STAGES.index(from_stage) :]
+
+
+class CheckpointStore:
+    """실행 ID/단계별 출력을 보관하는 SQLite 체크포인트 저장소.
+
+    실행 수와 수명 한도를 넘는 오래된 실행의 체크포인트를 제거한다. 비동기 메서드는 SQLite 호출을
+    워커 스레드에서 실행해 이벤트 루프를 막지 않는다.
+    """
+
+    def __init__(self, path: str, *, max_runs: int, max_age_sec: float) -> None:
+        """CheckpointStore 인스턴스를 초기화한다.
+
+        Args:
+            path (str): SQLite 데이터베이스 파일 경로.
+            max_runs (int): 보관할 최대 실행 수.
+            max_age_sec (float): 마지막 저장 이후 실행의 체크포인트를 유지할 최대 시간(초).
+        """
+        self._max_runs = max(1, max_runs)
+        self._max_age_sec = max_age_sec
+        self._lock = threading.Lock()
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoints ("
+            " run_id TEXT NOT NULL,"
+            " stage TEXT NOT NULL,"
+            " updated_at REAL NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " payload BLOB NOT NULL,"
+            " args_hash TEXT,"
+            " PRIMARY KEY (run_id, stage))"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(checkpoints)")}
+        if "args_hash" not in columns:
+            self._conn.execute("ALTER TABLE checkpoints ADD COLUMN args_hash TEXT")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_checkpoints_updated_at ON checkpoints (updated_at)")
+        with self._lock:
+            self._evict_locked()
+
+    async def save(self, run_id: str, stage: str, value: Any, *, args_hash: str | None = None) -> None:
+        """단계 출력을 저장하거나 갱신한다.
+
+        Args:
+            run_id (str): 실행 ID.
+            stage (str): 단계 이름.
+            value (Any): 단계 출력.
+            args_hash (str | None): 출력을 만든 툴 인자의 해시(`args_digest`). 없으면 None.
+        """
+        data = _encode(value)
+        await asyncio.to_thread(self._save_sync, run_id, stage, data, args_hash)
+
+    async def load(self, run_id: str, stage: str, *, args_hash: str | None = None) -> tuple[bool, Any]:
+        """단계 출력을 조회한다.
+
+        Args:
+            run_id (str): 실행 ID.
+            stage (str): 단계 이름.
+            args_hash (str | None): 지정하면 같은 툴 인자로 저장된 체크포인트만 반환한다.
+
+        Returns:
+            tuple[bool, Any]: (체크포인트 존재 여부, 저장된 출력).
+        """
+        data = await asyncio.to_thread(self._load_sync, run_id, stage, args_hash)
+        if data is None:
+            return False, None
+        return True, _decode(data)
+
+    async def delete(self, run_id: str, stages: tuple[str, ...]) -> None:
+        """지정한 단계들의 체크포인트를 삭제한다."""
+        await asyncio.to_thread(self._delete_sync, run_id, stages)
+
+    async def describe(self, run_id: str) -> list[dict[str, Any]]:
+        """실행의 체크포인트 목록(단계, 저장 시각, 크기)을 단계 순서대로 반환한다."""
+        rows = await asyncio.to_thread(self._describe_sync, run_id)
+        order = {stage: index for index, stage in enumerate((STAGE_PARAMS, *STAGES))}
+        return sorted(
+            ({"stage": stage, "updated_at": updated_at, "bytes": size} for stage, updated_at, size in rows),
+            key=lambda row: order.get(row["stage"], len(order)),
+        )
+
+    def close(self) -> None:
+        """데이터베이스 연결을 닫는다."""
+        with self._lock:
+            self._conn.close()
+
+    def _save_sync(self, run_id: str, stage: str, data: bytes, args_hash: str | None) -> None:
+        """체크포인트를 저장하고 한도를 넘는 실행을 제거한다."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO checkpoints (run_id, stage, updated_at, size, payload, args_hash)"
+                " VALUES (?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(run_id, stage) DO UPDATE SET"
+                " updated_at = excluded.updated_at, size = excluded.size, payload = excluded.payload,"
+                " args_hash = excluded.args_hash",
+                (run_id, stage, time.time(), len(data), data, args_hash),
+            )
+            self._evict_locked()
+
+    def _load_sync(self, run_id: str, stage: str, args_hash: str | None) -> bytes | None:
+        """만료되지 않은(인자 해시를 지정하면 해시도 같은) 체크포인트의 직렬화 바이트를 조회한다."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, args_hash FROM checkpoints WHERE run_id = ? AND stage = ? AND updated_at >= ?",
+                (run_id, stage, time.time() - self._max_age_sec),
+            ).fetchone()
+        if row is None or (args_hash is not None and row[1] != args_hash):
+            return None
+        return row[0]
+
+    def _delete_sync(self, run_id: str, stages: tuple[str, ...]) -> None:
+        """체크포인트를 삭제한다."""
+        with self._lock:
+            self._conn.executemany(
+                "DELETE FROM checkpoints WHERE run_id = ? AND stage = ?", [(run_id, stage) for stage in stages]
+            )
+
+    def _describe_sync(self, run_id: str) -> list[tuple[str, float, int]]:
+        """실행의 체크포인트 메타데이터를 조회한다."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT stage, updated_at, size FROM checkpoints WHERE run_id = ? AND updated_at >= ?",
+                (run_id, time.time() - self._max_age_sec),
+            ).fetchall()
+
+    def _evict_locked(self) -> None:
+        """수명, 실행 수 한도 순으로 오래된 실행의 체크포인트를 제거한다. 호출 측에서 잠금을 보유해야 한다."""
+        self._conn.execute("DELETE FROM checkpoints WHERE updated_at < ?", (time.time() - self._max_age_sec,))
+        self._conn.execute(
+            "DELETE FROM checkpoints WHERE run_id IN ("
+            " SELECT run_id FROM checkpoints GROUP BY run_id"
+            " ORDER BY MAX(updated_at) DESC LIMIT -1 OFFSET ?)",
+            (self._max_runs,),
+        )
+
+
+def create_checkpoint_store(app_settings: AppSettings) -> CheckpointStore | None:
+    """설정에 따라 체크포인트 저장소를 생성한다. `checkpoint_enabled`가 꺼져 있으면 None."""
+    if not app_settings.checkpoint_enabled:
+        return None
+    path = str(Path(app_settings.checkpoint_dir) / "checkpoints.sqlite3")
+    logger.info("Using checkpoint store path=%s", path)
+    return CheckpointStore(
+        path, max_runs=app_settings.checkpoint_max_runs, max_age_sec=app_settings.checkpoint_max_age_sec
+    )
+
+
+CHECKPOINTS = create_checkpoint_store(settings)
@@ -0,0 +1,114 @@
+"""요청 데드라인 전파 모듈.
+
+클라이언트 요청의 남은 시간을 `X-Deadline-Ms` 헤더로 오케스트레이터와 서브 에이전트에 전달하고,
+각 프로세스에서는 컨텍스트 변수로 보관하여 HTTP 호출, LLM 호출, 툴의 외부 요청 시간 초과를 남은 시간 이하로 줄인다.
+헤더에는 절대 시각 대신 남은 밀리초를 담아 호스트 간 시계 차이의 영향을 받지 않는다.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+import httpx
+
+DEADLINE_HEADER = "x-deadline-ms"
+# 남은 시간이 이보다 적으면 새 요청을 시작하지 않는다.
+MIN_REMAINING_SEC = 0.05
+
+_DEADLINE: ContextVar[float | None] = ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """요청 데드라인이 지나 작업을 시작할 수 없을 때 발생하는 예외."""
+
+
+@contextmanager
+def deadline_scope(timeout_sec: float | None) -> Iterator[None]:
+    """이 컨텍스트 안의 작업에 데드라인을 설정한다. 이미 더 이른 데드라인이 있으면 그대로 유지한다.
+
+    Args:
+        timeout_sec (float | None): 지금부터의 허용 시간(초). None 또는 0 이하이면 데드라인을 추가하지 않는다.
+    """
+    current = _DEADLINE.get()
+    deadline = current
+    if timeout_sec is not None and timeout_sec > 0:
+        candidate = time.monotonic() + timeout_sec
+        deadline = candidate if current is None else min(current, candidate)
+    token = _DEADLINE.set(deadline)
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+@contextmanager
+def no_deadline() -> Iterator[None]:
+    """이 컨텍스트 안의 작업에서 데드라인을 해제한다. 여러 요청이 함께 기다리는 공유 작업에 사용한다."""
+    token = _DEADLINE.set(None)
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+def remaining() -> float | None:
+    """현재 데드라인까지 남은 시간(초). 데드라인이 없으면 None."""
+    deadline = _DEADLINE.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def expired() -> bool:
+    """현재 데드라인이 지났는지(또는 새 작업을 시작하기에 부족한지) 여부."""
+    left = remaining()
+    return left is not None and left < MIN_REMAINING_SEC
+
+
+def cap_timeout(timeout_sec: float) -> float:
+    """시간 초과 값을 남은 데드라인 이하로 줄인다.
+
+    Args:
+        timeout_sec (float): 기본 시간 초과(초).
+
+    Returns:
+        float: 기본값과 남은 시간 중 작은 값. 데드라인이 지났으면 `MIN_REMAINING_SEC`.
+    """
+    left = remaining()
+    if left is None:
+        return timeout_sec
+    return max(MIN_REMAINING_SEC, min(timeout_sec, left))
+
+
+def parse_deadline_header(value: str | None) -> float | None:
+    """`X-Deadline-Ms` 헤더 값을 남은 시간(초)으로 변환한다. 형식이 잘못되면 None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value) / 1000)
+    except ValueError:
+        return None
+
+
+def deadline_event_hooks() -> dict[str, list[Any]]:
+    """나가는 요청에 남은 데드라인을 전파하고 요청 시간 초과를 줄이는 httpx 이벤트 훅을 반환한다."""
+    return {"request": [_inject_deadline]}
+
+
+async def _inject_deadline(request: httpx.Request) -> None:
+    """데드라인 헤더를 추가하고 요청의 연결/읽기/쓰기/풀 시간 초과를 남은 시간 이하로 줄인다."""
+    left = remaining()
+    if left is None:
+        return
+    if left < MIN_REMAINING_SEC:
+        raise DeadlineExceeded(f"Request deadline exceeded before calling {request.url}")
+    request.headers[DEADLINE_HEADER] = str(int(left * 1000))
+    timeouts = request.extensions.get("timeout") or {}
+    request.extensions["timeout"] = {
+        key: left if timeouts.get(key) is None else min(timeouts[key], left)
+        for key in ("connect", "read", "write", "pool")
+    }
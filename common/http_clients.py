@@ -0,0 +1,134 @@
+"""프로세스 공용 HTTP 클라이언트 레지스트리 모듈.
+
+요청마다 `httpx.get`이나 새 클라이언트로 TCP/TLS 연결을 맺는 대신, 용도별로 이름 붙인 장수명 클라이언트를
+프로세스에서 공유하여 커넥션 풀(가능하면 HTTP/2)을 재사용한다. 서버 시작 시 등록된 주소로 미리 연결해 두고
+종료 시 모든 클라이언트를 닫는다. 비동기 클라이언트는 프로세스의 단일 이벤트 루프에서 사용하는 것을 전제로 한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import threading
+from typing import Any
+
+import httpx
+
+from common.logger import get_logger
+from common.telemetry import create_traced_async_client
+
+logger = get_logger(__name__)
+
+# h2 패키지가 있으면 HTTPS 연결에 HTTP/2를 사용한다. (평문 HTTP는 HTTP/1.1로 동작)
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+DEFAULT_TIMEOUT_SEC = 30.0
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0)
+WARMUP_TIMEOUT_SEC = 5.0
+
+
+class HttpClientRegistry:
+    """이름별 공유 `httpx.Client`/`httpx.AsyncClient`와 시작 시 미리 연결할 주소를 관리하는 레지스트리."""
+
+    def __init__(self) -> None:
+        """HttpClientRegistry 인스턴스를 초기화한다."""
+        self._sync_clients: dict[str, httpx.Client] = {}
+        self._async_clients: dict[str, httpx.AsyncClient] = {}
+        self._warmup_urls: dict[str, set[str]] = {}
+        self._warmed: set[tuple[str, str]] = set()
+        self._lock = threading.Lock()
+
+    def sync_client(self, name: str, **options: Any) -> httpx.Client:
+        """이름에 해당하는 공유 동기 클라이언트를 반환한다. 처음 호출할 때 생성한다.
+
+        Args:
+            name (str): 클라이언트 이름. 예) "newsapi".
+            **options (Any): 최초 생성 시 `httpx.Client`에 전달할 인자. 이후 호출에서는 무시된다.
+
+        Returns:
+            httpx.Client: 공유 클라이언트.
+        """
+        with self._lock:
+            client = self._sync_clients.get(name)
+            if client is None or client.is_closed:
+                client = httpx.Client(**_with_defaults(options))
+                self._sync_clients[name] = client
+            return client
+
+    def async_client(self, name: str, *, propagate_trace: bool = True, **options: Any) -> httpx.AsyncClient:
+        """이름에 해당하는 공유 비동기 클라이언트를 반환한다. 처음 호출할 때 생성한다.
+
+        Args:
+            name (str): 클라이언트 이름. 예) "agents".
+            propagate_trace (bool): 트레이스 컨텍스트(traceparent) 전파 훅 등록 여부. 외부 API용 클라이언트는 끈다.
+            **options (Any): 최초 생성 시 `httpx.AsyncClient`에 전달할 인자. 이후 호출에서는 무시된다.
+
+        Returns:
+            httpx.AsyncClient: 공유 클라이언트.
+        """
+        with self._lock:
+            client = self._async_clients.get(name)
+            if client is None or client.is_closed:
+                client_options = _with_defaults(options)
+                if propagate_trace:
+                    client = create_traced_async_client(**client_options)
+                else:
+                    client = httpx.AsyncClient(**client_options)
+                self._async_clients[name] = client
+            return client
+
+    def register_warmup(self, name: str, url: str) -> None:
+        """서버 시작 시 `name` 클라이언트로 미리 연결해 둘 주소를 등록한다.
+
+        Args:
+            name (str): 클라이언트 이름.
+            url (str): 연결할 주소. 응답 상태와 관계없이 연결 수립만을 목적으로 HEAD 요청을 보낸다.
+        """
+        with self._lock:
+            self._warmup_urls.setdefault(name, set()).add(url)
+
+    async def warm_up(self) -> None:
+        """등록된 주소로 HEAD 요청을 보내 커넥션 풀을 미리 채운다. 이미 연결한 주소와 실패는 건너뛴다."""
+        with self._lock:
+            targets = [
+                (name, url)
+                for name, urls in self._warmup_urls.items()
+                for url in urls
+                if (name, url) not in self._warmed
+            ]
+            self._warmed.update(targets)
+        if targets:
+            await asyncio.gather(*(self._warm_one(name, url) for name, url in targets))
+
+    async def _warm_one(self, name: str, url: str) -> None:
+        """클라이언트 하나로 주소 하나에 미리 연결한다."""
+        try:
+            if name in self._async_clients:
+                await self._async_clients[name].head(url, timeout=WARMUP_TIMEOUT_SEC)
+            elif name in self._sync_clients:
+                await asyncio.to_thread(self._sync_clients[name].head, url, timeout=WARMUP_TIMEOUT_SEC)
+            else:
+                return
+            logger.info("HTTP client warmed name=%s url=%s", name, url)
+        except httpx.HTTPError as exc:
+            logger.info("HTTP client warm-up failed name=%s url=%s error=%s", name, url, exc)
+
+    async def aclose(self) -> None:
+        """모든 공유 클라이언트를 닫는다."""
+        with self._lock:
+            sync_clients = list(self._sync_clients.values())
+            async_clients = list(self._async_clients.values())
+            self._sync_clients.clear()
+            self._async_clients.clear()
+            self._warmed.clear()
+        for client in sync_clients:
+            client.close()
+        for async_client in async_clients:
+            await async_client.aclose()
+
+
+def _with_defaults(options: dict[str, Any]) -> dict[str, Any]:
+    """클라이언트 생성 인자에 공통 기본값(시간 초과, 풀 한도, HTTP/2)을 채운다."""
+    return {"timeout": DEFAULT_TIMEOUT_SEC, "limits": DEFAULT_LIMITS, "http2": HTTP2_AVAILABLE, **options}
+
+
+HTTP_CLIENTS = HttpClientRegistry()
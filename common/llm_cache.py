@@ -0,0 +1,385 @@
+"""LiteLLM 응답 캐시 모듈.
+
+모델, 메시지, 샘플링 파라미터를 키로 LLM 응답을 캐시한다. 메모리 계층은 LRU+TTL로 관리하고,
+설정 시 디스크 계층을 함께 사용한다. 동일한 요청이 동시에 들어오면 하나의 호출로 합친다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+import litellm
+from google.adk.models.lite_llm import LiteLlm, LiteLLMClient
+from litellm import ModelResponse, acompletion
+
+from common import fast_json
+from common.deadline import MIN_REMAINING_SEC, DeadlineExceeded, cap_timeout, expired, no_deadline, remaining
+from common.http_clients import HTTP_CLIENTS
+from common.logger import get_logger
+from common.metrics import LLM_REQUEST_DURATION_SECONDS, LLM_TOKENS_TOTAL, REGISTRY, CollectedFamily
+from common.settings import settings
+from common.telemetry import get_tracer
+from common.usage import record_llm_usage
+
+logger = get_logger(__name__)
+
+LLM_HTTP_TIMEOUT_SEC = 600.0
+OPENAI_DEFAULT_API_BASE = "https://api.openai.com/v1"
+
+# 캐시 키에서 제외할 호출 옵션 (응답 내용에 영향을 주지 않는 값)
+_NON_KEY_PARAMS = frozenset({"api_key", "api_base", "timeout", "metadata", "stream_options"})
+
+
+def make_cache_key(model: str, messages: list[Any], **params: Any) -> str:
+    """모델, 메시지, 샘플링 파라미터로 캐시 키를 생성한다.
+
+    Args:
+        model (str): 모델 이름.
+        messages (list[Any]): 대화 메시지 리스트.
+        **params (Any): temperature, max_tokens, tools 등 호출 파라미터.
+
+    Returns:
+        str: SHA-256 기반 캐시 키.
+    """
+    key_params = {
+        name: params[name] for name in sorted(params) if name not in _NON_KEY_PARAMS and params[name] is not None
+    }
+    payload = fast_json.dumps(
+        {"model": model, "messages": messages, "params": key_params},
+        sort_keys=True,
+        default=_json_default,
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _json_default(value: Any) -> Any:
+    """JSON 직렬화가 불가능한 값을 변환한다.
+
+    Args:
+        value (Any): 변환 대상 값.
+
+    Returns:
+        Any: 직렬화 가능한 값.
+    """
+    model_dump = getattr(value, "model_dump", None)
+    if callable(model_dump):
+        return model_dump()
+    return str(value)
+
+
+class LlmResponseCache:
+    """LRU+TTL 메모리 계층과 선택적 디스크 계층을 갖는 LLM 응답 캐시.
+
+    동일 키의 요청이 진행 중이면 새로 호출하지 않고 진행 중인 결과를 함께 기다린다(single-flight).
+    """
+
+    def __init__(self, *, max_entries: int, ttl_sec: float, disk_dir: str | None = None) -> None:
+        """LlmResponseCache 인스턴스를 초기화한다.
+
+        Args:
+            max_entries (int): 메모리 계층 최대 항목 수.
+            ttl_sec (float): 항목 유효 시간(초).
+            disk_dir (str | None): 디스크 계층 디렉터리. None이면 메모리만 사용한다.
+        """
+        self._max_entries = max(1, max_entries)
+        self._ttl_sec = ttl_sec
+        self._disk_dir = Path(disk_dir) if disk_dir else None
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Task[ModelResponse]] = {}
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def stats(self) -> dict[str, int]:
+        """캐시 통계를 반환한다.
+
+        Returns:
+            dict[str, int]: 적중, 미스, 병합 횟수와 현재 항목 수.
+        """
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "entries": len(self._entries),
+            "in_flight": len(self._in_flight),
+        }
+
+    async def get_or_call(self, key: str, call: Callable[[], Awaitable[ModelResponse]]) -> ModelResponse:
+        """캐시된 응답을 반환하거나, 없으면 `call`을 한 번만 실행해 결과를 저장한다.
+
+        Args:
+            key (str): 캐시 키.
+            call (Callable[[], Awaitable[ModelResponse]]): 캐시 미스 시 실행할 코루틴 함수.
+
+        Returns:
+            ModelResponse: 호출자별로 복사된 LLM 응답.
+        """
+        cached = self._get_memory(key)
+        if cached is not None:
+            self.hits += 1
+            return ModelResponse(**cached)
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self.coalesced += 1
+        else:
+            # 제공자 호출은 캐시가 소유한 태스크에서 실행하고 모든 호출자(첫 호출자 포함)는 shield로 기다린다.
+            # 한 호출자가 시간 초과 등으로 취소되어도 같은 키를 기다리는 다른 호출자와 호출 자체는 취소되지 않는다.
+            in_flight = asyncio.get_running_loop().create_task(self._fetch(key, call))
+            self._in_flight[key] = in_flight
+            in_flight.add_done_callback(lambda task: self._finish_in_flight(key, task))
+        # 공유 호출에는 데드라인이 없으므로 각 호출자는 자신의 데드라인만큼만 기다린다.
+        left = remaining()
+        if left is None:
+            response = await asyncio.shield(in_flight)
+        else:
+            if left < MIN_REMAINING_SEC:
+                raise DeadlineExceeded("Request deadline exceeded while waiting for LLM response")
+            scope = asyncio.timeout(left)
+            try:
+                async with scope:
+                    response = await asyncio.shield(in_flight)
+            except TimeoutError as exc:
+                if not scope.expired():
+                    raise
+                raise DeadlineExceeded("Request deadline exceeded while waiting for LLM response") from exc
+        return response.model_copy(deep=True)
+
+    async def _fetch(self, key: str, call: Callable[[], Awaitable[ModelResponse]]) -> ModelResponse:
+        """디스크 계층을 조회하고, 없으면 `call`을 실행해 결과를 두 계층에 저장한다.
+
+        Args:
+            key (str): 캐시 키.
+            call (Callable[[], Awaitable[ModelResponse]]): 캐시 미스 시 실행할 코루틴 함수.
+
+        Returns:
+            ModelResponse: LLM 응답.
+        """
+        data = await self._get_disk(key)
+        if data is not None:
+            self.disk_hits += 1
+            self._put_memory(key, data)
+            return ModelResponse(**data)
+        self.misses += 1
+        # 첫 호출자의 데드라인이 같은 키를 기다리는 다른 호출자에게 적용되지 않도록 데드라인 없이 호출한다.
+        with no_deadline():
+            response = await call()
+        data = response.model_dump()
+        self._put_memory(key, data)
+        await self._put_disk(key, data)
+        return response
+
+    def _finish_in_flight(self, key: str, task: asyncio.Task[ModelResponse]) -> None:
+        """완료된 호출을 진행 목록에서 제거한다."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # 모든 호출자가 먼저 취소된 경우 "exception was never retrieved" 경고를 막는다.
+            task.exception()
+
+    def _get_memory(self, key: str) -> dict[str, Any] | None:
+        """메모리 계층에서 유효한 항목을 조회한다.
+
+        Args:
+            key (str): 캐시 키.
+
+        Returns:
+            dict[str, Any] | None: 직렬화된 응답. 없거나 만료되면 None.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, data = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return data
+
+    def _put_memory(self, key: str, data: dict[str, Any]) -> None:
+        """메모리 계층에 항목을 저장하고 LRU 한도를 넘는 항목을 제거한다.
+
+        Args:
+            key (str): 캐시 키.
+            data (dict[str, Any]): 직렬화된 응답.
+        """
+        self._entries[key] = (time.monotonic() + self._ttl_sec, data)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _disk_path(self, key: str) -> Path:
+        """디스크 계층 항목 경로를 반환한다."""
+        assert self._disk_dir is not None
+        return self._disk_dir / key[:2] / f"{key}.json"
+
+    async def _get_disk(self, key: str) -> dict[str, Any] | None:
+        """디스크 계층에서 유효한 항목을 조회한다.
+
+        Args:
+            key (str): 캐시 키.
+
+        Returns:
+            dict[str, Any] | None: 직렬화된 응답. 없거나 만료되면 None.
+        """
+        if self._disk_dir is None:
+            return None
+        return await asyncio.to_thread(self._read_disk, self._disk_path(key))
+
+    def _read_disk(self, path: Path) -> dict[str, Any] | None:
+        """디스크 항목을 읽고 만료 여부를 확인한다."""
+        try:
+            record = fast_json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if record.get("expires_at", 0.0) < time.time():
+            path.unlink(missing_ok=True)
+            return None
+        return record.get("response")
+
+    async def _put_disk(self, key: str, data: dict[str, Any]) -> None:
+        """디스크 계층에 항목을 저장한다.
+
+        Args:
+            key (str): 캐시 키.
+            data (dict[str, Any]): 직렬화된 응답.
+        """
+        if self._disk_dir is None:
+            return
+        record = {"expires_at": time.time() + self._ttl_sec, "response": data}
+        try:
+            await asyncio.to_thread(self._write_disk, self._disk_path(key), record)
+        except (OSError, TypeError, ValueError) as exc:
+            logger.info("LLM cache disk write skipped due to error=%s", exc)
+
+    @staticmethod
+    def _write_disk(path: Path, record: dict[str, Any]) -> None:
+        """임시 파일에 기록한 뒤 교체하여 원자적으로 저장한다."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(fast_json.dumps(record, default=_json_default))
+        tmp_path.replace(path)
+
+
+LLM_CACHE = LlmResponseCache(
+    max_entries=settings.llm_cache_max_entries,
+    ttl_sec=settings.llm_cache_ttl_sec,
+    disk_dir=settings.llm_cache_dir,
+)
+
+
+def _collect_cache_metrics() -> list[CollectedFamily]:
+    """LLM 응답 캐시 통계를 메트릭으로 변환한다."""
+    stats = LLM_CACHE.stats()
+    return [
+        (
+            "llm_cache_requests_total",
+            "counter",
+            "LLM cache lookups by result.",
+            [({"result": result}, stats[result]) for result in ("hits", "disk_hits", "misses", "coalesced")],
+        ),
+        ("llm_cache_entries", "gauge", "LLM cache in-memory entries.", [({}, stats["entries"])]),
+        ("llm_cache_in_flight", "gauge", "LLM provider calls currently in flight.", [({}, stats["in_flight"])]),
+    ]
+
+
+REGISTRY.register_collector("llm_cache", _collect_cache_metrics)
+
+
+async def _timed_acompletion(**kwargs: Any) -> Any:
+    """`litellm.acompletion`을 호출하고 지연 시간과 토큰 사용량을 메트릭과 스팬, 실행 원장에 기록한다.
+
+    Args:
+        **kwargs (Any): `litellm.acompletion` 호출 인자.
+
+    Returns:
+        Any: LLM 응답.
+    """
+    model = str(kwargs.get("model", ""))
+    if remaining() is not None:
+        # 요청 데드라인이 있으면 LLM 호출 시간 초과를 남은 시간 이하로 줄이고, 이미 지났으면 호출하지 않는다.
+        if expired():
+            raise DeadlineExceeded(f"Request deadline exceeded before calling model={model}")
+        kwargs["timeout"] = cap_timeout(float(kwargs.get("timeout") or LLM_HTTP_TIMEOUT_SEC))
+    with get_tracer().start_as_current_span("llm.provider_call", attributes={"llm.model": model}) as span:
+        started = time.perf_counter()
+        try:
+            response = await acompletion(**kwargs)
+        except Exception:
+            LLM_REQUEST_DURATION_SECONDS.observe(time.perf_counter() - started, model, "error")
+            raise
+        LLM_REQUEST_DURATION_SECONDS.observe(time.perf_counter() - started, model, "ok")
+
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+            completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+            LLM_TOKENS_TOTAL.inc(model, "prompt", amount=prompt_tokens)
+            LLM_TOKENS_TOTAL.inc(model, "completion", amount=completion_tokens)
+            span.set_attributes({"llm.prompt_tokens": prompt_tokens, "llm.completion_tokens": completion_tokens})
+            record_llm_usage(model, response)
+        return response
+
+
+async def cached_acompletion(**kwargs: Any) -> Any:
+    """캐시를 거쳐 `litellm.acompletion`을 호출한다.
+
+    스트리밍 요청이거나 캐시가 비활성화된 경우 그대로 호출한다.
+
+    Args:
+        **kwargs (Any): `litellm.acompletion` 호출 인자.
+
+    Returns:
+        Any: LLM 응답.
+    """
+    if not settings.llm_cache_enabled or kwargs.get("stream"):
+        return await _timed_acompletion(**kwargs)
+
+    params = dict(kwargs)
+    key = make_cache_key(params.pop("model"), params.pop("messages"), **params)
+    return await LLM_CACHE.get_or_call(key, lambda: _timed_acompletion(**kwargs))
+
+
+def _install_llm_client_session() -> None:
+    """LiteLLM 제공자 호출이 프로세스 공용 커넥션 풀을 재사용하도록 설정하고, 서버 시작 시 미리 연결해 둔다.
+
+    LiteLLM은 제공자 클라이언트를 주기적으로 다시 만들며 매번 새 HTTP 세션을 열기 때문에, 공유 세션을 지정해
+    TLS 핸드셰이크를 요청 경로에서 제거한다.
+    """
+    litellm.aclient_session = HTTP_CLIENTS.async_client("llm", propagate_trace=False, timeout=LLM_HTTP_TIMEOUT_SEC)
+    if settings.openai_model.startswith("openai/"):
+        api_base = os.environ.get("OPENAI_API_BASE") or OPENAI_DEFAULT_API_BASE
+        HTTP_CLIENTS.register_warmup("llm", f"{api_base.rstrip('/')}/models")
+
+
+_install_llm_client_session()
+
+
+class CachingLiteLLMClient(LiteLLMClient):
+    """ADK `LiteLlm`의 비스트리밍 호출에 응답 캐시를 적용하는 클라이언트."""
+
+    async def acompletion(self, model, messages, tools, **kwargs):  # type: ignore[no-untyped-def]
+        """캐시를 거쳐 acompletion을 호출한다."""
+        return await cached_acompletion(model=model, messages=messages, tools=tools, **kwargs)
+
+
+def create_lite_llm(model: str, **kwargs: Any) -> LiteLlm:
+    """응답 캐시가 적용된 `LiteLlm` 인스턴스를 생성한다.
+
+    Args:
+        model (str): 모델 이름.
+        **kwargs (Any): `LiteLlm`에 전달할 추가 인자. 예) tool_choice="auto".
+
+    Returns:
+        LiteLlm: 캐시 클라이언트를 사용하는 모델 인스턴스.
+    """
+    return LiteLlm(model=model, llm_client=CachingLiteLLMClient(), **kwargs)
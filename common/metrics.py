@@ -0,0 +1,335 @@
+"""Prometheus 텍스트 형식 메트릭 모듈.
+
+외부 의존성 없이 카운터, 게이지, 히스토그램을 기록하고 `/metrics` 엔드포인트용 텍스트로 렌더링한다.
+기록 경로는 잠금 한 번과 정수/실수 덧셈만 수행하며, 캐시 통계처럼 이미 다른 곳에 집계된 값은
+스크레이프 시점에 콜렉터로 읽어온다.
+"""
+
+from __future__ import annotations
+
+import os
+import resource
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sequence
+
+# 초 단위 기본 지연 시간 버킷. 툴/LLM 호출처럼 수 초 이상 걸리는 작업까지 포함한다.
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# (이름, 타입, 설명, [(라벨 딕셔너리, 값), ...])
+Sample = tuple[dict[str, str], float]
+CollectedFamily = tuple[str, str, str, list[Sample]]
+
+
+def _escape_label_value(value: str) -> str:
+    """라벨 값을 Prometheus 텍스트 형식에 맞게 이스케이프한다."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    """라벨 이름과 값을 `{a="1",b="2"}` 형식으로 변환한다."""
+    parts = [f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    """메트릭 값을 문자열로 변환한다."""
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """라벨 조합별 값을 보관하는 메트릭 공통 기반 클래스."""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        """_Metric 인스턴스를 초기화한다.
+
+        Args:
+            name (str): 메트릭 이름.
+            documentation (str): 메트릭 설명(HELP).
+            labelnames (Sequence[str]): 라벨 이름 리스트.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labelvalues: Sequence[str]) -> tuple[str, ...]:
+        """라벨 값 튜플을 검증하여 반환한다."""
+        if len(labelvalues) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {labelvalues}")
+        return tuple(labelvalues)
+
+    def render(self) -> list[str]:
+        """HELP/TYPE 헤더와 샘플 라인을 반환한다."""
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+
+
+class Counter(_Metric):
+    """단조 증가 카운터."""
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        """Counter 인스턴스를 초기화한다."""
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        """라벨 조합의 값을 증가시킨다.
+
+        Args:
+            *labelvalues (str): 라벨 값(라벨 이름 순서).
+            amount (float): 증가량.
+        """
+        key = self._key(labelvalues)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> list[str]:
+        """HELP/TYPE 헤더와 샘플 라인을 반환한다."""
+        with self._lock:
+            items = list(self._values.items())
+        lines = super().render()
+        lines.extend(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}" for key, v in items)
+        return lines
+
+
+class Gauge(_Metric):
+    """증감 가능한 게이지."""
+
+    metric_type = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        """Gauge 인스턴스를 초기화한다."""
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        """라벨 조합의 값을 증가시킨다."""
+        key = self._key(labelvalues)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, *labelvalues: str, amount: float = 1.0) -> None:
+        """라벨 조합의 값을 감소시킨다."""
+        self.inc(*labelvalues, amount=-amount)
+
+    def set(self, *labelvalues: str, value: float) -> None:
+        """라벨 조합의 값을 설정한다."""
+        key = self._key(labelvalues)
+        with self._lock:
+            self._values[key] = value
+
+    def render(self) -> list[str]:
+        """HELP/TYPE 헤더와 샘플 라인을 반환한다."""
+        with self._lock:
+            items = list(self._values.items())
+        lines = super().render()
+        lines.extend(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}" for key, v in items)
+        return lines
+
+
+class Histogram(_Metric):
+    """고정 버킷 히스토그램.
+
+    관측 시에는 해당 버킷 하나만 증가시키고, 누적 분포는 렌더링 시점에 계산한다.
+    """
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        """Histogram 인스턴스를 초기화한다.
+
+        Args:
+            name (str): 메트릭 이름.
+            documentation (str): 메트릭 설명(HELP).
+            labelnames (Sequence[str]): 라벨 이름 리스트.
+            buckets (Sequence[float]): 오름차순 버킷 상한 리스트(+Inf 제외).
+        """
+        super().__init__(name, documentation, labelnames)
+        self._buckets = tuple(sorted(buckets))
+        # 라벨 조합별 [버킷별 개수..., +Inf 개수], 합계
+        self._values: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """관측값을 기록한다.
+
+        Args:
+            value (float): 관측값.
+            *labelvalues (str): 라벨 값(라벨 이름 순서).
+        """
+        key = self._key(labelvalues)
+        index = bisect_left(self._buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = ([0] * (len(self._buckets) + 1), [0.0])
+            entry[0][index] += 1
+            entry[1][0] += value
+
+    def render(self) -> list[str]:
+        """HELP/TYPE 헤더와 버킷/합계/개수 샘플 라인을 반환한다."""
+        with self._lock:
+            items = [(key, list(counts), total[0]) for key, (counts, total) in self._values.items()]
+        lines = super().render()
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip((*self._buckets, float("inf")), counts, strict=True):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭과 스크레이프 시점 콜렉터를 보관하는 레지스트리."""
+
+    def __init__(self) -> None:
+        """MetricsRegistry 인스턴스를 초기화한다."""
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: dict[str, Callable[[], Iterable[CollectedFamily]]] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """카운터를 등록하거나 이미 등록된 카운터를 반환한다."""
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """게이지를 등록하거나 이미 등록된 게이지를 반환한다."""
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """히스토그램을 등록하거나 이미 등록된 히스토그램을 반환한다."""
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = Histogram(name, documentation, labelnames, buckets)
+        if not isinstance(metric, Histogram):
+            raise ValueError(f"Metric {name} is already registered as {metric.metric_type}")
+        return metric
+
+    def register_collector(self, name: str, collector: Callable[[], Iterable[CollectedFamily]]) -> None:
+        """스크레이프 시점에 호출할 콜렉터를 등록한다. 같은 이름이면 교체한다.
+
+        Args:
+            name (str): 콜렉터 이름.
+            collector (Callable[[], Iterable[CollectedFamily]]): (이름, 타입, 설명, 샘플 리스트)를 반환하는 함수.
+        """
+        with self._lock:
+            self._collectors[name] = collector
+
+    def render(self) -> str:
+        """모든 메트릭을 Prometheus 텍스트 형식으로 렌더링한다.
+
+        Returns:
+            str: 노출 형식 텍스트.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors.values())
+
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        for collector in collectors:
+            for name, metric_type, documentation, samples in collector():
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {metric_type}")
+                for labels, value in samples:
+                    label_text = _format_labels(list(labels), list(labels.values()))
+                    lines.append(f"{name}{label_text} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _register[M: _Metric](
+        self, metric_class: type[M], name: str, documentation: str, labelnames: Sequence[str]
+    ) -> M:
+        """메트릭을 등록하거나 같은 이름의 기존 메트릭을 반환한다."""
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = metric_class(name, documentation, labelnames)
+        if not isinstance(metric, metric_class):
+            raise ValueError(f"Metric {name} is already registered as {metric.metric_type}")
+        return metric
+
+
+def _read_rss_bytes() -> int:
+    """현재 프로세스 RSS(바이트)를 반환한다. /proc이 없으면 최대 RSS로 대신한다."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS는 바이트, Linux는 KiB 단위로 보고한다.
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+_PROCESS_START_TIME = time.time()
+
+
+def _collect_process() -> list[CollectedFamily]:
+    """프로세스 RSS, CPU 시간, 시작 시각을 수집한다."""
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return [
+        ("process_resident_memory_bytes", "gauge", "Resident memory size in bytes.", [({}, _read_rss_bytes())]),
+        (
+            "process_cpu_seconds_total",
+            "counter",
+            "Total user and system CPU time spent in seconds.",
+            [({}, usage.ru_utime + usage.ru_stime)],
+        ),
+        (
+            "process_start_time_seconds",
+            "gauge",
+            "Start time of the process since unix epoch.",
+            [({}, _PROCESS_START_TIME)],
+        ),
+    ]
+
+
+REGISTRY = MetricsRegistry()
+REGISTRY.register_collector("process", _collect_process)
+
+# 공통 메트릭: 툴/에이전트 단계 실행 시간과 LLM 호출
+TOOL_DURATION_SECONDS = REGISTRY.histogram(
+    "agent_tool_duration_seconds",
+    "Tool execution duration in seconds (remote agent tools are pipeline stages).",
+    ("agent", "tool", "status"),
+)
+LLM_REQUEST_DURATION_SECONDS = REGISTRY.histogram(
+    "llm_request_duration_seconds",
+    "LLM provider call latency in seconds, excluding cache hits.",
+    ("model", "status"),
+)
+LLM_TOKENS_TOTAL = REGISTRY.counter(
+    "llm_tokens_total",
+    "LLM tokens consumed by provider calls.",
+    ("model", "type"),
+)
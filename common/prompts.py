@@ -13,11 +13,18 @@ User Request Analysis:
   * text_limit: article text length limit (default 1000 characters)
     - Examples: "본문 500자", "첫 800자만", "1000자로 제한" → convert to text_limit number
     - If not specified, use 1000
+  * published_after: ISO8601 timestamp; only articles published after it are processed (optional)
+    - Examples: "published_after=2025-01-01T09:00:00Z", "새 기사만 2025-01-01T09:00:00Z 이후"
 
 Pipeline Execution:
 
+0. Call lookup_pipeline_cache with the extracted query, lookback_hours, page_size and text_limit.
+   - If status is "fresh" or "stale", return the cached insights to the user as the final answer and stop.
+   - If status is "miss", run the pipeline below.
+
 1. Call crawler_agent to collect news articles for the specified time period.
    - Natural language request: "Collect news for query=[user query], lookback_hours=[hours], page_size=[count]"
+   - If published_after is given, append ", published_after=[timestamp]" to the request.
    - If crawler returns an empty array, stop the pipeline and inform the user that no news was found.
    - If crawler returns articles, proceed to the next step.
 
@@ -28,21 +35,21 @@ Pipeline Execution:
 3. Call dedupe tool to remove duplicates.
    - Pass the parser results directly to the documents parameter.
 
-4. Limit article text length.
-   - Truncate each article's readable_text to text_limit characters.
-   - Python example: doc["readable_text"] = doc["readable_text"][:text_limit] if doc.get("readable_text") else None
+4. Call truncate tool to condense article text.
+   - Pass the dedupe results directly to the documents parameter, the user query to the query parameter, and text_limit to the text_limit parameter.
+   - The tool keeps lead sentences and sentences with query terms or numbers within the token budget, processing the whole list in one call.
    - This step MUST be performed before the sentiment analysis step to reduce token usage.
 
 5. Call sentiment_agent to compute sentiment and relevance scores.
    - Natural language request: "Analyze sentiment and relevance for this list: [JSON stringified truncated articles]"
 
 6. Call insight_agent to identify key topics and generate actionable insights.
-   - Natural language request: "Generate insights from this sentiment analysis: [JSON stringified sentiment results]"
+   - Natural language request: "Generate insights for query=[user query] from this sentiment analysis: [JSON stringified sentiment results]"
 
 Important:
 - When calling agent tools (crawler_agent, parser_agent, sentiment_agent, insight_agent), include data as JSON strings in natural language requests.
-- Dedupe tool is a regular function tool, so pass the list directly to the documents parameter.
-- Text length limiting must be performed before sentiment analysis to reduce token count."""
+- Dedupe and truncate tools are regular function tools, so pass the list directly to the documents parameter.
+- Do NOT truncate article text yourself; always use the truncate tool before sentiment analysis to reduce token count."""
 
 
 CRAWLER_PROMPT = """You must call the crawl_news tool exactly once and return its raw output.
@@ -51,6 +58,7 @@ Extract parameters from the user request:
 - query: search keywords (required, convert to English)
 - lookback_hours: time window (required, default 24)
 - page_size: number of articles (optional, default 20, max 100)
+- published_after: ISO8601 timestamp (optional; pass it only if present in the request)
 
 Process:
 1. Extract parameters from the request
@@ -135,11 +143,13 @@ CRITICAL RULES:
 
 INSIGHT_PROMPT = """You must call the generate_insights tool exactly once and return its raw output.
 
-Expected request format: "Generate insights from this sentiment analysis: [JSON array]"
+Expected request format: "Generate insights for query=[query] from this sentiment analysis: [JSON array]"
+The request may end with "with min_relevance=[number]".
 
 Process:
-1. Parse the JSON array from the request
-2. Call generate_insights tool with the parsed list as sentiment_results parameter
+1. Parse the query and the JSON array from the request
+2. Call generate_insights tool with the parsed list as sentiment_results parameter and the query as query parameter (use an empty string if no query is given)
+   - If min_relevance is given, pass it as the min_relevance parameter; otherwise omit it
 3. Return ONLY the raw JSON array from the tool - DO NOT add any explanation, summary, or text
 
 CRITICAL RULES:
@@ -0,0 +1,271 @@
+"""파이프라인 결과 캐시 모듈.
+
+오케스트레이터가 추출한 파이프라인 파라미터(query, lookback_hours, page_size, text_limit)를 키로 최종 인사이트를
+캐시한다. 항목은 저장 시각의 시간 버킷(`pipeline_cache_bucket_sec`)에 속하며, 현재 버킷의 항목은 신선(fresh),
+이전 버킷의 항목은 `pipeline_cache_max_stale_sec` 안에서 오래된(stale) 항목으로 즉시 반환된다.
+오래된 항목을 반환하면 키마다 최대 하나의 백그라운드 갱신(오케스트레이터 자기 호출)을 실행한다(stale-while-revalidate).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+from uuid import uuid4
+
+import httpx
+from a2a.types import Message, MessageSendParams, Part, Role, SendMessageRequest, TextPart
+
+from common import fast_json
+from common.http_clients import HTTP_CLIENTS
+from common.logger import get_logger
+from common.metrics import REGISTRY
+from common.settings import settings
+
+logger = get_logger(__name__)
+
+STATUS_FRESH = "fresh"
+STATUS_STALE = "stale"
+STATUS_MISS = "miss"
+# 백그라운드 갱신 요청의 테넌트 (스케줄러 공정 분배에서 사용자 요청과 구분)
+REFRESH_TENANT = "pipeline-cache-refresh"
+# 백그라운드 갱신 요청이 오케스트레이터의 504 응답을 받을 수 있도록 데드라인에 더하는 여유 시간(초)
+REFRESH_GRACE_SEC = 5.0
+
+_BYPASS: ContextVar[bool] = ContextVar("pipeline_cache_bypass", default=False)
+_NO_STORE: ContextVar[bool] = ContextVar("pipeline_cache_no_store", default=False)
+
+PIPELINE_CACHE_LOOKUPS_TOTAL = REGISTRY.counter(
+    "pipeline_cache_lookups_total",
+    "Orchestrator pipeline result cache lookups by status.",
+    ("status",),
+)
+PIPELINE_CACHE_REFRESHES_TOTAL = REGISTRY.counter(
+    "pipeline_cache_refreshes_total",
+    "Background pipeline result cache refreshes by outcome.",
+    ("outcome",),
+)
+
+
+@dataclass(frozen=True)
+class PipelineParams:
+    """결과 캐시 키가 되는 파이프라인 파라미터."""
+
+    query: str
+    lookback_hours: int
+    page_size: int
+    text_limit: int
+
+    @property
+    def key(self) -> str:
+        """대소문자와 공백 차이를 무시한 SHA-256 캐시 키."""
+        payload = fast_json.dumps(
+            [" ".join(self.query.lower().split()), self.lookback_hours, self.page_size, self.text_limit]
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    def to_request_text(self) -> str:
+        """백그라운드 갱신에 사용할 오케스트레이터 요청 문장."""
+        return (
+            f"Run the news pipeline for query={self.query}, lookback_hours={self.lookback_hours}, "
+            f"page_size={self.page_size}, text_limit={self.text_limit}."
+        )
+
+
+@dataclass
+class _Entry:
+    """캐시 항목."""
+
+    value: str
+    bucket: int
+    created_at: float
+
+
+@dataclass(frozen=True)
+class CacheLookup:
+    """캐시 조회 결과."""
+
+    status: str
+    value: str | None = None
+    age_sec: float | None = None
+
+
+@contextmanager
+def cache_bypass_scope(bypass: bool, *, no_store: bool = False) -> Iterator[None]:
+    """이 컨텍스트 안의 조회가 캐시를 건너뛰도록(항상 miss) 설정한다.
+
+    Args:
+        bypass (bool): 캐시를 건너뛸지 여부. (`Cache-Control: no-cache` 요청 또는 백그라운드 갱신)
+        no_store (bool): 결과를 캐시에 저장하지 않을지 여부. (`Cache-Control: no-store` 요청)
+    """
+    token = _BYPASS.set(bypass or no_store)
+    no_store_token = _NO_STORE.set(no_store)
+    try:
+        yield
+    finally:
+        _NO_STORE.reset(no_store_token)
+        _BYPASS.reset(token)
+
+
+def is_cache_store_disabled() -> bool:
+    """현재 요청의 결과를 캐시에 저장하지 말아야 하는지 확인한다. (`Cache-Control: no-store` 요청)"""
+    return _NO_STORE.get()
+
+
+class PipelineResultCache:
+    """시간 버킷과 stale-while-revalidate를 적용하는 LRU 파이프라인 결과 캐시."""
+
+    def __init__(self, *, enabled: bool, bucket_sec: float, max_stale_sec: float, max_entries: int) -> None:
+        """PipelineResultCache 인스턴스를 초기화한다.
+
+        Args:
+            enabled (bool): 캐시 사용 여부. 꺼져 있으면 항상 miss를 반환하고 저장하지 않는다.
+            bucket_sec (float): 시간 버킷 크기(초). 같은 버킷에서 저장된 항목만 신선한 항목으로 본다.
+            max_stale_sec (float): 오래된 항목을 반환할 수 있는 최대 경과 시간(초).
+            max_entries (int): 최대 항목 수. 넘으면 가장 오래 사용하지 않은 항목부터 제거한다.
+        """
+        self.enabled = enabled
+        self._bucket_sec = max(1.0, bucket_sec)
+        self._max_stale_sec = max_stale_sec
+        self._max_entries = max(1, max_entries)
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._refreshing: dict[str, asyncio.Task[None]] = {}
+
+    def lookup(self, params: PipelineParams) -> CacheLookup:
+        """캐시를 조회한다. 오래된 항목이면 백그라운드 갱신을 예약한다.
+
+        Args:
+            params (PipelineParams): 파이프라인 파라미터.
+
+        Returns:
+            CacheLookup: 조회 상태("fresh", "stale", "miss")와 캐시된 최종 인사이트.
+        """
+        if not self.enabled or _BYPASS.get():
+            return self._record(CacheLookup(STATUS_MISS))
+
+        key = params.key
+        entry = self._entries.get(key)
+        now = time.time()
+        if entry is None or now - entry.created_at > self._max_stale_sec:
+            return self._record(CacheLookup(STATUS_MISS))
+
+        self._entries.move_to_end(key)
+        age_sec = round(now - entry.created_at, 1)
+        if entry.bucket == self._bucket(now):
+            return self._record(CacheLookup(STATUS_FRESH, entry.value, age_sec))
+        self._schedule_refresh(params)
+        return self._record(CacheLookup(STATUS_STALE, entry.value, age_sec))
+
+    def store(self, params: PipelineParams, value: str) -> None:
+        """파이프라인 최종 인사이트를 현재 시간 버킷에 저장한다.
+
+        Args:
+            params (PipelineParams): 파이프라인 파라미터.
+            value (str): insight_agent 결과.
+        """
+        if not self.enabled or not value:
+            return
+        now = time.time()
+        key = params.key
+        self._entries[key] = _Entry(value, self._bucket(now), now)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        logger.info("Pipeline result cached query=%s entries=%s", params.query, len(self._entries))
+
+    def snapshot(self) -> dict[str, Any]:
+        """캐시 현황을 반환한다."""
+        return {"enabled": self.enabled, "entries": len(self._entries), "refreshing": len(self._refreshing)}
+
+    def _bucket(self, timestamp: float) -> int:
+        """시각이 속한 시간 버킷 번호."""
+        return int(timestamp // self._bucket_sec)
+
+    def _record(self, result: CacheLookup) -> CacheLookup:
+        """조회 결과를 메트릭에 기록한다."""
+        PIPELINE_CACHE_LOOKUPS_TOTAL.inc(result.status)
+        return result
+
+    def _schedule_refresh(self, params: PipelineParams) -> None:
+        """키마다 최대 하나의 백그라운드 갱신을 시작한다.
+
+        갱신은 현재 요청의 데드라인/사용량 원장/트레이스를 물려받지 않도록 빈 컨텍스트에서 실행한다.
+        """
+        key = params.key
+        if key in self._refreshing:
+            return
+        task = asyncio.get_running_loop().create_task(self._refresh(params), context=contextvars.Context())
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    async def _refresh(self, params: PipelineParams) -> None:
+        """캐시를 건너뛰는 배치 우선순위 요청으로 오케스트레이터 파이프라인을 다시 실행한다.
+
+        갱신 실행의 insight_agent 결과는 일반 실행과 같은 경로로 캐시에 저장된다.
+        """
+        logger.info("Refreshing stale pipeline result query=%s", params.query)
+        request = SendMessageRequest(
+            id=str(uuid4()),
+            params=MessageSendParams(
+                message=Message(
+                    message_id=str(uuid4()),
+                    role=Role.user,
+                    parts=[Part(root=TextPart(text=params.to_request_text()))],
+                )
+            ),
+        )
+        deadline_sec = settings.run_deadline_sec
+        client = HTTP_CLIENTS.async_client(
+            "pipeline-cache-refresh",
+            timeout=httpx.Timeout(deadline_sec + REFRESH_GRACE_SEC if deadline_sec > 0 else None),
+        )
+        try:
+            response = await client.post(
+                f"http://127.0.0.1:{settings.orchestrator_agent_public_port}/",
+                content=request.model_dump_json(by_alias=True, exclude_none=True),
+                headers={
+                    "Content-Type": "application/json",
+                    "Cache-Control": "no-cache",
+                    "X-Run-Priority": "batch",
+                    "X-Tenant-Id": REFRESH_TENANT,
+                },
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            PIPELINE_CACHE_REFRESHES_TOTAL.inc("error")
+            logger.info("Pipeline result refresh failed query=%s error=%s", params.query, exc)
+            return
+        PIPELINE_CACHE_REFRESHES_TOTAL.inc("ok")
+
+
+def is_cache_bypass_requested(cache_control: str | None) -> bool:
+    """`Cache-Control` 요청 헤더가 캐시를 건너뛰라고 지시하는지 확인한다."""
+    if not cache_control:
+        return False
+    directives = {directive.strip().lower() for directive in cache_control.split(",")}
+    return bool(directives & {"no-cache", "no-store", "max-age=0"})
+
+
+def is_cache_store_forbidden(cache_control: str | None) -> bool:
+    """`Cache-Control` 요청 헤더가 결과를 캐시에 저장하지 말라고(no-store) 지시하는지 확인한다.
+
+    증분 실행처럼 같은 파라미터라도 일부 기사만 처리한 결과가 전체 결과 자리에 저장되지 않도록 한다.
+    """
+    if not cache_control:
+        return False
+    return "no-store" in {directive.strip().lower() for directive in cache_control.split(",")}
+
+
+PIPELINE_CACHE = PipelineResultCache(
+    enabled=settings.pipeline_cache_enabled,
+    bucket_sec=settings.pipeline_cache_bucket_sec,
+    max_stale_sec=settings.pipeline_cache_max_stale_sec,
+    max_entries=settings.pipeline_cache_max_entries,
+)
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Any
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, TypeAdapter, ValidationError
 
 
 class NewsDoc(BaseModel):
@@ -53,4 +54,30 @@ class Insight(BaseModel):
     confidence: float = Field(..., ge=0.0, le=1.0, description="인사이트 신뢰도")
 
 
-__all__ = ["NewsDoc", "SentimentScore", "Insight"]
+# 문서 리스트를 기사마다 `NewsDoc(**doc).model_dump()`로 왕복하는 대신 한 번의 Rust 호출로 검증/직렬화한다.
+_NEWS_DOC_LIST_ADAPTER: TypeAdapter[list[NewsDoc]] = TypeAdapter(list[NewsDoc])
+
+
+def validate_news_docs(documents: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], int]:
+    """문서 리스트를 일괄 검증하고 JSON 호환 dict 리스트로 정규화한다.
+
+    검증에 실패한 문서는 건너뛴다. 실패가 있으면 해당 문서를 제외하고 한 번 더 일괄 검증한다.
+
+    Args:
+        documents (list[dict[str, Any]]): `NewsDoc` 스키마와 호환되는 문서 리스트.
+
+    Returns:
+        tuple[list[dict[str, Any]], int]: (정규화된 문서 리스트, 건너뛴 문서 수).
+            URL과 발행 시각은 문자열로 직렬화된다.
+    """
+    try:
+        docs = _NEWS_DOC_LIST_ADAPTER.validate_python(documents)
+    except ValidationError as exc:
+        invalid = {error["loc"][0] for error in exc.errors() if error["loc"]}
+        documents = [document for index, document in enumerate(documents) if index not in invalid]
+        docs = _NEWS_DOC_LIST_ADAPTER.validate_python(documents)
+        return _NEWS_DOC_LIST_ADAPTER.dump_python(docs, mode="json"), len(invalid)
+    return _NEWS_DOC_LIST_ADAPTER.dump_python(docs, mode="json"), 0
+
+
+__all__ = ["NewsDoc", "SentimentScore", "Insight", "validate_news_docs"]
@@ -0,0 +1,112 @@
+"""핫 패스 직렬화 마이크로벤치마크 모듈.
+
+크롤러/파서의 문서 검증(기사마다 `NewsDoc` 왕복 vs `validate_news_docs` 일괄 검증)과
+LLM 캐시 키/디스크 기록 및 스팬 JSONL에 쓰이는 JSON 인코딩(`json` vs `fast_json`)을 기사 수별로 측정한다.
+
+사용 예:
+    python -m common.serialization_benchmark
+    python -m common.serialization_benchmark --articles 20 100 --output .data/serialization.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from common import fast_json
+from common.schemas import NewsDoc, validate_news_docs
+
+DEFAULT_ARTICLE_COUNTS = (20, 100)
+DEFAULT_REPEAT = 5
+TEXT_LENGTH = 2000
+
+
+def sample_documents(count: int) -> list[dict[str, Any]]:
+    """파서 출력과 비슷한 크기의 기사 문서를 만든다."""
+    return [
+        {
+            "url": f"https://news.example.com/markets/2025/10/{index}",
+            "title": f"Stocks rally as earnings beat expectations #{index}",
+            "publisher": "Example News",
+            "published_at": "2025-10-19T08:30:00Z",
+            "readable_text": "시장 " * (TEXT_LENGTH // 3),
+        }
+        for index in range(count)
+    ]
+
+
+def _per_item_validate(documents: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """기존 방식: 기사마다 모델을 만들고 다시 dict로 변환한다."""
+    return [NewsDoc(**document).model_dump(mode="json") for document in documents]
+
+
+def _best_us(func: Callable[[], Any], repeat: int) -> float:
+    """함수 1회 실행 시간의 최솟값(µs)을 측정한다."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1_000_000
+
+
+def run_benchmark(count: int, repeat: int = DEFAULT_REPEAT) -> dict[str, Any]:
+    """기사 수 하나에 대해 검증과 JSON 인코딩/디코딩 시간을 측정한다.
+
+    Args:
+        count (int): 기사 수.
+        repeat (int): 반복 측정 횟수. 최솟값을 사용한다.
+
+    Returns:
+        dict[str, Any]: 항목별 1회 실행 시간(µs).
+    """
+    documents = sample_documents(count)
+    encoded = json.dumps(documents)
+    return {
+        "articles": count,
+        "orjson": fast_json.ORJSON_AVAILABLE,
+        "validate_per_item_us": round(_best_us(lambda: _per_item_validate(documents), repeat), 1),
+        "validate_batch_us": round(_best_us(lambda: validate_news_docs(documents), repeat), 1),
+        "json_dumps_us": round(_best_us(lambda: json.dumps(documents, sort_keys=True), repeat), 1),
+        "fast_json_dumps_us": round(_best_us(lambda: fast_json.dumps(documents, sort_keys=True), repeat), 1),
+        "json_loads_us": round(_best_us(lambda: json.loads(encoded), repeat), 1),
+        "fast_json_loads_us": round(_best_us(lambda: fast_json.loads(encoded), repeat), 1),
+    }
+
+
+def _format_result(result: dict[str, Any]) -> str:
+    """벤치마크 결과를 한 줄 요약으로 변환한다."""
+    return (
+        f"articles={result['articles']:<4} "
+        f"validate per-item={result['validate_per_item_us']}µs batch={result['validate_batch_us']}µs | "
+        f"dumps json={result['json_dumps_us']}µs fast={result['fast_json_dumps_us']}µs | "
+        f"loads json={result['json_loads_us']}µs fast={result['fast_json_loads_us']}µs"
+    )
+
+
+def main() -> None:
+    """CLI 진입점. 기사 수별 측정 결과를 출력하고 선택적으로 JSONL에 누적 기록한다."""
+    parser = argparse.ArgumentParser(description="Benchmark NewsDoc validation and JSON encoding on hot paths.")
+    parser.add_argument("--articles", type=int, nargs="+", default=list(DEFAULT_ARTICLE_COUNTS), help="측정할 기사 수")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="반복 측정 횟수")
+    parser.add_argument("--output", help="결과를 누적 기록할 JSONL 파일 경로")
+    args = parser.parse_args()
+
+    results = []
+    for count in args.articles:
+        result = {"measured_at": time.time(), **run_benchmark(count, args.repeat)}
+        results.append(result)
+        print(_format_result(result))
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with output.open("ab") as file:
+            for result in results:
+                file.write(fast_json.dumps(result) + b"\n")
+
+
+if __name__ == "__main__":
+    main()
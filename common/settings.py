@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -18,6 +20,77 @@ class AppSettings(BaseSettings):
         sentiment_agent_url (HttpUrl): 감정 에이전트 카드 URL.
         insight_agent_url (HttpUrl): 인사이트 에이전트 카드 URL.
         newsapi_api_key (str | None): NewsAPI 인증 키.
+        llm_cache_enabled (bool): LLM 응답 캐시 사용 여부.
+        llm_cache_max_entries (int): LLM 응답 캐시 메모리 계층 최대 항목 수.
+        llm_cache_ttl_sec (float): LLM 응답 캐시 항목 유효 시간(초).
+        llm_cache_dir (str | None): LLM 응답 캐시 디스크 계층 디렉터리. 없으면 메모리만 사용.
+        task_store_backend (str): A2A 태스크 저장소 종류("memory", "sqlite", "unbounded").
+        task_store_dir (str): SQLite 태스크 저장소 파일 디렉터리.
+        task_store_max_tasks (int): 태스크 저장소 최대 태스크 수.
+        task_store_max_bytes (int): 태스크 저장소 최대 총 바이트 수(직렬화 기준).
+        task_store_max_age_sec (float): 마지막 갱신 이후 태스크 보관 시간(초).
+        session_max_sessions (int): ADK 세션 서비스 최대 세션 수.
+        session_ttl_sec (float): 마지막 사용 이후 ADK 세션 보관 시간(초).
+        session_max_bytes (int): ADK 세션별 이벤트 크기 상한(바이트).
+        artifact_max_bytes (int): ADK 아티팩트 서비스 최대 총 바이트 수.
+        artifact_ttl_sec (float): ADK 아티팩트 보관 시간(초).
+        memory_max_sessions (int): ADK 메모리 서비스 최대 보관 세션 수.
+        health_poll_interval_sec (float): 서브 에이전트 헬스 백그라운드 폴링 주기(초).
+        tracing_enabled (bool): 분산 트레이싱 스팬 기록 여부.
+        tracing_dir (str): 서비스별 JSONL 스팬 파일 디렉터리.
+        profiling_enabled (bool): 요청 단위 온디맨드 프로파일링 허용 여부.
+        profiling_dir (str): 프로파일 파일 저장 디렉터리.
+        profiling_interval_ms (float): 스택 샘플링 주기(밀리초).
+        profiling_max_duration_sec (float): 요청당 최대 샘플링 시간(초).
+        profiling_max_files (int): 보관할 최대 프로파일 파일 수.
+        truncate_token_budget (int): 본문 축약 툴의 문서당 추정 토큰 예산.
+        run_token_budget (int): 파이프라인 실행당 LLM 토큰 예산. 0이면 제한 없음.
+        run_cost_budget_usd (float): 파이프라인 실행당 LLM 추정 비용 예산(USD). 0이면 제한 없음.
+        run_budget_soft_ratio (float): 본문 축약/LLM 요약 생략을 시작할 예산 소진 비율.
+        run_budget_max_articles (int): 예산 소진 후 처리할 최대 기사 수.
+        run_budget_text_limit (int): 예산 부족 시 문서당 본문 길이 상한(글자 수).
+        agent_preload (bool): 서버 시작 직후 에이전트를 백그라운드에서 미리 로드할지 여부.
+        crawler_agent_endpoints (str): 크롤러 에이전트 복제본 host:port 목록(쉼표 구분). 없으면 공개 호스트/포트.
+        parser_agent_endpoints (str): 파서 에이전트 복제본 host:port 목록(쉼표 구분).
+        sentiment_agent_endpoints (str): 감정 에이전트 복제본 host:port 목록(쉼표 구분).
+        insight_agent_endpoints (str): 인사이트 에이전트 복제본 host:port 목록(쉼표 구분).
+        agent_eject_sec (float): 연결에 실패한 복제본을 요청 대상에서 제외하는 시간(초).
+        run_deadline_sec (float): 요청에 데드라인 헤더가 없을 때 적용할 데드라인(초). 0이면 데드라인 없음.
+        breaker_failure_threshold (int): 서브 에이전트 서킷 브레이커를 여는 연속 실패 횟수.
+        breaker_reset_sec (float): 서킷을 연 뒤 시험 요청을 허용하기까지의 시간(초).
+        hedge_agents (str): 헤지 요청을 허용할 멱등 서브 에이전트 이름 목록(쉼표 구분). 비어 있으면 사용 안 함.
+        hedge_percentile (float): 헤지 요청을 보낼 지연 시간 백분위수.
+        hedge_min_samples (int): 헤지 기준을 계산하기 위한 최소 지연 시간 표본 수.
+        scheduler_max_runs (int): 오케스트레이터가 동시에 실행하는 파이프라인 실행 수.
+        scheduler_queue_size (int): 실행 대기열 최대 길이. 가득 차면 새 실행을 503으로 거절한다.
+        scheduler_tenant_max_runs (int): 테넌트 하나가 동시에 실행할 수 있는 실행 수.
+        scheduler_tenant_queue_size (int): 테넌트 하나가 대기열에 둘 수 있는 실행 수. 넘으면 429로 거절한다.
+        scheduler_queue_timeout_sec (float): 대기열에서 기다릴 최대 시간(초). 넘으면 503으로 거절한다.
+        scheduler_batch_every (int): 대화형 실행이 대기 중이어도 N번째 실행 슬롯마다 배치 실행에 양보한다.
+        crawler_agent_max_concurrency (int): 크롤러 에이전트 동시 호출 수 상한. 0이면 제한 없음.
+        parser_agent_max_concurrency (int): 파서 에이전트 동시 호출 수 상한.
+        sentiment_agent_max_concurrency (int): 감정 에이전트 동시 호출 수 상한.
+        insight_agent_max_concurrency (int): 인사이트 에이전트 동시 호출 수 상한.
+        pipeline_cache_enabled (bool): 오케스트레이터 파이프라인 결과 캐시 사용 여부.
+        pipeline_cache_bucket_sec (float): 결과 캐시 시간 버킷 크기(초). 같은 버킷에서 저장된 결과만 신선한 결과로 본다.
+        pipeline_cache_max_stale_sec (float): 오래된 결과를 즉시 반환(백그라운드 갱신)할 수 있는 최대 경과 시간(초).
+        pipeline_cache_max_entries (int): 결과 캐시 최대 항목 수.
+        checkpoint_enabled (bool): 오케스트레이터 단계 체크포인트 저장 및 재개 사용 여부.
+        checkpoint_dir (str): 체크포인트 SQLite 파일 디렉터리.
+        checkpoint_max_runs (int): 체크포인트를 보관할 최대 실행 수.
+        checkpoint_max_age_sec (float): 마지막 저장 이후 실행의 체크포인트를 유지할 시간(초).
+        article_store_enabled (bool): 파이프라인 기사 저장소 사용 여부.
+        article_store_dir (str): 기사 저장소 SQLite 파일 디렉터리.
+        watchlist_path (str): 워치리스트 정의 JSON 파일 경로.
+        watchlist_state_path (str): 워치리스트별 마지막 실행 상태를 저장할 JSON 파일 경로.
+        watchlist_interval_sec (float): 워치리스트 기본 실행 주기(초).
+        watchlist_stagger_sec (float): 워치리스트 실행 시작 사이의 최소 간격(초).
+        watchlist_jitter_ratio (float): 실행 주기에 더하는 무작위 흔들림 비율.
+        watchlist_max_concurrent_runs (int): 동시에 실행할 최대 워치리스트 수.
+        watchlist_public_port (int): 워치리스트 러너 헬스 체크 포트.
+        a2a_structured_data (bool): 에이전트 간 구조화 데이터(DataPart) 및 요청 압축 확장 사용 여부.
+        a2a_structured_min_chars (int): 요청 텍스트에서 DataPart로 분리할 JSON 본문의 최소 글자 수.
+        a2a_compression_min_bytes (int): 요청/응답 본문을 압축할 최소 바이트 수.
     """
 
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
@@ -47,5 +120,110 @@ class AppSettings(BaseSettings):
     # NewsAPI 인증 키
     newsapi_api_key: str | None = None
 
+    # LLM 응답 캐시 설정
+    llm_cache_enabled: bool = True
+    llm_cache_max_entries: int = 512
+    llm_cache_ttl_sec: float = 3600.0
+    llm_cache_dir: str | None = None
+
+    # A2A 태스크 저장소 설정
+    task_store_backend: Literal["memory", "sqlite", "unbounded"] = "memory"
+    task_store_dir: str = ".data/tasks"
+    task_store_max_tasks: int = 1000
+    task_store_max_bytes: int = 256 * 1024 * 1024
+    task_store_max_age_sec: float = 24 * 3600.0
+
+    # ADK Runner 세션/아티팩트/메모리 서비스 한도 설정
+    session_max_sessions: int = 256
+    session_ttl_sec: float = 3600.0
+    session_max_bytes: int = 8 * 1024 * 1024
+    artifact_max_bytes: int = 64 * 1024 * 1024
+    artifact_ttl_sec: float = 3600.0
+    memory_max_sessions: int = 256
+
+    # 서브 에이전트 헬스 폴링 설정
+    health_poll_interval_sec: float = 10.0
+
+    # 분산 트레이싱 설정
+    tracing_enabled: bool = False
+    tracing_dir: str = ".data/traces"
+
+    # 요청 단위 프로파일링 설정
+    profiling_enabled: bool = False
+    profiling_dir: str = ".data/profiles"
+    profiling_interval_ms: float = 5.0
+    profiling_max_duration_sec: float = 300.0
+    profiling_max_files: int = 50
+
+    # 본문 축약 설정 (문서당 추정 토큰 예산, `text_limit` 글자 수 상한과 함께 적용)
+    truncate_token_budget: int = 300
+
+    # 파이프라인 실행당 LLM 예산 설정 (초과 시 실패 대신 단계를 축소 실행)
+    run_token_budget: int = 0
+    run_cost_budget_usd: float = 0.0
+    run_budget_soft_ratio: float = 0.7
+    run_budget_max_articles: int = 10
+    run_budget_text_limit: int = 400
+
+    # 에이전트 지연 로드 설정 (False면 첫 요청 시점에 로드)
+    agent_preload: bool = True
+
+    # 서브 에이전트 복제본 설정 (오케스트레이터가 처리 중 요청이 가장 적은 복제본으로 분산)
+    crawler_agent_endpoints: str = ""
+    parser_agent_endpoints: str = ""
+    sentiment_agent_endpoints: str = ""
+    insight_agent_endpoints: str = ""
+    agent_eject_sec: float = 30.0
+
+    # 데드라인, 서킷 브레이커, 헤지 요청 설정
+    run_deadline_sec: float = 600.0
+    breaker_failure_threshold: int = 5
+    breaker_reset_sec: float = 30.0
+    hedge_agents: str = ""
+    hedge_percentile: float = 95.0
+    hedge_min_samples: int = 20
+
+    # 실행 승인 제어 설정 (오케스트레이터 실행 대기열, 테넌트별 공정 분배, 우선순위 레인, 단계별 동시 호출 상한)
+    scheduler_max_runs: int = 8
+    scheduler_queue_size: int = 32
+    scheduler_tenant_max_runs: int = 2
+    scheduler_tenant_queue_size: int = 8
+    scheduler_queue_timeout_sec: float = 60.0
+    scheduler_batch_every: int = 4
+    crawler_agent_max_concurrency: int = 8
+    parser_agent_max_concurrency: int = 4
+    sentiment_agent_max_concurrency: int = 4
+    insight_agent_max_concurrency: int = 4
+
+    # 파이프라인 결과 캐시 설정 (파라미터 + 시간 버킷 키, stale-while-revalidate)
+    pipeline_cache_enabled: bool = True
+    pipeline_cache_bucket_sec: float = 300.0
+    pipeline_cache_max_stale_sec: float = 3600.0
+    pipeline_cache_max_entries: int = 256
+
+    # 단계 체크포인트 설정 (실행 ID별 단계 출력 저장, 재실행 시 완료된 단계부터 재개)
+    checkpoint_enabled: bool = True
+    checkpoint_dir: str = ".data/checkpoints"
+    checkpoint_max_runs: int = 500
+    checkpoint_max_age_sec: float = 86400.0
+
+    # 기사 저장소 설정 (처리한 기사, 검색어별 점수, 인사이트 누적 저장)
+    article_store_enabled: bool = True
+    article_store_dir: str = ".data/articles"
+
+    # 워치리스트 러너 설정 (주기 실행, 증분 수집, 실행 시작 분산)
+    watchlist_path: str = "watchlist.json"
+    watchlist_state_path: str = ".data/watchlist_state.json"
+    watchlist_interval_sec: float = 900.0
+    watchlist_stagger_sec: float = 30.0
+    watchlist_jitter_ratio: float = 0.1
+    watchlist_max_concurrent_runs: int = 1
+    watchlist_public_port: int = 8205
+
+    # 에이전트 간 구조화 데이터 전송 설정 (양쪽이 확장을 지원할 때만 사용)
+    a2a_structured_data: bool = True
+    a2a_structured_min_chars: int = 2048
+    a2a_compression_min_bytes: int = 4096
+
 
 settings = AppSettings()
@@ -2,10 +2,28 @@
 
 from __future__ import annotations
 
+import argparse
+import os
+import threading
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+import httpx
+from opentelemetry import propagate, trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter, SpanExportResult
+
+from common import fast_json
 from common.logger import get_logger
+from common.settings import settings
 
 logger = get_logger(__name__)
 
+# 워터폴 막대 전체 너비(문자 수)
+WATERFALL_WIDTH = 60
+
 
 def instrument_langfuse() -> None:
     """Langfuse 계측을 초기화한다.
@@ -23,3 +41,185 @@ def instrument_langfuse() -> None:
         logger.info("Langfuse instrumentation completed.")
     except Exception as exc:
         logger.info("Langfuse instrumentation skipped due to error=%s", exc)
+
+
+class JsonlSpanExporter(SpanExporter):
+    """종료된 스팬을 JSON Lines 파일에 한 줄씩 기록하는 익스포터.
+
+    서비스마다 별도 파일에 기록하며, `render_waterfall`로 여러 서비스 파일을 합쳐 하나의 실행을 볼 수 있다.
+    """
+
+    def __init__(self, path: str) -> None:
+        """JsonlSpanExporter 인스턴스를 초기화한다.
+
+        Args:
+            path (str): 스팬을 기록할 파일 경로.
+        """
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        """스팬 배치를 파일에 추가한다."""
+        lines = [fast_json.dumps(_span_to_record(span), default=str) for span in spans]
+        try:
+            with self._lock, self._path.open("ab") as file:
+                file.write(b"\n".join(lines) + b"\n")
+        except OSError as exc:
+            logger.info("Span export skipped due to error=%s", exc)
+            return SpanExportResult.FAILURE
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        """익스포터를 종료한다. 파일은 배치마다 닫으므로 정리할 자원이 없다."""
+
+
+def _span_to_record(span: ReadableSpan) -> dict[str, Any]:
+    """스팬을 JSON 직렬화 가능한 레코드로 변환한다."""
+    context = span.get_span_context()
+    return {
+        "trace_id": format(context.trace_id, "032x"),
+        "span_id": format(context.span_id, "016x"),
+        "parent_span_id": format(span.parent.span_id, "016x") if span.parent else None,
+        "name": span.name,
+        "kind": span.kind.name,
+        "service": span.resource.attributes.get("service.name", ""),
+        "start_ns": span.start_time,
+        "end_ns": span.end_time,
+        "status": span.status.status_code.name,
+        "attributes": dict(span.attributes or {}),
+    }
+
+
+_TRACING_CONFIGURED = False
+
+
+def configure_tracing(service_name: str) -> None:
+    """OpenTelemetry 트레이서 프로바이더를 설정한다.
+
+    `tracing_enabled` 설정이 켜져 있으면 `tracing_dir`에 서비스별 JSONL 파일로 스팬을 내보낸다.
+    `OTEL_EXPORTER_OTLP_ENDPOINT` 환경 변수가 있으면 OTLP 수집기로도 함께 내보낸다.
+    ADK가 만드는 invocation/agent/LLM/툴 스팬도 같은 프로바이더로 기록된다. 프로세스당 한 번만 설정한다.
+
+    Args:
+        service_name (str): 스팬에 기록할 서비스 이름.
+    """
+    global _TRACING_CONFIGURED
+    if _TRACING_CONFIGURED or not settings.tracing_enabled:
+        return
+    _TRACING_CONFIGURED = True
+
+    provider = TracerProvider(resource=Resource.create({"service.name": service_name}))
+    file_name = f"{service_name.lower().replace(' ', '_')}.jsonl"
+    provider.add_span_processor(BatchSpanProcessor(JsonlSpanExporter(str(Path(settings.tracing_dir) / file_name))))
+
+    if os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT") or os.getenv("OTEL_EXPORTER_OTLP_TRACES_ENDPOINT"):
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+        provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+
+    trace.set_tracer_provider(provider)
+    logger.info("Tracing configured service=%s dir=%s", service_name, settings.tracing_dir)
+
+
+def get_tracer() -> trace.Tracer:
+    """애플리케이션 스팬용 트레이서를 반환한다."""
+    return trace.get_tracer("multiagent-news-insight")
+
+
+async def _inject_trace_headers(request: httpx.Request) -> None:
+    """현재 트레이스 컨텍스트를 W3C traceparent 헤더로 요청에 주입한다."""
+    propagate.inject(request.headers)
+
+
+def create_traced_async_client(**kwargs: Any) -> httpx.AsyncClient:
+    """나가는 요청에 트레이스 컨텍스트를 전파하는 `httpx.AsyncClient`를 생성한다.
+
+    Args:
+        **kwargs (Any): `httpx.AsyncClient`에 전달할 인자.
+
+    Returns:
+        httpx.AsyncClient: 요청 훅이 등록된 클라이언트.
+    """
+    event_hooks = kwargs.pop("event_hooks", None) or {}
+    event_hooks.setdefault("request", []).append(_inject_trace_headers)
+    return httpx.AsyncClient(event_hooks=event_hooks, **kwargs)
+
+
+def render_waterfall(
+    records: Iterable[dict[str, Any]],
+    trace_id: str | None = None,
+    min_duration_ms: float = 0.0,
+) -> str:
+    """스팬 레코드를 트레이스별 워터폴 텍스트로 렌더링한다.
+
+    Args:
+        records (Iterable[dict[str, Any]]): `JsonlSpanExporter`가 기록한 스팬 레코드.
+        trace_id (str | None): 렌더링할 트레이스 ID. 없으면 가장 최근 트레이스.
+        min_duration_ms (float): 이보다 짧은 스팬은 생략하고 하위 스팬을 한 단계 올려 출력한다.
+
+    Returns:
+        str: 시작 시각 기준 오프셋, 소요 시간, 막대를 포함한 들여쓰기 트리.
+    """
+    traces: dict[str, list[dict[str, Any]]] = {}
+    for record in records:
+        traces.setdefault(record["trace_id"], []).append(record)
+    if not traces:
+        return "No spans found."
+    if trace_id is None:
+        trace_id = max(traces, key=lambda key: max(span["end_ns"] or 0 for span in traces[key]))
+    spans = traces.get(trace_id)
+    if not spans:
+        return f"Trace not found trace_id={trace_id}"
+
+    span_ids = {span["span_id"] for span in spans}
+    children: dict[str | None, list[dict[str, Any]]] = {}
+    for span in spans:
+        parent = span["parent_span_id"] if span["parent_span_id"] in span_ids else None
+        children.setdefault(parent, []).append(span)
+    for siblings in children.values():
+        siblings.sort(key=lambda span: span["start_ns"])
+
+    trace_start = min(span["start_ns"] for span in spans)
+    trace_end = max(span["end_ns"] or span["start_ns"] for span in spans)
+    total_ns = max(trace_end - trace_start, 1)
+
+    lines = [f"trace_id={trace_id} spans={len(spans)} duration={total_ns / 1e6:.1f}ms"]
+
+    def _render(parent: str | None, depth: int) -> None:
+        for span in children.get(parent, []):
+            end_ns = span["end_ns"] or span["start_ns"]
+            if (end_ns - span["start_ns"]) / 1e6 < min_duration_ms:
+                # 짧은 스팬은 생략하되, 하위에 긴 작업이 이어질 수 있으므로 자식은 같은 깊이로 출력한다.
+                _render(span["span_id"], depth)
+                continue
+            offset = (span["start_ns"] - trace_start) * WATERFALL_WIDTH // total_ns
+            width = max(1, (end_ns - span["start_ns"]) * WATERFALL_WIDTH // total_ns)
+            bar = " " * offset + "█" * width
+            label = f"{'  ' * depth}{span['name']} [{span['service']}]"
+            lines.append(
+                f"{(span['start_ns'] - trace_start) / 1e6:>9.1f}ms {(end_ns - span['start_ns']) / 1e6:>9.1f}ms "
+                f"{bar:<{WATERFALL_WIDTH}} {label}"
+            )
+            _render(span["span_id"], depth + 1)
+
+    _render(None, 0)
+    return "\n".join(lines)
+
+
+def _load_span_records(paths: Iterable[str]) -> list[dict[str, Any]]:
+    """JSONL 스팬 파일들을 읽는다."""
+    records: list[dict[str, Any]] = []
+    for path in paths:
+        with open(path, encoding="utf-8") as file:
+            records.extend(fast_json.loads(line) for line in file if line.strip())
+    return records
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="JSONL 스팬 파일을 워터폴로 출력한다.")
+    parser.add_argument("paths", nargs="+", help="스팬 파일 경로. 예) .data/traces/*.jsonl")
+    parser.add_argument("--trace-id", default=None, help="출력할 트레이스 ID. 기본값: 가장 최근 트레이스")
+    parser.add_argument("--min-ms", type=float, default=1.0, help="생략할 짧은 스팬 기준(ms). 기본값: 1")
+    args = parser.parse_args()
+    print(render_waterfall(_load_span_records(args.paths), args.trace_id, args.min_ms))
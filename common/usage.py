@@ -0,0 +1,409 @@
+"""파이프라인 실행 단위 LLM 토큰/비용 집계 및 예산 모듈.
+
+요청마다 `RunUsageLedger`를 컨텍스트에 두고 해당 프로세스의 LLM 호출 토큰과 비용을 에이전트별로 누적한다.
+서브 에이전트는 자신의 사용량을 `X-LLM-Usage` 응답 헤더로 돌려주고, 오케스트레이터는 이를 같은 실행의
+원장에 합산한다. 누적 사용량이 예산에 가까워지면 `BudgetDirective`를 계산하여 `X-Run-Budget` 요청 헤더로
+서브 에이전트에 전달하고, 각 툴은 이를 참고해 기사 수/본문 길이를 줄이거나 LLM 요약을 생략한다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from common import fast_json
+from common.logger import get_logger
+from common.metrics import REGISTRY
+from common.settings import settings
+
+logger = get_logger(__name__)
+
+RUN_ID_HEADER = "x-run-id"
+RUN_BUDGET_HEADER = "x-run-budget"
+LLM_USAGE_HEADER = "x-llm-usage"
+RECENT_RUNS_SIZE = 100
+
+BUDGET_LEVEL_NORMAL = "normal"
+BUDGET_LEVEL_SOFT = "soft"
+BUDGET_LEVEL_EXHAUSTED = "exhausted"
+
+LLM_COST_USD_TOTAL = REGISTRY.counter(
+    "llm_cost_usd_total",
+    "Estimated LLM cost in USD for provider calls.",
+    ("model",),
+)
+RUN_BUDGET_DEGRADATIONS_TOTAL = REGISTRY.counter(
+    "run_budget_degradations_total",
+    "Pipeline steps executed with a degraded budget directive.",
+    ("level",),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class BudgetDirective:
+    """예산 상태에 따라 파이프라인 단계가 따라야 할 축소 지시.
+
+    Attributes:
+        level (str): 예산 단계("normal", "soft", "exhausted").
+        max_articles (int | None): 처리할 최대 기사 수. None이면 제한 없음.
+        text_limit (int | None): 문서당 본문 길이 상한(글자 수). None이면 제한 없음.
+        skip_llm_summary (bool): LLM 요약 인사이트 생략 여부.
+    """
+
+    level: str = BUDGET_LEVEL_NORMAL
+    max_articles: int | None = None
+    text_limit: int | None = None
+    skip_llm_summary: bool = False
+
+    @property
+    def degraded(self) -> bool:
+        """축소 지시가 하나라도 있는지 여부."""
+        return self.level != BUDGET_LEVEL_NORMAL
+
+    def to_header(self) -> str:
+        """`X-Run-Budget` 헤더 값으로 직렬화한다."""
+        parts = [f"level={self.level}"]
+        if self.max_articles is not None:
+            parts.append(f"max_articles={self.max_articles}")
+        if self.text_limit is not None:
+            parts.append(f"text_limit={self.text_limit}")
+        if self.skip_llm_summary:
+            parts.append("skip_llm_summary=1")
+        return ";".join(parts)
+
+    @classmethod
+    def from_header(cls, value: str | None) -> BudgetDirective:
+        """`X-Run-Budget` 헤더 값을 파싱한다. 형식이 잘못된 항목은 무시한다.
+
+        Args:
+            value (str | None): 헤더 값. 예) "level=soft;text_limit=400;skip_llm_summary=1".
+
+        Returns:
+            BudgetDirective: 파싱된 지시. 값이 없으면 제한 없는 지시.
+        """
+        if not value:
+            return NO_BUDGET_LIMITS
+        fields: dict[str, str] = {}
+        for part in value.split(";"):
+            key, _, raw = part.strip().partition("=")
+            if key and raw:
+                fields[key] = raw
+        return cls(
+            level=fields.get("level", BUDGET_LEVEL_NORMAL),
+            max_articles=_parse_positive_int(fields.get("max_articles")),
+            text_limit=_parse_positive_int(fields.get("text_limit")),
+            skip_llm_summary=fields.get("skip_llm_summary") == "1",
+        )
+
+    def merge(self, other: BudgetDirective) -> BudgetDirective:
+        """두 지시 중 더 엄격한 값을 골라 합친다."""
+        if not other.degraded:
+            return self
+        if not self.degraded:
+            return other
+        levels = (BUDGET_LEVEL_NORMAL, BUDGET_LEVEL_SOFT, BUDGET_LEVEL_EXHAUSTED)
+        return BudgetDirective(
+            level=max(self.level, other.level, key=lambda level: levels.index(level) if level in levels else 0),
+            max_articles=_min_optional(self.max_articles, other.max_articles),
+            text_limit=_min_optional(self.text_limit, other.text_limit),
+            skip_llm_summary=self.skip_llm_summary or other.skip_llm_summary,
+        )
+
+
+NO_BUDGET_LIMITS = BudgetDirective()
+
+
+def _parse_positive_int(value: str | None) -> int | None:
+    """양의 정수 문자열을 파싱한다. 실패하면 None."""
+    try:
+        parsed = int(value) if value is not None else None
+    except ValueError:
+        return None
+    return parsed if parsed is not None and parsed > 0 else None
+
+
+def _min_optional(left: int | None, right: int | None) -> int | None:
+    """None을 제한 없음으로 보고 더 작은 값을 반환한다."""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    return min(left, right)
+
+
+class RunUsageLedger:
+    """한 번의 실행(요청)에서 발생한 LLM 사용량을 에이전트별로 누적하는 원장."""
+
+    def __init__(self, agent_name: str, run_id: str | None = None) -> None:
+        """RunUsageLedger 인스턴스를 초기화한다.
+
+        Args:
+            agent_name (str): 이 프로세스의 에이전트 이름. 로컬 LLM 호출이 이 이름으로 집계된다.
+            run_id (str | None): 실행 ID. 없으면 새로 생성한다.
+        """
+        self.agent_name = agent_name
+        self.run_id = run_id or uuid.uuid4().hex
+        self.started_at = time.time()
+        self._agents: dict[str, dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, prompt_tokens: int, completion_tokens: int, cost_usd: float, agent: str | None = None) -> None:
+        """LLM 호출 한 번의 사용량을 기록한다.
+
+        Args:
+            prompt_tokens (int): 입력 토큰 수.
+            completion_tokens (int): 출력 토큰 수.
+            cost_usd (float): 추정 비용(USD).
+            agent (str | None): 집계할 에이전트 이름. 없으면 원장의 에이전트.
+        """
+        self._add(agent or self.agent_name, 1, prompt_tokens, completion_tokens, cost_usd)
+
+    def merge(self, breakdown: dict[str, dict[str, Any]]) -> None:
+        """다른 에이전트가 보고한 에이전트별 사용량을 합산한다.
+
+        Args:
+            breakdown (dict[str, dict[str, Any]]): `to_breakdown()` 형식의 사용량.
+        """
+        for agent, usage in breakdown.items():
+            try:
+                self._add(
+                    str(agent),
+                    int(usage.get("calls", 0)),
+                    int(usage.get("prompt_tokens", 0)),
+                    int(usage.get("completion_tokens", 0)),
+                    float(usage.get("cost_usd", 0.0)),
+                )
+            except (AttributeError, TypeError, ValueError):
+                logger.info("Ignoring malformed usage entry agent=%s", agent)
+
+    def _add(self, agent: str, calls: int, prompt_tokens: int, completion_tokens: int, cost_usd: float) -> None:
+        with self._lock:
+            usage = self._agents.setdefault(
+                agent, {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0, "cost_usd": 0.0}
+            )
+            usage["calls"] += calls
+            usage["prompt_tokens"] += prompt_tokens
+            usage["completion_tokens"] += completion_tokens
+            usage["cost_usd"] += cost_usd
+
+    @property
+    def empty(self) -> bool:
+        """기록된 사용량이 없는지 여부."""
+        return not self._agents
+
+    @property
+    def total_tokens(self) -> int:
+        """누적 토큰 수(입력 + 출력)."""
+        with self._lock:
+            return int(sum(usage["prompt_tokens"] + usage["completion_tokens"] for usage in self._agents.values()))
+
+    @property
+    def total_cost_usd(self) -> float:
+        """누적 추정 비용(USD)."""
+        with self._lock:
+            return sum(usage["cost_usd"] for usage in self._agents.values())
+
+    def to_breakdown(self) -> dict[str, dict[str, Any]]:
+        """에이전트별 사용량을 반환한다."""
+        with self._lock:
+            return {agent: {**usage, "cost_usd": round(usage["cost_usd"], 6)} for agent, usage in self._agents.items()}
+
+    def to_dict(self) -> dict[str, Any]:
+        """실행 ID, 합계, 에이전트별 사용량을 포함한 요약을 반환한다."""
+        breakdown = self.to_breakdown()
+        return {
+            "run_id": self.run_id,
+            "agent": self.agent_name,
+            "started_at": self.started_at,
+            "duration_sec": round(time.time() - self.started_at, 3),
+            "total_tokens": sum(usage["prompt_tokens"] + usage["completion_tokens"] for usage in breakdown.values()),
+            "total_cost_usd": round(sum(usage["cost_usd"] for usage in breakdown.values()), 6),
+            "agents": breakdown,
+        }
+
+
+_CURRENT_LEDGER: ContextVar[RunUsageLedger | None] = ContextVar("run_usage_ledger", default=None)
+_INCOMING_DIRECTIVE: ContextVar[BudgetDirective] = ContextVar("run_budget_directive", default=NO_BUDGET_LIMITS)
+_RECENT_RUNS: deque[dict[str, Any]] = deque(maxlen=RECENT_RUNS_SIZE)
+
+
+@contextmanager
+def run_usage_scope(
+    agent_name: str, run_id: str | None = None, budget_header: str | None = None
+) -> Iterator[RunUsageLedger]:
+    """현재 컨텍스트에 새 실행 원장과 상위에서 전달된 예산 지시를 설정한다.
+
+    범위를 벗어나면 이전 컨텍스트 값을 복원하고, 사용량이 있으면 실행 요약을 최근 실행 목록과 로그에 남긴다.
+
+    Args:
+        agent_name (str): 이 프로세스의 에이전트 이름.
+        run_id (str | None): 상위 호출자가 전달한 실행 ID.
+        budget_header (str | None): 상위 호출자가 전달한 `X-Run-Budget` 헤더 값.
+
+    Yields:
+        RunUsageLedger: 새 원장.
+    """
+    ledger = RunUsageLedger(agent_name, run_id)
+    ledger_token = _CURRENT_LEDGER.set(ledger)
+    directive_token = _INCOMING_DIRECTIVE.set(BudgetDirective.from_header(budget_header))
+    try:
+        yield ledger
+    finally:
+        _CURRENT_LEDGER.reset(ledger_token)
+        _INCOMING_DIRECTIVE.reset(directive_token)
+        _finish_run(ledger)
+
+
+def _finish_run(ledger: RunUsageLedger) -> None:
+    """실행 요약을 최근 실행 목록에 남기고 로그로 기록한다. 사용량이 없으면 건너뛴다."""
+    if ledger.empty:
+        return
+    summary = ledger.to_dict()
+    _RECENT_RUNS.append(summary)
+    logger.info(
+        "Run usage run_id=%s tokens=%s cost_usd=%s agents=%s",
+        summary["run_id"],
+        summary["total_tokens"],
+        summary["total_cost_usd"],
+        summary["agents"],
+    )
+
+
+def recent_runs() -> list[dict[str, Any]]:
+    """최근 실행 요약을 최신순으로 반환한다."""
+    return list(reversed(_RECENT_RUNS))
+
+
+def current_ledger() -> RunUsageLedger | None:
+    """현재 컨텍스트의 실행 원장을 반환한다."""
+    return _CURRENT_LEDGER.get()
+
+
+def record_llm_usage(model: str, response: Any) -> None:
+    """LLM 응답의 토큰 사용량과 추정 비용을 현재 실행 원장과 메트릭에 기록한다.
+
+    Args:
+        model (str): 모델 이름.
+        response (Any): litellm 응답.
+    """
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return
+    prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+    completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+    cost_usd = _estimate_cost(response)
+    LLM_COST_USD_TOTAL.inc(model, amount=cost_usd)
+
+    ledger = _CURRENT_LEDGER.get()
+    if ledger is not None:
+        ledger.record(prompt_tokens, completion_tokens, cost_usd)
+
+
+def _estimate_cost(response: Any) -> float:
+    """litellm 가격표로 응답 비용을 추정한다. 가격을 모르는 모델은 0으로 본다."""
+    # litellm 임포트는 수 초가 걸리므로 서버 시작 경로에서 제외하고 첫 LLM 호출 시점에 가져온다.
+    from litellm import completion_cost
+
+    try:
+        return float(completion_cost(completion_response=response))
+    except Exception:
+        return 0.0
+
+
+def evaluate_budget(ledger: RunUsageLedger | None) -> BudgetDirective:
+    """실행 원장의 누적 사용량을 설정된 예산과 비교해 축소 지시를 계산한다.
+
+    토큰/비용 중 더 많이 소진된 쪽을 기준으로, `run_budget_soft_ratio` 이상이면 본문을 줄이고
+    LLM 요약을 생략하며, 예산을 모두 쓰면 기사 수까지 줄인다. 실행을 실패시키지는 않는다.
+
+    Args:
+        ledger (RunUsageLedger | None): 실행 원장.
+
+    Returns:
+        BudgetDirective: 축소 지시. 예산이 없거나 여유가 있으면 제한 없는 지시.
+    """
+    if ledger is None:
+        return NO_BUDGET_LIMITS
+    ratios = []
+    if settings.run_token_budget > 0:
+        ratios.append(ledger.total_tokens / settings.run_token_budget)
+    if settings.run_cost_budget_usd > 0:
+        ratios.append(ledger.total_cost_usd / settings.run_cost_budget_usd)
+    used_ratio = max(ratios, default=0.0)
+
+    if used_ratio >= 1.0:
+        return BudgetDirective(
+            level=BUDGET_LEVEL_EXHAUSTED,
+            max_articles=settings.run_budget_max_articles,
+            text_limit=settings.run_budget_text_limit,
+            skip_llm_summary=True,
+        )
+    if used_ratio >= settings.run_budget_soft_ratio:
+        return BudgetDirective(
+            level=BUDGET_LEVEL_SOFT, text_limit=settings.run_budget_text_limit, skip_llm_summary=True
+        )
+    return NO_BUDGET_LIMITS
+
+
+def current_budget_directive() -> BudgetDirective:
+    """상위에서 전달된 지시와 현재 원장 기준 지시 중 더 엄격한 값을 반환한다."""
+    return _INCOMING_DIRECTIVE.get().merge(evaluate_budget(_CURRENT_LEDGER.get()))
+
+
+def note_degradation(step: str, directive: BudgetDirective, **details: Any) -> None:
+    """예산 때문에 단계가 축소 실행되었음을 기록한다.
+
+    Args:
+        step (str): 단계 이름. 예) "truncate".
+        directive (BudgetDirective): 적용된 지시.
+        **details (Any): 로그에 남길 축소 내용.
+    """
+    RUN_BUDGET_DEGRADATIONS_TOTAL.inc(directive.level)
+    ledger = _CURRENT_LEDGER.get()
+    logger.info(
+        "Budget degradation step=%s level=%s run_id=%s details=%s",
+        step,
+        directive.level,
+        ledger.run_id if ledger is not None else None,
+        details,
+    )
+
+
+async def _inject_usage_headers(request: httpx.Request) -> None:
+    """나가는 요청에 실행 ID와 현재 예산 지시를 헤더로 추가한다."""
+    ledger = _CURRENT_LEDGER.get()
+    if ledger is None:
+        return
+    request.headers[RUN_ID_HEADER] = ledger.run_id
+    directive = current_budget_directive()
+    if directive.degraded:
+        request.headers[RUN_BUDGET_HEADER] = directive.to_header()
+
+
+async def _merge_usage_header(response: httpx.Response) -> None:
+    """서브 에이전트 응답의 사용량 헤더를 현재 실행 원장에 합산한다."""
+    ledger = _CURRENT_LEDGER.get()
+    raw = response.headers.get(LLM_USAGE_HEADER)
+    if ledger is None or not raw:
+        return
+    try:
+        breakdown = fast_json.loads(raw)
+    except ValueError:
+        logger.info("Ignoring malformed usage header url=%s", response.request.url)
+        return
+    if isinstance(breakdown, dict):
+        ledger.merge(breakdown)
+
+
+def usage_event_hooks() -> dict[str, list[Any]]:
+    """실행 ID/예산 지시를 전파하고 서브 에이전트 사용량을 합산하는 httpx 이벤트 훅을 반환한다."""
+    return {"request": [_inject_usage_headers], "response": [_merge_usage_header]}
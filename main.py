@@ -1,25 +1,43 @@
 import argparse
 import asyncio
 import inspect
+import sys
+import time
 import traceback
 import warnings
 from collections.abc import Iterable
-from typing import Any
+from pathlib import Path
+from typing import Any, TextIO
 from uuid import uuid4
 
 import httpx
-from a2a.client import A2ACardResolver, ClientCallContext, ClientConfig, ClientFactory
-from a2a.types import Message, Task, TextPart
+from a2a.client import A2ACardResolver, Client, ClientCallContext, ClientConfig, ClientFactory
+from a2a.types import DataPart, Message, Task, TaskArtifactUpdateEvent, TaskStatusUpdateEvent, TextPart
 from google.adk.agents.run_config import RunConfig
 
+from common import fast_json
+from common.deadline import deadline_event_hooks, deadline_scope
+from common.http_clients import HTTP_CLIENTS
 from common.logger import get_logger
 from common.settings import settings
+from common.telemetry import configure_tracing, get_tracer
+from common.usage import RUN_ID_HEADER
 
 logger = get_logger(__name__)
 
 warnings.filterwarnings("ignore", category=UserWarning)
 
 ORCHESTRATOR_AGENT_URL = f"http://{settings.orchestrator_agent_public_host}:{settings.orchestrator_agent_public_port}"
+# 데드라인이 지난 뒤 오케스트레이터의 504 응답을 받을 수 있도록 클라이언트 시간 초과에 더하는 여유 시간(초)
+DEADLINE_GRACE_SEC = 5.0
+DEFAULT_BATCH_CONCURRENCY = 4
+# ADK가 A2A 파트 메타데이터에 기록하는 파트 종류/생각(thought) 여부 키
+ADK_TYPE_KEY = "adk_type"
+ADK_THOUGHT_KEY = "adk_thought"
+
+# 단일 명령과 배치 명령이 공유하는 A2A 클라이언트 (에이전트 카드는 한 번만 조회한다)
+_CLIENT: Client | None = None
+_CLIENT_LOCK = asyncio.Lock()
 
 
 def _collect_text_parts(items: Iterable[Any]) -> list[str]:
@@ -42,98 +60,326 @@ def _collect_text_parts(items: Iterable[Any]) -> list[str]:
     return collected
 
 
-async def run_orchestrator_agent(message: str, max_llm_calls: int = 5) -> None:
+async def run_orchestrator_agent(
+    message: str,
+    max_llm_calls: int = 5,
+    deadline_sec: float = settings.run_deadline_sec,
+    priority: str = "interactive",
+    tenant: str | None = None,
+    run_id: str | None = None,
+    show_payloads: bool = False,
+) -> None:
+    run_id = run_id or uuid4().hex
+    # 실패한 실행은 같은 --run-id로 다시 실행하면 완료된 단계의 체크포인트부터 이어서 진행한다.
+    logger.info(f"Run ID: {run_id}")
     logger.info(f"Connecting to agent at {ORCHESTRATOR_AGENT_URL}...")
     try:
-        async with httpx.AsyncClient(timeout=httpx.Timeout(1200)) as httpx_client:
+        with (
+            get_tracer().start_as_current_span("client.run_orchestrator_agent") as span,
+            deadline_scope(deadline_sec),
+        ):
+            await _run_orchestrator_agent(
+                message, max_llm_calls, deadline_sec, priority, tenant, run_id, show_payloads
+            )
+            if span.is_recording():
+                logger.info(f"Trace ID: {span.get_span_context().trace_id:032x}")
+    except Exception as e:
+        traceback.print_exc()
+        logger.error(f"--- An error occurred: {e} ---")
+        logger.error("Ensure the agent server is running.")
+
+
+class _ProgressRenderer:
+    """스트리밍 업데이트 이벤트를 증분으로 처리하여 단계별 진행 상황을 한 줄씩 출력한다.
+
+    누적된 Task 히스토리를 다시 읽지 않고 각 상태/아티팩트 업데이트에 담긴 새 파트만 요약하므로
+    이벤트당 처리 비용과 출력량이 실행 크기와 무관하게 일정하다.
+    """
+
+    def __init__(self, show_payloads: bool) -> None:
+        """_ProgressRenderer 인스턴스를 초기화한다.
+
+        Args:
+            show_payloads (bool): 요약과 함께 업데이트 이벤트 전체 내용을 출력할지 여부.
+        """
+        self._show_payloads = show_payloads
+        self._t0 = time.perf_counter()
+        self._started: dict[str, float] = {}
+
+    def render(self, update: Any) -> None:
+        """업데이트 이벤트 하나를 출력한다. 업데이트가 없으면(첫 Task 이벤트) 아무것도 하지 않는다."""
+        if isinstance(update, TaskStatusUpdateEvent):
+            if update.status.message is not None:
+                for part in update.status.message.parts:
+                    self._render_part(part.root)
+            if update.final:
+                self._log(f"■ {update.status.state.value}")
+        elif isinstance(update, TaskArtifactUpdateEvent):
+            chars = sum(len(part.root.text) for part in update.artifact.parts if isinstance(part.root, TextPart))
+            self._log(f"📄 artifact chars={chars}")
+        if self._show_payloads and update is not None:
+            logger.info(update.model_dump_json(exclude_none=True))
+
+    def _render_part(self, part: Any) -> None:
+        """ADK 함수 호출/응답 DataPart는 단계 시작/완료로, 텍스트는 길이로 요약한다."""
+        if isinstance(part, TextPart):
+            if not (part.metadata or {}).get(ADK_THOUGHT_KEY):
+                self._log(f"💬 text chars={len(part.text)}")
+            return
+        if not isinstance(part, DataPart):
+            return
+        part_type = (part.metadata or {}).get(ADK_TYPE_KEY)
+        name = part.data.get("name", "?")
+        call_id = part.data.get("id") or name
+        if part_type == "function_call":
+            self._started[call_id] = time.perf_counter()
+            self._log(f"▶ {name}")
+        elif part_type == "function_response":
+            started = self._started.pop(call_id, None)
+            took = f" took={time.perf_counter() - started:.1f}s" if started is not None else ""
+            self._log(f"✓ {name} {_summarize_response(part.data.get('response'))}{took}")
+
+    def _log(self, text: str) -> None:
+        logger.info(f"[{time.perf_counter() - self._t0:7.1f}s] {text}")
+
+
+def _summarize_response(response: Any) -> str:
+    """함수 응답을 항목 수 또는 길이로 요약한다. 에이전트 툴의 JSON 문자열 결과는 항목 수를 센다."""
+    value = response.get("result", response) if isinstance(response, dict) else response
+    if isinstance(value, str) and value.lstrip()[:1] in ("[", "{"):
+        try:
+            value = fast_json.loads(value)
+        except ValueError:
+            return f"chars={len(value)}"
+    if isinstance(value, list):
+        return f"items={len(value)}"
+    if isinstance(value, dict):
+        return f"keys={len(value)}"
+    return f"chars={len(str(value))}"
+
+
+async def _get_client(deadline_sec: float) -> Client:
+    """공유 HTTP 클라이언트와 캐시된 에이전트 카드로 A2A 클라이언트를 한 번 만들어 재사용한다."""
+    global _CLIENT
+    async with _CLIENT_LOCK:
+        if _CLIENT is None:
+            # 남은 데드라인을 X-Deadline-Ms 헤더로 전파하고 각 요청의 시간 초과를 남은 시간 이하로 줄인다.
+            httpx_client = HTTP_CLIENTS.async_client(
+                "orchestrator",
+                timeout=httpx.Timeout(deadline_sec + DEADLINE_GRACE_SEC if deadline_sec > 0 else None),
+                event_hooks=deadline_event_hooks(),
+            )
             card_resolver = A2ACardResolver(httpx_client=httpx_client, base_url=ORCHESTRATOR_AGENT_URL)
             card = await card_resolver.get_agent_card()
             client_config = ClientConfig(httpx_client=httpx_client, streaming=True)
             factory = ClientFactory(config=client_config)
-            client = factory.create(card=card)
-
+            _CLIENT = factory.create(card=card)
             logger.info("Connected to agent successfully.")
+        return _CLIENT
 
-            request = Message(messageId=str(uuid4()), role="user", parts=[TextPart(text=message)])
 
-            context = ClientCallContext(run_config=RunConfig(max_llm_calls=max_llm_calls))
-            result = client.send_message(request, context=context)
+def _send_message(
+    client: Client, message: str, max_llm_calls: int, priority: str, tenant: str | None, run_id: str
+) -> Any:
+    """오케스트레이터에 명령을 보낸다. 실행 ID는 요청 헤더로 전달하여 공유 클라이언트에서도 실행별로 구분한다."""
+    # 오케스트레이터 스케줄러는 메타데이터의 우선순위 레인과 테넌트로 실행 승인 순서를 정한다.
+    metadata = {"priority": priority, **({"tenant": tenant} if tenant else {})}
+    request = Message(messageId=str(uuid4()), role="user", parts=[TextPart(text=message)], metadata=metadata)
+    context = ClientCallContext(
+        run_config=RunConfig(max_llm_calls=max_llm_calls),
+        state={"http_kwargs": {"headers": {RUN_ID_HEADER: run_id}}},
+    )
+    return client.send_message(request, context=context)
 
-            logger.info("=" * 80)
-            logger.info("🔄 Streaming events from orchestrator:")
-            logger.info("=" * 80)
 
-            if inspect.isasyncgen(result):
-                # 스트리밍이면 각 이벤트를 실시간으로 출력
-                last_event = None
-                event_count = 0
-                previous_history_length = 0
+def _extract_final_text(task: Task) -> str | None:
+    """Task 아티팩트(없으면 히스토리)에서 마지막 응답 텍스트를 찾는다."""
+    artifacts_attr = getattr(task, "artifacts", None)
+    if isinstance(artifacts_attr, Iterable) and not isinstance(artifacts_attr, (str, bytes)):
+        text_chunks = _collect_text_parts(artifacts_attr)
+        if text_chunks:
+            return text_chunks[-1]
 
-                async for ev in result:
-                    event_count += 1
-                    last_event = ev
+    history_attr = getattr(task, "history", None)
+    if isinstance(history_attr, Iterable) and not isinstance(history_attr, (str, bytes)):
+        for history_message in reversed(list(history_attr)):
+            text_chunks = _collect_text_parts([history_message])
+            if text_chunks:
+                return text_chunks[-1]
+    return None
 
-                    # 튜플이면 첫 번째 요소가 Task
-                    task_event = ev[0] if isinstance(ev, (tuple, list)) else ev
 
-                    # 새로 추가된 메시지만 출력
-                    if hasattr(task_event, "history"):
-                        history = list(getattr(task_event, "history", []))
-                        current_history_length = len(history)
+async def _run_orchestrator_agent(
+    message: str,
+    max_llm_calls: int,
+    deadline_sec: float,
+    priority: str,
+    tenant: str | None,
+    run_id: str,
+    show_payloads: bool,
+) -> None:
+    client = await _get_client(deadline_sec)
+    result = _send_message(client, message, max_llm_calls, priority, tenant, run_id)
 
-                        # 새로 추가된 메시지만 출력
-                        if current_history_length > previous_history_length:
-                            new_messages = history[previous_history_length:]
+    logger.info("=" * 80)
+    logger.info("🔄 Streaming events from orchestrator:")
+    logger.info("=" * 80)
 
-                            for i, msg in enumerate(new_messages):
-                                logger.info("=" * 80)
-                                logger.info(f"📦 Event #{event_count} - New Message #{i + 1}")
-                                logger.info("=" * 80)
-                                logger.info(f"{msg}")
-                                logger.info("=" * 80)
+    if inspect.isasyncgen(result):
+        # 스트리밍이면 업데이트 이벤트에 담긴 새 메시지만 보고 단계별 진행 상황을 출력한다.
+        renderer = _ProgressRenderer(show_payloads)
+        last_event = None
+        async for ev in result:
+            last_event = ev
+            renderer.render(ev[1] if isinstance(ev, (tuple, list)) else None)
+        task_or_tuple = last_event
+    else:
+        task_or_tuple = await result
 
-                            previous_history_length = current_history_length
+    # (Task, None) 같은 튜플이면 첫 요소 사용
+    task: Task = task_or_tuple[0] if isinstance(task_or_tuple, (tuple, list)) else task_or_tuple
+    if show_payloads:
+        logger.info(f"task={task}")
 
-                task_or_tuple = last_event
-            else:
-                task_or_tuple = await result
-
-            # (Task, None) 같은 튜플이면 첫 요소 사용
-            task: Task = task_or_tuple[0] if isinstance(task_or_tuple, (tuple, list)) else task_or_tuple
-            logger.info(f"task={task}")
-
-            final_text = None
-            artifacts_attr = getattr(task, "artifacts", None)
-            if isinstance(artifacts_attr, Iterable) and not isinstance(artifacts_attr, (str, bytes)):
-                text_chunks = _collect_text_parts(artifacts_attr)
-                if text_chunks:
-                    final_text = text_chunks[-1]
-
-            if final_text is None:
-                history_attr = getattr(task, "history", None)
-                if isinstance(history_attr, Iterable) and not isinstance(history_attr, (str, bytes)):
-                    for history_message in reversed(list(history_attr)):
-                        text_chunks = _collect_text_parts([history_message])
-                        if text_chunks:
-                            final_text = text_chunks[-1]
-                            break
-
-            logger.info("Agent response:")
-            logger.info(final_text or "Response text not found.")
-            logger.info(f"Total tokens: {task.metadata.get('adk_usage_metadata')}")
+    final_text = _extract_final_text(task)
+
+    logger.info("Agent response:")
+    logger.info(final_text or "Response text not found.")
+    logger.info(f"Total tokens: {(task.metadata or {}).get('adk_usage_metadata')}")
+
+
+async def run_batch(
+    commands: list[str],
+    output: TextIO,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    max_llm_calls: int = 5,
+    deadline_sec: float = settings.run_deadline_sec,
+    priority: str = "batch",
+    tenant: str | None = None,
+) -> None:
+    """여러 명령을 하나의 공유 클라이언트로 동시에 실행하고 결과를 JSON Lines로 기록한다.
+
+    각 줄은 완료 순서대로 기록되며 입력 순번(index), 실행 ID, 상태, 지연 시간(ms), 토큰 사용량, 응답 텍스트를 포함한다.
+
+    Args:
+        commands (list[str]): 자연어 명령 목록.
+        output (TextIO): 결과를 기록할 스트림.
+        concurrency (int): 동시에 실행할 최대 명령 수.
+        max_llm_calls (int): 각 에이전트 내부에서 최대 LLM 호출 수.
+        deadline_sec (float): 명령별 데드라인(초). 0이면 제한 없음.
+        priority (str): 오케스트레이터 실행 대기열의 우선순위 레인.
+        tenant (str | None): 공정 분배에 사용할 테넌트 식별자.
+    """
+    client = await _get_client(deadline_sec)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    logger.info(f"Running batch commands={len(commands)} concurrency={concurrency}")
+
+    async def run_one(index: int, command: str) -> None:
+        async with semaphore:
+            record = await _run_batch_command(client, index, command, max_llm_calls, deadline_sec, priority, tenant)
+        output.write(fast_json.dumps_str(record, default=str) + "\n")
+        output.flush()
 
+    t0 = time.perf_counter()
+    await asyncio.gather(*(run_one(index, command) for index, command in enumerate(commands)))
+    logger.info(f"Batch finished commands={len(commands)} elapsed_sec={time.perf_counter() - t0:.1f}")
+
+
+async def _run_batch_command(
+    client: Client,
+    index: int,
+    command: str,
+    max_llm_calls: int,
+    deadline_sec: float,
+    priority: str,
+    tenant: str | None,
+) -> dict[str, Any]:
+    """배치 명령 하나를 실행하고 결과 레코드를 만든다. 실패는 레코드의 error 필드로 기록한다."""
+    run_id = uuid4().hex
+    record: dict[str, Any] = {"index": index, "command": command, "run_id": run_id}
+    t0 = time.perf_counter()
+    try:
+        with deadline_scope(deadline_sec):
+            last_event = None
+            result = _send_message(client, command, max_llm_calls, priority, tenant, run_id)
+            if inspect.isasyncgen(result):
+                async for ev in result:
+                    last_event = ev
+            else:
+                last_event = await result
+        task: Task = last_event[0] if isinstance(last_event, (tuple, list)) else last_event
+        record["status"] = task.status.state.value
+        record["usage"] = (task.metadata or {}).get("adk_usage_metadata")
+        record["response"] = _extract_final_text(task)
     except Exception as e:
-        traceback.print_exc()
-        logger.error(f"--- An error occurred: {e} ---")
-        logger.error("Ensure the agent server is running.")
+        record["status"] = "error"
+        record["error"] = str(e) or type(e).__name__
+    record["latency_ms"] = int((time.perf_counter() - t0) * 1000)
+    return record
+
+
+def _read_commands(path: str) -> list[str]:
+    """파일(`-`이면 표준 입력)에서 한 줄에 하나씩 명령을 읽는다. 빈 줄과 `#` 주석 줄은 건너뛴다."""
+    if path == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        lines = Path(path).read_text(encoding="utf-8").splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.lstrip().startswith("#")]
+
+
+async def _run_cli(args: argparse.Namespace) -> None:
+    """CLI 실행(단일 명령 또는 배치) 후 공유 HTTP 클라이언트를 닫는다."""
+    try:
+        if args.batch_file:
+            output = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+            try:
+                await run_batch(
+                    _read_commands(args.batch_file),
+                    output,
+                    concurrency=args.concurrency,
+                    max_llm_calls=args.max_llm_calls,
+                    deadline_sec=args.deadline_sec,
+                    priority=args.priority or "batch",
+                    tenant=args.tenant,
+                )
+            finally:
+                if output is not sys.stdout:
+                    output.close()
+        else:
+            await run_orchestrator_agent(
+                message=args.command,
+                max_llm_calls=args.max_llm_calls,
+                deadline_sec=args.deadline_sec,
+                priority=args.priority or "interactive",
+                tenant=args.tenant,
+                run_id=args.run_id,
+                show_payloads=args.show_payloads,
+            )
+    finally:
+        await HTTP_CLIENTS.aclose()
 
 
 if __name__ == "__main__":
     p = argparse.ArgumentParser(description="Agent Client (Google ADK Tool-Calling)")
-    p.add_argument(
+    mode = p.add_mutually_exclusive_group(required=True)
+    mode.add_argument(
         "--command",
         help="자연어 명령. 예) '지난 24시간 동안 '테슬라 OR 엔비디아' 관련 뉴스 파이프라인을 실행해줘'",
-        required=True,
+    )
+    mode.add_argument(
+        "--batch-file",
+        help="배치 모드. 한 줄에 명령 하나씩 담은 파일 경로(`-`이면 표준 입력). 빈 줄과 `#` 주석 줄은 건너뛴다.",
+    )
+    p.add_argument(
+        "--concurrency",
+        help=f"배치 모드에서 동시에 실행할 최대 명령 수. 기본값: {DEFAULT_BATCH_CONCURRENCY}",
+        type=int,
+        default=DEFAULT_BATCH_CONCURRENCY,
+    )
+    p.add_argument(
+        "--output",
+        help="배치 결과(JSON Lines)를 기록할 파일 경로. 기본값: - (표준 출력)",
+        default="-",
     )
     p.add_argument(
         "--max-llm-calls",
@@ -141,6 +387,34 @@ if __name__ == "__main__":
         type=int,
         default=5,
     )
+    p.add_argument(
+        "--deadline-sec",
+        help=f"파이프라인 전체 데드라인(초). 서브 에이전트 호출과 툴의 외부 요청까지 전파된다. 0이면 제한 없음. 기본값: {settings.run_deadline_sec:g}",
+        type=float,
+        default=settings.run_deadline_sec,
+    )
+    p.add_argument(
+        "--priority",
+        help="오케스트레이터 실행 대기열의 우선순위 레인. 기본값: interactive (배치 모드는 batch)",
+        choices=["interactive", "batch"],
+        default=None,
+    )
+    p.add_argument(
+        "--tenant",
+        help="공정 분배에 사용할 테넌트 식별자. 없으면 오케스트레이터가 클라이언트 주소로 구분한다.",
+        default=None,
+    )
+    p.add_argument(
+        "--run-id",
+        help="실행 ID. 실패한 실행의 ID를 지정하면 완료된 단계는 체크포인트로 대신하고 이어서 실행한다. 없으면 새로 생성한다.",
+        default=None,
+    )
+    p.add_argument(
+        "--show-payloads",
+        help="스트리밍 중 각 업데이트 이벤트의 전체 내용과 최종 Task를 출력한다. 기본값: 단계별 진행 요약만 출력",
+        action="store_true",
+    )
     args = p.parse_args()
 
-    asyncio.run(run_orchestrator_agent(message=args.command, max_llm_calls=args.max_llm_calls))
+    configure_tracing("News Insight Client")
+    asyncio.run(_run_cli(args))
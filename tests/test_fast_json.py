@@ -0,0 +1,14 @@
+"""고속 JSON 직렬화 테스트."""
+
+from __future__ import annotations
+
+from common import fast_json
+
+
+def test_sort_keys_sorts_nested_dicts() -> None:
+    """sort_keys는 중첩된 dict의 키도 정렬하여 키 순서와 무관한 바이트를 만든다."""
+    first = {"b": [{"d": 1, "c": {"y": 2, "x": 1}}], "a": "한글"}
+    second = {"a": "한글", "b": [{"c": {"x": 1, "y": 2}, "d": 1}]}
+
+    assert fast_json.dumps(first, sort_keys=True) == fast_json.dumps(second, sort_keys=True)
+    assert fast_json.loads(fast_json.dumps(first, sort_keys=True)) == first
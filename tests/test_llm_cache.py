@@ -0,0 +1,61 @@
+"""LLM 응답 캐시 single-flight 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from litellm import ModelResponse
+
+from common.deadline import DeadlineExceeded, deadline_scope, remaining
+from common.llm_cache import LlmResponseCache
+
+
+def test_coalesced_follower_is_not_bound_by_leader_deadline() -> None:
+    """첫 호출자의 데드라인이 지나도 데드라인이 없는 후속 호출자는 공유 호출 결과를 받는다."""
+    cache = LlmResponseCache(max_entries=8, ttl_sec=60)
+    calls: list[float | None] = []
+
+    async def call() -> ModelResponse:
+        calls.append(remaining())
+        await asyncio.sleep(0.3)
+        return ModelResponse(id="shared")
+
+    async def leader() -> ModelResponse:
+        with deadline_scope(0.1):
+            return await cache.get_or_call("key", call)
+
+    async def main() -> tuple[BaseException | ModelResponse, ModelResponse]:
+        leader_task = asyncio.create_task(leader())
+        await asyncio.sleep(0.01)
+        follower = await cache.get_or_call("key", call)
+        leader_result = await asyncio.gather(leader_task, return_exceptions=True)
+        return leader_result[0], follower
+
+    leader_result, follower = asyncio.run(main())
+
+    assert isinstance(leader_result, DeadlineExceeded)
+    assert follower.id == "shared"
+    assert calls == [None]
+    assert cache.stats()["coalesced"] == 1
+
+
+def test_coalesced_callers_share_provider_error() -> None:
+    """공유 호출의 오류는 모든 호출자에게 그대로 전달되고 진행 목록에서 제거된다."""
+    cache = LlmResponseCache(max_entries=8, ttl_sec=60)
+
+    async def call() -> ModelResponse:
+        await asyncio.sleep(0.05)
+        raise ValueError("provider error")
+
+    async def main() -> list[BaseException | ModelResponse]:
+        return await asyncio.gather(
+            cache.get_or_call("key", call), cache.get_or_call("key", call), return_exceptions=True
+        )
+
+    results = asyncio.run(main())
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert cache.stats()["in_flight"] == 0
+    with pytest.raises(ValueError):
+        asyncio.run(cache.get_or_call("key", call))
@@ -0,0 +1,41 @@
+"""한도가 있는 A2A 태스크 저장소 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from a2a.server.tasks import TaskStore
+from a2a.types import Task, TaskState, TaskStatus
+
+from agents.helpers.task_store import BoundedInMemoryTaskStore, SqliteTaskStore
+
+
+def _task(task_id: str, state: TaskState) -> Task:
+    return Task(id=task_id, context_id="context", status=TaskStatus(state=state))
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request: pytest.FixtureRequest, tmp_path: Path) -> TaskStore:
+    if request.param == "memory":
+        return BoundedInMemoryTaskStore(max_tasks=2, max_bytes=1_000_000, max_age_sec=3600)
+    return SqliteTaskStore(str(tmp_path / "tasks.sqlite3"), max_tasks=2, max_bytes=1_000_000, max_age_sec=3600)
+
+
+def test_count_limit_evicts_only_terminal_tasks(store: TaskStore) -> None:
+    """개수 한도를 넘으면 오래된 종료 태스크만 제거하고 진행 중인 태스크는 남긴다."""
+
+    async def main() -> list[Task | None]:
+        await store.save(_task("working", TaskState.working))
+        await store.save(_task("done-old", TaskState.completed))
+        await store.save(_task("done-new", TaskState.completed))
+        await store.save(_task("working-new", TaskState.working))
+        return [await store.get(task_id) for task_id in ("working", "done-old", "done-new", "working-new")]
+
+    working, done_old, done_new, working_new = asyncio.run(main())
+
+    assert working is not None
+    assert working_new is not None
+    assert done_old is None
+    assert done_new is None
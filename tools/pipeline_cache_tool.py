@@ -0,0 +1,101 @@
+"""파이프라인 결과 캐시 툴 모듈.
+
+오케스트레이터는 파라미터를 추출한 직후 캐시를 조회한다. 신선하거나 오래된 결과가 있으면 모델을 다시 호출하지 않고
+캐시된 최종 인사이트로 바로 응답하며, 없으면 파이프라인을 실행한 뒤 insight_agent 결과를 캐시에 저장한다.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmRequest, LlmResponse
+from google.adk.tools.base_tool import BaseTool
+from google.adk.tools.function_tool import FunctionTool
+from google.adk.tools.tool_context import ToolContext
+from google.genai import types
+
+from common.logger import get_logger
+from common.result_cache import PIPELINE_CACHE, STATUS_MISS, PipelineParams, is_cache_store_disabled
+
+logger = get_logger(__name__)
+
+# 조회한 파이프라인 파라미터를 같은 실행의 insight_agent 결과 저장까지 보관하는 세션 상태 키
+PIPELINE_CACHE_STATE_KEY = "pipeline_cache"
+INSIGHT_TOOL_NAME = "insight_agent"
+
+
+def lookup_pipeline_cache(
+    query: str,
+    tool_context: ToolContext,
+    lookback_hours: int = 24,
+    page_size: int = 20,
+    text_limit: int = 1000,
+) -> dict[str, Any]:
+    """파이프라인 파라미터로 결과 캐시를 조회한다.
+
+    Args:
+        query (str): 검색 키워드.
+        tool_context (ToolContext): ADK 툴 컨텍스트.
+        lookback_hours (int): 조회 기간(시간).
+        page_size (int): 기사 수.
+        text_limit (int): 기사 본문 길이 제한(글자 수).
+
+    Returns:
+        dict[str, Any]: 조회 상태(status: "fresh", "stale", "miss")와 캐시된 최종 인사이트(insights).
+    """
+    params = PipelineParams(query, int(lookback_hours), int(page_size), int(text_limit))
+    result = PIPELINE_CACHE.lookup(params)
+    logger.info("Pipeline cache lookup query=%s status=%s age_sec=%s", query, result.status, result.age_sec)
+    tool_context.state[PIPELINE_CACHE_STATE_KEY] = {
+        "invocation_id": tool_context.invocation_id,
+        "params": [params.query, params.lookback_hours, params.page_size, params.text_limit],
+    }
+    if result.status == STATUS_MISS:
+        return {"status": STATUS_MISS}
+    return {"status": result.status, "age_sec": result.age_sec, "insights": result.value}
+
+
+def create_pipeline_cache_tool() -> FunctionTool:
+    """ADK에서 사용 가능한 파이프라인 결과 캐시 조회 툴을 생성한다.
+
+    Returns:
+        FunctionTool: 결과 캐시 조회 툴 인스턴스.
+    """
+    return FunctionTool(func=lookup_pipeline_cache)
+
+
+def answer_from_pipeline_cache(callback_context: CallbackContext, llm_request: LlmRequest) -> LlmResponse | None:
+    """직전 툴 응답이 캐시 적중이면 모델 호출 없이 캐시된 인사이트를 최종 응답으로 반환한다. (before_model_callback)"""
+    if not llm_request.contents:
+        return None
+    for part in llm_request.contents[-1].parts or []:
+        response = part.function_response
+        if response is None or response.name != lookup_pipeline_cache.__name__:
+            continue
+        payload = response.response or {}
+        if payload.get("status") == STATUS_MISS or not payload.get("insights"):
+            return None
+        return LlmResponse(content=types.Content(role="model", parts=[types.Part(text=str(payload["insights"]))]))
+    return None
+
+
+def store_pipeline_result(
+    tool: BaseTool, args: dict[str, Any], tool_context: ToolContext, tool_response: Any
+) -> dict[str, Any] | None:
+    """같은 실행에서 조회한 파라미터로 insight_agent 결과를 캐시에 저장한다. (after_tool_callback)
+
+    `Cache-Control: no-store` 요청(증분 실행 등)의 결과는 전체 기간 결과가 아니므로 저장하지 않는다.
+    """
+    if tool.name != INSIGHT_TOOL_NAME:
+        return None
+    if is_cache_store_disabled():
+        logger.info("Pipeline result not cached (no-store request) invocation_id=%s", tool_context.invocation_id)
+        return None
+    lookup = tool_context.state.get(PIPELINE_CACHE_STATE_KEY)
+    if not lookup or lookup.get("invocation_id") != tool_context.invocation_id:
+        return None
+    value = tool_response.get("result") if isinstance(tool_response, dict) else tool_response
+    if isinstance(value, str) and value.strip():
+        PIPELINE_CACHE.store(PipelineParams(*lookup["params"]), value)
+    return None
@@ -0,0 +1,244 @@
+"""토큰 예산 기반 추출형 본문 축약 툴 모듈."""
+
+from __future__ import annotations
+
+import math
+import re
+from typing import Any
+
+from google.adk.tools.function_tool import FunctionTool
+
+from common.logger import get_logger
+from common.settings import settings
+from common.usage import current_budget_directive, note_degradation
+
+logger = get_logger(__name__)
+
+# 라틴 문자 등은 대략 4글자를 1토큰으로, 한글/한자/가나는 글자마다 약 1토큰으로 추정한다.
+CHARS_PER_TOKEN = 4
+DEFAULT_TEXT_LIMIT = 1000
+LEAD_SENTENCE_COUNT = 2
+MIN_QUERY_TERM_LENGTH = 2
+
+_SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?。])\s+|\n+")
+_NUMBER_PATTERN = re.compile(r"\d")
+# 한글 자모/음절, 한자, 히라가나/가타카나 (BPE 토크나이저에서 글자당 약 1토큰)
+_WIDE_CHAR_PATTERN = re.compile(
+    r"[\u1100-\u11ff\u3040-\u30ff\u3130-\u318f\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff]"
+)
+_QUERY_TERM_PATTERN = re.compile(r"[\w$%.-]+")
+_QUERY_OPERATORS = frozenset({"and", "or", "not"})
+
+
+def truncate_documents(
+    documents: list[dict[str, Any]],
+    text_limit: int = DEFAULT_TEXT_LIMIT,
+    query: str = "",
+    token_budget: int = 0,
+) -> list[dict[str, Any]]:
+    """문서 리스트의 본문을 토큰 예산 안에서 핵심 문장 위주로 축약한다.
+
+    문자 종류별로 추정한 토큰 수가 `token_budget`을, 글자 수가 `text_limit`를 넘지 않도록 리드 문장과
+    검색어 또는 숫자를 포함한 문장을 우선 선택하고 원문 순서대로 이어 붙인다. 문장 중간에서 잘리지 않는다.
+    실행 LLM 예산이 부족하면 예산 지시에 따라 문서 수와 `text_limit`를 더 줄인다.
+
+    Args:
+        documents (list[dict[str, Any]]): 축약 대상 문서 리스트.
+        text_limit (int): 문서당 본문 길이 제한(글자 수 기준).
+        query (str): 검색어 문자열. 검색어가 포함된 문장을 우선 보존한다.
+        token_budget (int): 문서당 추정 토큰 예산. 0 이하이면 `truncate_token_budget` 설정을 사용한다.
+
+    Returns:
+        list[dict[str, Any]]: `readable_text`가 축약된 문서 리스트.
+    """
+    token_budget = token_budget if token_budget > 0 else max(1, settings.truncate_token_budget)
+    logger.info(
+        "Starting truncate process for size=%s text_limit=%s token_budget=%s", len(documents), text_limit, token_budget
+    )
+    if not documents:
+        logger.info("No documents provided for truncate")
+        return []
+
+    documents, text_limit = _apply_budget_directive(documents, text_limit)
+    text_limit = max(1, text_limit)
+    query_terms = _extract_query_terms(query)
+
+    truncated_documents: list[dict[str, Any]] = []
+    tokens_before = 0
+    tokens_after = 0
+    for document in documents:
+        readable_text = document.get("readable_text")
+        if not readable_text:
+            truncated_documents.append(document)
+            continue
+
+        condensed_text = _condense_text(readable_text, token_budget, text_limit, query_terms)
+        tokens_before += _estimate_tokens(readable_text)
+        tokens_after += _estimate_tokens(condensed_text)
+        truncated_documents.append({**document, "readable_text": condensed_text})
+
+    logger.info("Finished truncate process estimated_tokens=%s->%s", tokens_before, tokens_after)
+    return truncated_documents
+
+
+def create_truncate_tool() -> FunctionTool:
+    """ADK에서 사용 가능한 Truncate 툴을 생성한다.
+
+    Returns:
+        FunctionTool: 본문 축약 툴 인스턴스.
+    """
+    return FunctionTool(func=truncate_documents)
+
+
+def _apply_budget_directive(documents: list[dict[str, Any]], text_limit: int) -> tuple[list[dict[str, Any]], int]:
+    """실행 예산 지시에 따라 문서 수와 본문 길이 상한을 줄인다."""
+    directive = current_budget_directive()
+    if not directive.degraded:
+        return documents, text_limit
+
+    limited_documents = documents[: directive.max_articles] if directive.max_articles else documents
+    limited_text_limit = min(text_limit, directive.text_limit) if directive.text_limit else text_limit
+    if len(limited_documents) < len(documents) or limited_text_limit < text_limit:
+        note_degradation(
+            "truncate",
+            directive,
+            documents=f"{len(documents)}->{len(limited_documents)}",
+            text_limit=f"{text_limit}->{limited_text_limit}",
+        )
+    return limited_documents, limited_text_limit
+
+
+def _estimate_tokens(text: str) -> int:
+    """문자 종류를 고려해 텍스트의 토큰 수를 추정한다.
+
+    한글/한자/가나는 글자마다 1토큰, 나머지 문자는 `CHARS_PER_TOKEN`글자마다 1토큰으로 계산한다.
+
+    Args:
+        text (str): 추정 대상 텍스트.
+
+    Returns:
+        int: 추정 토큰 수.
+    """
+    if not text:
+        return 0
+    wide_chars = len(_WIDE_CHAR_PATTERN.findall(text))
+    return wide_chars + math.ceil((len(text) - wide_chars) / CHARS_PER_TOKEN)
+
+
+def _cut_to_budget(text: str, token_budget: int, text_limit: int) -> str:
+    """토큰 예산과 글자 수 상한 안에 들어가는 가장 긴 앞부분을 단어 경계에서 자른다.
+
+    Args:
+        text (str): 자를 텍스트.
+        token_budget (int): 토큰 예산.
+        text_limit (int): 글자 수 상한.
+
+    Returns:
+        str: 잘린 텍스트.
+    """
+    # 넓은 문자는 CHARS_PER_TOKEN, 나머지는 1로 세어 정수 비용으로 예산을 비교한다.
+    max_cost = token_budget * CHARS_PER_TOKEN
+    cost = 0
+    end = 0
+    for char in text[:text_limit]:
+        cost += CHARS_PER_TOKEN if _WIDE_CHAR_PATTERN.match(char) else 1
+        if cost > max_cost:
+            break
+        end += 1
+    if end >= len(text):
+        return text
+    head = text[:end]
+    return head.rsplit(" ", 1)[0] if " " in head else head
+
+
+def _extract_query_terms(query: str) -> frozenset[str]:
+    """검색어 문자열에서 비교용 검색어 집합을 추출한다.
+
+    Args:
+        query (str): 검색어 문자열. 예) "tesla OR nvda".
+
+    Returns:
+        frozenset[str]: 소문자로 정규화된 검색어 집합.
+    """
+    if not query:
+        return frozenset()
+    terms = (term.lower().strip(".-") for term in _QUERY_TERM_PATTERN.findall(query))
+    return frozenset(term for term in terms if len(term) >= MIN_QUERY_TERM_LENGTH and term not in _QUERY_OPERATORS)
+
+
+def _split_sentences(text: str) -> list[str]:
+    """본문을 문장 단위로 분리한다.
+
+    Args:
+        text (str): 분리 대상 본문.
+
+    Returns:
+        list[str]: 공백이 정리된 문장 리스트.
+    """
+    sentences = (" ".join(sentence.split()) for sentence in _SENTENCE_SPLIT_PATTERN.split(text))
+    return [sentence for sentence in sentences if sentence]
+
+
+def _is_salient(sentence: str, query_terms: frozenset[str]) -> bool:
+    """검색어 또는 숫자를 포함한 핵심 문장인지 판단한다.
+
+    Args:
+        sentence (str): 검사 대상 문장.
+        query_terms (frozenset[str]): 정규화된 검색어 집합.
+
+    Returns:
+        bool: 핵심 문장이면 True.
+    """
+    if _NUMBER_PATTERN.search(sentence):
+        return True
+    if not query_terms:
+        return False
+    lowered = sentence.lower()
+    return any(term in lowered for term in query_terms)
+
+
+def _condense_text(text: str, token_budget: int, text_limit: int, query_terms: frozenset[str]) -> str:
+    """토큰 예산과 글자 수 상한 안에서 리드 문장과 핵심 문장을 골라 본문을 축약한다.
+
+    Args:
+        text (str): 원본 본문.
+        token_budget (int): 문서당 토큰 예산.
+        text_limit (int): 문서당 글자 수 상한.
+        query_terms (frozenset[str]): 정규화된 검색어 집합.
+
+    Returns:
+        str: 축약된 본문.
+    """
+    if len(text) <= text_limit and _estimate_tokens(text) <= token_budget:
+        return text
+
+    sentences = _split_sentences(text)
+    if not sentences:
+        return _cut_to_budget(text, token_budget, text_limit)
+
+    # 우선순위: 리드 문장 → 핵심 문장 → 나머지 문장 (각 그룹 내에서는 원문 순서)
+    lead = range(min(LEAD_SENTENCE_COUNT, len(sentences)))
+    body = range(len(lead), len(sentences))
+    salient = [i for i in body if _is_salient(sentences[i], query_terms)]
+    salient_set = set(salient)
+    rest = [i for i in body if i not in salient_set]
+
+    selected: set[int] = set()
+    used_tokens = 0
+    used_chars = 0
+    for index in (*lead, *salient, *rest):
+        # 문장 구분자는 보수적으로 1토큰(1글자)으로 계산한다.
+        separator = 1 if selected else 0
+        sentence_tokens = _estimate_tokens(sentences[index]) + separator
+        sentence_chars = len(sentences[index]) + separator
+        if used_tokens + sentence_tokens > token_budget or used_chars + sentence_chars > text_limit:
+            continue
+        selected.add(index)
+        used_tokens += sentence_tokens
+        used_chars += sentence_chars
+
+    if not selected:
+        # 첫 문장조차 예산을 넘으면 단어 경계에서 자른다.
+        return _cut_to_budget(sentences[0], token_budget, text_limit)
+
+    return " ".join(sentences[index] for index in sorted(selected))